@@ -0,0 +1,270 @@
+"""
+Memory Cache - process-wide, stat()-validated cache in front of a MemoryStore.
+
+हर tool call पर storage को दोबारा पढ़ने/parse करने के बजाय data RAM में रखा जाता है।
+हर read से पहले store का signature (mmap'd generation counter) देखा जाता है - अगर किसी और
+process ने लिखा है तो cache खाली करके दोबारा लोड होता है। इसी process के writes
+cross-process write lock के अंदर cache को in-place update करते हैं, इसलिए उनके बाद reload
+की ज़रूरत नहीं पड़ती और बीच में हुआ किसी और process का write छूटता नहीं।
+"""
+import threading
+
+from memory.facts import FactTable
+from memory.matching import FactIndex
+from memory.relevance import RelevanceRanker
+from memory.search_index import ConversationSearchIndex
+from memory.records import normalize_turn
+from memory.storage import MemoryStore
+from memory.time_index import TimeIndex
+
+
+class CachedMemoryStore(MemoryStore):
+    """किसी भी MemoryStore को wrap करता है; reads cache से, writes store + cache दोनों में"""
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._signature = None
+        self._facts = None    # FactTable (LRU + TTL) - पहली ज़रूरत पर लोड
+        self._fact_index = None  # facts की keys पर Aho-Corasick index
+        self._turns = None    # पूरी history (list) - केवल load_memory_sync जैसे callers के लिए
+        self._recent = None   # आखिरी turns की छोटी window
+        self._recent_limit = 0
+        # Turn indexes (search, relevance) बाहरी writes पर फेंके नहीं जाते,
+        # केवल नए turns से catch-up करते हैं: name -> [index, signature]
+        self._turn_indexes = {}
+        self._listeners = []  # materialized views: listener(turns, old_signature, new_signature)
+
+    # --- Revalidation ---
+    def _revalidate(self):
+        """सस्ता stat(): बाहर से बदलाव हुआ हो तो cached data हटा देता है"""
+        signature = self.store.signature()
+        if signature != self._signature:
+            self._signature = signature
+            self._facts = None
+            self._fact_index = None
+            self._turns = None
+            self._recent = None
+            self._recent_limit = 0
+
+    def _after_local_write(self, turns: list = ()):
+        """इस process के write के बाद नया signature रखता है, ताकि अगला read hit हो"""
+        previous, self._signature = self._signature, self.store.signature()
+        for listener in self._listeners:
+            listener(turns, previous, self._signature)
+
+    def add_listener(self, listener):
+        """
+        हर local write के बाद (lock के अंदर) listener(नए turns, पुराना signature, नया signature)
+        बुलाया जाता है - इससे persisted views बिना storage पढ़े update होते हैं
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def _count(self, hit: bool):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def invalidate(self):
+        with self._lock:
+            self._signature = None
+            self._revalidate()
+
+    # --- Facts ---
+    def _cached_facts(self) -> FactTable:
+        self._revalidate()
+        self._count(self._facts is not None)
+        if self._facts is None:
+            self._facts = self.store.fact_table()
+        return self._facts
+
+    def load_facts(self) -> dict:
+        with self._lock:
+            return self._cached_facts().items()
+
+    def list_facts(self, limit: int) -> list:
+        with self._lock:
+            return self._cached_facts().most_recent(limit)
+
+    def fact_table(self) -> FactTable:
+        with self._lock:
+            return FactTable.from_json(self._cached_facts().to_json())
+
+    def set_fact(self, key: str, value: str, ttl: int = None):
+        with self._lock, self.store.write_lock():
+            self._revalidate()
+            self.store.set_fact(key, value, ttl)
+            if self._facts is not None:
+                evicted = self._facts.set(key, value, ttl)
+                if self._fact_index is not None:
+                    self._fact_index.add(key)
+                    for old_key in evicted:
+                        self._fact_index.remove(old_key)
+            self._after_local_write()
+
+    def touch_facts(self, keys: list):
+        with self._lock, self.store.write_lock():
+            self._revalidate()
+            self.store.touch_facts(keys)
+            if self._facts is not None:
+                self._facts.touch(keys)
+            self._after_local_write()
+
+    def delete_fact(self, key: str) -> bool:
+        with self._lock, self.store.write_lock():
+            self._revalidate()
+            deleted = self.store.delete_fact(key)
+            if self._facts is not None:
+                self._facts.delete(key)
+            if self._fact_index is not None:
+                self._fact_index.remove(key)
+            self._after_local_write()
+            return deleted
+
+    def replace_facts(self, facts: dict):
+        with self._lock, self.store.write_lock():
+            self._revalidate()
+            self.store.replace_facts(facts)
+            self._facts = None
+            self._fact_index = None
+            self._after_local_write()
+
+    def match_facts(self, query: str) -> list:
+        with self._lock:
+            facts = self._cached_facts()
+            if self._fact_index is None:
+                self._fact_index = FactIndex(facts.items())
+            matches = []
+            for key in self._fact_index.match(query):
+                if key in facts:
+                    matches.append(key)
+                else:
+                    # TTL पूरा हो चुका - index से भी हटाएँ
+                    self._fact_index.remove(key)
+            return matches
+
+    # --- Conversation turns ---
+    def append_turns(self, turns: list):
+        turns = [normalize_turn(t) for t in turns]
+        with self._lock, self.store.write_lock():
+            self._revalidate()
+            self.store.append_turns(turns)
+            if self._turns is not None:
+                self._turns.extend(turns)
+            if self._recent is not None:
+                self._recent.extend(turns)
+                del self._recent[:-self._recent_limit]
+            in_sync = [entry for entry in self._turn_indexes.values() if entry[1] == self._signature]
+            self._after_local_write(turns)
+            for entry in in_sync:
+                entry[0].add_many(turns)
+                entry[1] = self._signature
+
+    def append_turn(self, turn: dict):
+        self.append_turns([turn])
+
+    def iter_turns(self):
+        with self._lock:
+            self._revalidate()
+            self._count(self._turns is not None)
+            if self._turns is None:
+                self._turns = list(self.store.iter_turns())
+            return iter(list(self._turns))
+
+    def recent_turns(self, limit: int) -> list:
+        if limit <= 0:
+            return []
+        with self._lock:
+            self._revalidate()
+            if self._turns is not None:
+                self._count(True)
+                return self._turns[-limit:]
+            if self._recent is not None and self._recent_limit >= limit:
+                self._count(True)
+                return self._recent[-limit:]
+            self._count(False)
+            self._recent = self.store.recent_turns(limit)
+            self._recent_limit = limit
+            return list(self._recent)
+
+    def turns_before(self, before, limit: int) -> tuple:
+        # Pages सीधे storage से lazily पढ़े जाते हैं - पूरी history cache में नहीं आती
+        return self.store.turns_before(before, limit)
+
+    def turns_from(self, offset: int):
+        # Catch-up/summary जैसे incremental readers पूरी history cache में लोड न करें
+        return self.store.turns_from(offset)
+
+    def _turn_index(self, name: str, factory):
+        """
+        Turns पर बना कोई index (lock के अंदर बुलाएँ)। पहली बार पूरी history से बनता है;
+        किसी और process ने लिखा हो तो केवल नए turns से catch-up करता है।
+        """
+        self._revalidate()
+        entry = self._turn_indexes.get(name)
+        if entry is None:
+            self._count(False)
+            entry = self._turn_indexes[name] = [factory(self.store.iter_turns()), None]
+        elif entry[1] != self._signature:
+            self._count(False)
+            indexed, total = len(entry[0]), self.store.count_turns()
+            if total >= indexed:
+                entry[0].add_many(self.store.turns_from(indexed))
+            else:
+                entry[0] = factory(self.store.iter_turns())
+        else:
+            self._count(True)
+        entry[1] = self._signature
+        return entry[0]
+
+    def search_turns(self, query: str, limit: int) -> list:
+        if self.store.INDEXED_SEARCH:
+            # Backend का persistent FTS index - हर नए process में पूरी history से BM25 index नहीं बनता
+            return self.store.search_turns(query, limit)
+        with self._lock:
+            return self._turn_index("search", ConversationSearchIndex).search(query, limit)
+
+    def warm_indexes(self):
+        """
+        Worker prewarm: जो turn indexes backend के पास नहीं (जैसे jsonl पर BM25 search) उन्हें
+        job से पहले बना देता है, ताकि पहली search पूरी history index करने का इंतज़ार न करे
+        """
+        if not self.store.INDEXED_SEARCH:
+            with self._lock:
+                self._turn_index("search", ConversationSearchIndex)
+
+    def rank_turns(self, query: str, limit: int) -> list:
+        with self._lock:
+            return self._turn_index("relevance", RelevanceRanker).rank(query, limit)
+
+    def turns_between(self, start: int, end: int, limit: int = 0) -> list:
+        if self.store.INDEXED_RANGE:
+            # Backend की indexed range query - पूरी history से RAM में TimeIndex बनाने से कहीं सस्ती
+            return self.store.turns_between(start, end, limit)
+        with self._lock:
+            return self._turn_index("time", TimeIndex).between(start, end, limit)
+
+    def count_turns(self) -> int:
+        with self._lock:
+            self._revalidate()
+            if self._turns is not None:
+                return len(self._turns)
+        return self.store.count_turns()
+
+    def signature(self) -> tuple:
+        return self.store.signature()
+
+    def close(self):
+        self.store.close()
@@ -0,0 +1,90 @@
+"""
+Recent Context View - सबसे नए turns की formatted (हिंदी) lines का materialized view.
+
+Session शुरू होते ही पहले reply के लिए "हाल की बातचीत" चाहिए। उसे हर बार storage से लोड करके
+format करने के बजाय, lines हर append पर incrementally update होकर store के साथ
+recent_context.json में रखी जाती हैं - पहला reply केवल एक छोटी फाइल पढ़ता है।
+
+View के साथ store का signature (generation counter) भी save होता है। किसी और process के
+write से signature मेल न खाए, तो view अगली read पर storage से दोबारा बनता है।
+"""
+import json
+import os
+import threading
+from collections import deque
+
+from memory.records import Turn, speaker_name
+
+RECENT_CONTEXT_FILE = "recent_context.json"
+RECENT_CONTEXT_TURNS = 3
+VIEW_VERSION = 2  # 2: अनजान speakers का मूल नाम
+
+
+def format_turn_line(entry: Turn, with_date: bool = False) -> str:
+    """एक turn को हिंदी line में बदलता है: "- आप: ..." / "- [2025-11-25] जार्विस: ..." """
+    date = f"[{entry.ts[:10]}] " if with_date else ""
+    return f"- {date}{speaker_name(entry.speaker)}: {entry.text}"
+
+
+class RecentContextView:
+    """आखिरी size turns की formatted lines; CachedMemoryStore का write listener"""
+
+    def __init__(self, path: str, size: int = RECENT_CONTEXT_TURNS):
+        self.path = path
+        self.size = size
+        self.signature = None
+        self.lines = deque(maxlen=size)
+        self.rebuilds = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if state.get("version") != VIEW_VERSION or state.get("size") != self.size:
+            return
+        self.signature = tuple(state.get("signature") or ()) or None
+        self.lines.extend(state.get("lines", []))
+
+    def _save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": VIEW_VERSION, "size": self.size, "signature": self.signature,
+                       "lines": list(self.lines)}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def __call__(self, turns: list, previous, signature):
+        """Local write के बाद: view ताज़ा था तो केवल नए turns जोड़ता है, वरना अगली read पर rebuild"""
+        with self._lock:
+            if self.signature is None or self.signature != previous:
+                self.signature = None
+                return
+            self.signature = signature
+            if turns:
+                self.lines.extend(format_turn_line(turn) for turn in turns[-self.size:])
+            try:
+                self._save()
+            except OSError as e:
+                print(f"⚠️ Recent context save error: {e}")
+
+    def read(self, store) -> list:
+        """Formatted lines (पुराने से नए); view पुराना हो तो store से दोबारा बनता है"""
+        signature = store.signature()
+        with self._lock:
+            if signature == self.signature:
+                return list(self.lines)
+        # Signature पहले, turns बाद में पढ़ते हैं - बीच में write हुआ तो अगली read फिर rebuild करेगी
+        lines = [format_turn_line(turn) for turn in store.recent_turns(self.size)]
+        with self._lock:
+            self.rebuilds += 1
+            self.signature = signature
+            self.lines.clear()
+            self.lines.extend(lines)
+            try:
+                self._save()
+            except OSError as e:
+                print(f"⚠️ Recent context save error: {e}")
+            return list(self.lines)
@@ -0,0 +1,125 @@
+"""
+Fact Table - bounded fact store with optional TTL and LRU eviction.
+
+हर तथ्य के साथ value, expires_at (epoch seconds, 0 = कभी नहीं), last_used (epoch ms) और hits
+रखे जाते हैं।
+OrderedDict का क्रम ही LRU क्रम है (पहला = सबसे कम इस्तेमाल हुआ, आखिरी = सबसे हाल का),
+इसलिए lookup, update, "इस्तेमाल हुआ" (touch) और eviction सभी O(1) हैं।
+MAX_FACTS से ज़्यादा तथ्य होने पर सबसे पुराने इस्तेमाल वाले हटते हैं।
+"""
+import os
+import time
+from collections import OrderedDict
+
+MAX_FACTS = int(os.getenv("JARVIS_MAX_FACTS", 500))
+DEFAULT_FACT_TTL = int(float(os.getenv("JARVIS_FACT_TTL_DAYS", 0)) * 86400)  # 0 = कभी expire नहीं
+
+
+def expiry_for(ttl: int = None, now: float = None) -> int:
+    """TTL (seconds) -> expires_at epoch; ttl None हो तो DEFAULT_FACT_TTL, 0 हो तो 0 (कभी नहीं)"""
+    ttl = DEFAULT_FACT_TTL if ttl is None else ttl
+    return int((now or time.time()) + ttl) if ttl > 0 else 0
+
+
+class FactTable:
+    """key -> [value, expires_at, last_used, hits], LRU क्रम में"""
+
+    def __init__(self, max_entries: int = MAX_FACTS):
+        self.max_entries = max_entries
+        self._facts = OrderedDict()
+
+    @classmethod
+    def from_records(cls, records, max_entries: int = MAX_FACTS):
+        """(key, value, expires_at, last_used, hits) - LRU से MRU क्रम में"""
+        table = cls(max_entries)
+        for key, value, expires_at, last_used, hits in records:
+            table._facts[str(key)] = [str(value), int(expires_at or 0), int(last_used or 0), int(hits or 0)]
+        return table
+
+    @classmethod
+    def from_json(cls, data: dict, max_entries: int = MAX_FACTS):
+        """facts.json पढ़ता है - पुराना {"key": "value"} फॉर्मेट भी चलता है"""
+        records = []
+        for key, item in data.items():
+            if isinstance(item, dict):
+                records.append((key, item.get("value", ""), item.get("expires_at", 0),
+                                item.get("last_used", 0), item.get("hits", 0)))
+            else:
+                records.append((key, item, 0, 0, 0))
+        return cls.from_records(records, max_entries)
+
+    def to_json(self) -> dict:
+        return {key: {"value": value, "expires_at": expires_at, "last_used": last_used, "hits": hits}
+                for key, (value, expires_at, last_used, hits) in self._facts.items()}
+
+    def __len__(self):
+        return len(self._facts)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def _expired(self, record, now: float) -> bool:
+        return record[1] and record[1] <= now
+
+    def get(self, key: str, now: float = None):
+        """Value या None; expired तथ्य यहीं हट जाता है"""
+        record = self._facts.get(key)
+        if record is None:
+            return None
+        if self._expired(record, now or time.time()):
+            del self._facts[key]
+            return None
+        return record[0]
+
+    def set(self, key: str, value: str, ttl: int = None, now: float = None) -> list:
+        """तथ्य जोड़ता/बदलता है और उसे सबसे हाल का बनाता है; Returns: evict हुई keys"""
+        now = now or time.time()
+        record = self._facts.get(key)
+        hits = record[3] if record is not None else 0
+        self._facts[key] = [str(value), expiry_for(ttl, now), int(now * 1000), hits]
+        self._facts.move_to_end(key)
+        return self.evict()
+
+    def delete(self, key: str) -> bool:
+        return self._facts.pop(key, None) is not None
+
+    def touch(self, keys, now: float = None):
+        """Recall में इस्तेमाल हुए तथ्यों को सबसे हाल का बनाता है (hits बढ़ते हैं)"""
+        now_ms = int((now or time.time()) * 1000)
+        for key in keys:
+            record = self._facts.get(key)
+            if record is not None:
+                record[2] = now_ms
+                record[3] += 1
+                self._facts.move_to_end(key)
+
+    def evict(self) -> list:
+        """MAX_FACTS से ऊपर के सबसे कम इस्तेमाल हुए तथ्य हटाता है"""
+        evicted = []
+        while len(self._facts) > self.max_entries:
+            evicted.append(self._facts.popitem(last=False)[0])
+        return evicted
+
+    def purge_expired(self, now: float = None) -> list:
+        now = now or time.time()
+        expired = [key for key, record in self._facts.items() if self._expired(record, now)]
+        for key in expired:
+            del self._facts[key]
+        return expired
+
+    def items(self, now: float = None) -> dict:
+        """सभी जीवित तथ्य {key: value}, LRU से MRU क्रम में"""
+        self.purge_expired(now)
+        return {key: record[0] for key, record in self._facts.items()}
+
+    def most_recent(self, limit: int, now: float = None) -> list:
+        """(key, value) pairs, सबसे हाल में इस्तेमाल हुए पहले - केवल limit तक चलता है"""
+        now = now or time.time()
+        result = []
+        for key in reversed(self._facts):
+            if len(result) >= limit:
+                break
+            record = self._facts[key]
+            if not self._expired(record, now):
+                result.append((key, record[0]))
+        return result
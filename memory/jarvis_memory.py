@@ -1,28 +1,59 @@
-import speech_recognition as sr
-import pyttsx3
-import json
+import asyncio
+import atexit
+import itertools
 import os
-from datetime import datetime
+import sys
+import threading
 from livekit.agents import function_tool
 
+if __package__ in (None, ""):
+    # स्क्रिप्ट की तरह चलाने पर (python memory/jarvis_memory.py) प्रोजेक्ट रूट को path में जोड़ें
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from memory.journal import LEGACY_MEMORY_FILE
+from memory.context_view import format_turn_line, RECENT_CONTEXT_TURNS
+from memory.records import Speaker, Turn, speaker_name
+from memory.shards import ShardManager, current_shard
+from memory.time_index import resolve_period
+from memory.summarizer import SummaryCompactor
+from memory.pagination import get_page
+from memory.prefetch import prefetched, discard_prefetched, text_key
+
 # --- कॉन्फ़िगरेशन ---
-MEMORY_FILE = os.path.join(os.path.dirname(__file__), "memory.json")
+MEMORY_FILE = LEGACY_MEMORY_FILE  # पुराना फॉर्मेट - अब केवल एक बार के migration के लिए पढ़ा जाता है
+
+MAX_RECALLED_FACTS = 3  # एक query पर अधिकतम कितने तथ्य सुनाए जाएँ
+SUMMARY_RECENT_TURNS = RECENT_CONTEXT_TURNS  # session context में summary के साथ raw भेजे जाने वाले सबसे नए turns
+
+_shards = None
+_compactor = None
+_engine = None
+_engine_loaded = False
+_summary_lock = threading.Lock()
 
 # ==============================================================================
 # 1. कोर इंजन कंपोनेंट्स (Core Engine Components)
 # ==============================================================================
 
-try:
-    engine = pyttsx3.init('sapi5')
-    voices = engine.getProperty('voices')
-    engine.setProperty('voice', voices[0].id)
-except Exception as e:
-    print(f"TTS Engine Error: {e}")
-    engine = None
+def get_tts_engine():
+    """SAPI5 TTS engine - import पर नहीं, पहली बार बोलने पर बनता है (fail हो तो None)"""
+    global _engine, _engine_loaded
+    if not _engine_loaded:
+        _engine_loaded = True
+        try:
+            import pyttsx3
+            _engine = pyttsx3.init('sapi5')
+            voices = _engine.getProperty('voices')
+            _engine.setProperty('voice', voices[0].id)
+        except Exception as e:
+            print(f"TTS Engine Error: {e}")
+            _engine = None
+    return _engine
 
 def speak(audio):
     """इस फंक्शन से Jarvis बोलता है और बातचीत को मेमोरी में सेव करता है"""
     print(f"Jarvis: {audio}")
+    engine = get_tts_engine()
     if engine:
         engine.say(audio)
         engine.runAndWait()
@@ -30,6 +61,7 @@ def speak(audio):
 
 def take_command():
     """माइक्रोफोन से सुनता है, टेक्स्ट में बदलता है और बातचीत को सेव करता है"""
+    import speech_recognition as sr
     r = sr.Recognizer()
     with sr.Microphone() as source:
         print("Listening...")
@@ -55,34 +87,158 @@ def take_command():
 # 2. मेमोरी मैनेजमेंट फंक्शन्स (Memory Management Functions)
 # ==============================================================================
 
+def get_shards():
+    """Memory shards (room/participant namespaces) का manager - पहली बार इस्तेमाल पर बनता है"""
+    global _shards
+    if _shards is None:
+        _shards = ShardManager()
+        atexit.register(_shards.close_all)
+    return _shards
+
+def set_memory_shard(name: str):
+    """इस context (और इससे बने tasks/threads) के लिए memory shard चुनता है; Returns: reset token"""
+    return current_shard.set(name)
+
+def hold_memory_shard(name: str = None):
+    """
+    Session भर के लिए shard को idle eviction से बचाता है (उसके prefetch/tool threads बंद store न पाएँ)।
+    Returns: release करने वाला async callback - LiveKit shutdown callback के लिए
+    """
+    manager = get_shards()
+    shard = manager.acquire(name)
+
+    async def release():
+        manager.release(shard)
+    return release
+
+def get_store():
+    """
+    Current shard का storage backend (default: SQLite) - पहली बार इस्तेमाल पर खुलता है।
+    Shard-wide cache के पीछे रहता है, इसलिए बार-बार के reads storage तक नहीं जाते।
+    """
+    return get_shards().get().store
+
+def memory_cache_stats():
+    """Memory cache के hit/miss counters"""
+    return get_store().stats()
+
+def get_writer():
+    """Current shard की background write-behind queue - नई बातचीत इसी के ज़रिए batches में लिखी जाती है"""
+    return get_shards().get().writer
+
+def flush_memory_writes(timeout: float = 5.0) -> bool:
+    """सभी खुले shards की pending बातचीत disk पर लिखे जाने तक रुकता है (shutdown पर ज़रूर बुलाएँ)"""
+    if _shards is None:
+        return True
+    return all([shard.writer.flush(timeout) for shard in _shards.active()])
+
+async def flush_memory_writes_async(timeout: float = 5.0) -> bool:
+    """flush_memory_writes का async version - LiveKit shutdown callback के लिए"""
+    return await asyncio.to_thread(flush_memory_writes, timeout)
+
+async def _flush_pending_turns():
+    """Read tools से पहले: current shard की queue में पड़ी बातचीत लिख देता है (read-your-writes)"""
+    await get_writer().flush_async()
+
+def get_summary():
+    """Current shard की पुरानी बातचीत का rolling extractive summary (<shard>/summary.json)"""
+    return get_shards().get().summary
+
+def refresh_summary(shard=None) -> int:
+    """
+    Checkpoint के बाद के turns summary में जोड़ता है - सबसे नए SUMMARY_RECENT_TURNS छोड़कर,
+    क्योंकि वे raw भेजे जाते हैं। Returns: कितने turns process हुए
+    """
+    shard = shard or get_shards().get()
+    with _summary_lock:
+        store = shard.store
+        summary = shard.summary
+        total = store.count_turns()
+        if total < summary.checkpoint:
+            # Storage बदल गया (backend switch / history साफ़) - summary नए सिरे से
+            summary.reset()
+        upto = total - SUMMARY_RECENT_TURNS
+        if upto <= summary.checkpoint:
+            return 0
+        turns = itertools.islice(store.turns_from(summary.checkpoint), upto - summary.checkpoint)
+        processed = summary.update(turns)
+        summary.save()
+        return processed
+
+def refresh_all_summaries() -> int:
+    """सभी खुले shards के summaries - background compactor यही चलाता है"""
+    manager = get_shards()
+    processed = 0
+    for shard in manager.active():
+        # Summary बनते समय shard evict होकर बंद न हो; इस बीच evict हो चुका हो तो छोड़ दें
+        with manager.holding(shard) as held:
+            if held is not None:
+                processed += refresh_summary(held)
+    return processed
+
+def start_summary_compactor():
+    """Background compactor शुरू करता है (idempotent) - summary हर SUMMARY_INTERVAL_S पर update होता है"""
+    global _compactor
+    if _compactor is None:
+        _compactor = SummaryCompactor(refresh_all_summaries)
+        atexit.register(_compactor.stop)
+    _compactor.start()
+    return _compactor
+
+def build_session_context() -> str:
+    """
+    Session की शुरुआत के लिए छोटा context: पुरानी बातों का summary + कुछ सबसे नए raw turns।
+    नए turns की lines materialized view (recent_context.json) से आती हैं - storage पढ़ना नहीं पड़ता।
+    """
+    shard = get_shards().get()
+    summary_lines = [format_turn_line(entry, with_date=True) for entry in shard.summary.entries()]
+    recent_lines = shard.recent_view.read(shard.store)
+    if not summary_lines and not recent_lines:
+        return "अभी तक कोई बातचीत याद नहीं है।"
+    parts = []
+    if summary_lines:
+        parts.append("पुरानी बातचीत का सारांश:\n" + "\n".join(summary_lines))
+    if recent_lines:
+        parts.append("हाल की बातचीत:\n" + "\n".join(recent_lines))
+    return "\n\n".join(parts)
+
+async def get_session_context() -> str:
+    """build_session_context का async version (event loop block न हो, इसलिए thread में)"""
+    return await asyncio.to_thread(build_session_context)
+
+def warm_memory() -> str:
+    """
+    Worker prewarm: current shard खोलकर facts, recent-context view, summary और (जिस backend में
+    persistent search index नहीं) search index पहले से लोड करता है, ताकि पहले reply पर
+    storage खोलना/पढ़ना न पड़े। Returns: session context
+    """
+    store = get_store()
+    store.load_facts()
+    store.warm_indexes()
+    return build_session_context()
+
+def _make_entry(speaker: str, text: str) -> Turn:
+    return Turn.now(speaker, text)
+
 def load_memory_sync():
-    """JSON फाइल से मेमोरी लोड करता है"""
-    if not os.path.exists(MEMORY_FILE):
-        return {"facts": {}, "conversation": []}
-    
-    with open(MEMORY_FILE, 'r', encoding='utf-8') as f:
-        try:
-            data = json.load(f)
-            if "facts" not in data: data["facts"] = {}
-            if "conversation" not in data: data["conversation"] = []
-            return data
-        except json.JSONDecodeError:
-            return {"facts": {}, "conversation": []}
+    """Storage से पूरी मेमोरी {"facts", "conversation"} के रूप में लोड करता है"""
+    flush_memory_writes()
+    store = get_store()
+    return {"facts": store.load_facts(), "conversation": [turn.to_dict() for turn in store.iter_turns()]}
 
 def save_memory_sync(data: dict):
-    """मेमोरी को JSON फाइल में सेव करता है"""
-    with open(MEMORY_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    """
+    तथ्यों (facts) को storage में सेव करता है।
+    बातचीत append-only रहती है, इसलिए data["conversation"] यहाँ दोबारा नहीं लिखी जाती।
+    """
+    get_store().replace_facts(data.get("facts", {}))
 
 def append_conversation_sync(speaker: str, text: str):
-    """बातचीत को मेमोरी में जोड़ता है"""
+    """बातचीत को write-behind queue में डालता है - disk write background में batch के साथ होता है"""
     if not text or text == "None":
         return
         
-    entry = {"speaker": speaker, "text": text, "ts": datetime.now().isoformat()}
-    memory = load_memory_sync()
-    memory["conversation"].append(entry)
-    save_memory_sync(memory)
+    get_writer().submit(_make_entry(speaker, text))
 
 # ==============================================================================
 # 3. जार्विस एक्शन फंक्शन्स (Jarvis Action Functions)
@@ -97,7 +253,7 @@ def remember_something(memory):
         info = take_command()
         if info != "None":
             memory['facts'][thing_to_remember] = info
-            save_memory_sync(memory)
+            get_store().set_fact(thing_to_remember, info)
             speak("ठीक है, मैंने यह याद कर लिया है।")
         else:
             speak("माफ़ कीजिये, मुझे जानकारी सुनाई नहीं दी।")
@@ -105,29 +261,37 @@ def remember_something(memory):
         speak("माफ़ कीजिये, मुझे सुनाई नहीं दिया कि क्या याद रखना है।")
 
 def recall_something(memory, query):
-    """memory['facts'] से जानकारी ढूंढकर बताता है"""
-    found = False
-    for key in memory['facts'].keys():
-        if key in query:
-            speak(f"मुझे याद है कि {key}, {memory['facts'][key]}")
-            found = True
-            break
-    if not found:
+    """Query में आने वाले सभी तथ्य (सबसे लंबे match पहले) ढूंढकर बताता है"""
+    store = get_store()
+    matches = store.match_facts(query)
+    if not matches:
         speak("माफ़ कीजिये, मुझे इस बारे में कोई तथ्य याद नहीं है।")
-
-def recall_conversation(memory):
-    """पिछली बातचीत को memory['conversation'] से पढ़कर सुनाता है"""
+        return
+    facts = store.load_facts()
+    recalled = matches[:MAX_RECALLED_FACTS]
+    # सुनाए गए तथ्य "हाल में इस्तेमाल हुए" बनते हैं - LRU eviction इन्हें सबसे आखिर में हटाएगा
+    store.touch_facts(recalled)
+    for key in recalled:
+        speak(f"मुझे याद है कि {key}, {facts.get(key, memory['facts'].get(key, ''))}")
+
+def recall_conversation():
+    """पिछली बातचीत को storage से पढ़कर सुनाता है"""
     speak("ठीक है, हमारी पिछली कुछ बातें यह हैं।")
-    recent_chats = memory['conversation'][-5:] # पिछली 5 बातें
+    flush_memory_writes()
+    recent_chats = get_store().recent_turns(5) # पिछली 5 बातें
     
     if not recent_chats:
         speak("माफ़ कीजिये, अभी तक कोई बातचीत याद नहीं है।")
         return
 
     for entry in recent_chats:
-        speaker = "आपने कहा" if entry.get("speaker") == "user" else "मैंने कहा"
-        text = entry.get("text", "")
-        speak(f"{speaker}, {text}")
+        if entry.speaker is Speaker.USER:
+            speaker = "आपने कहा"
+        elif entry.speaker is Speaker.JARVIS:
+            speaker = "मैंने कहा"
+        else:
+            speaker = f"{speaker_name(entry.speaker)} ने कहा"
+        speak(f"{speaker}, {entry.text}")
 
 def forget_something(memory):
     """memory['facts'] से कुछ भूलने के लिए पूछता है"""
@@ -135,7 +299,7 @@ def forget_something(memory):
     key_to_forget = take_command()
     if key_to_forget in memory['facts']:
         del memory['facts'][key_to_forget]
-        save_memory_sync(memory)
+        get_store().delete_fact(key_to_forget)
         speak(f"ठीक है, मैं '{key_to_forget}' के बारे में भूल गया हूँ।")
     elif key_to_forget != "None":
         speak(f"मुझे '{key_to_forget}' नाम का कोई तथ्य याद नहीं है।")
@@ -148,15 +312,14 @@ def forget_something(memory):
 
 @function_tool
 async def load_memory(limit: int = 10) -> str:
-    """मेमोरी से सभी तथ्य लोड करता है"""
+    """मेमोरी से तथ्य लोड करता है - सबसे हाल में इस्तेमाल हुए तथ्य पहले"""
     try:
-        memory = load_memory_sync()
-        facts = memory.get("facts", {})
+        facts = get_store().list_facts(limit)
         
         if not facts:
             return "अभी तक कोई तथ्य याद नहीं है।"
         
-        facts_list = "\n".join([f"• {key}: {value}" for key, value in list(facts.items())[:limit]])
+        facts_list = "\n".join([f"• {key}: {value}" for key, value in facts])
         return f"याद रखे गए तथ्य:\n{facts_list}"
     except Exception as e:
         return f"मेमोरी लोड करने में त्रुटि: {str(e)}"
@@ -174,29 +337,86 @@ async def save_memory(data: dict) -> str:
 async def get_recent_conversations(limit: int = 10) -> str:
     """पिछली बातचीत को निकालता है और हिंदी में सारांश देता है"""
     try:
-        memory = load_memory_sync()
-        entries = memory.get("entries", [])
+        await _flush_pending_turns()
+        # Intent router ने यह read पहले से शुरू किया हो तो वही result
+        recent = await prefetched("recent_turns", limit, get_store().recent_turns, limit)
         
-        if not entries:
+        if not recent:
             return "अभी तक कोई बातचीत याद नहीं है।"
         
-        recent = entries[-limit:]
-        summary_lines = []
-        
-        for entry in recent:
-            speaker = "आप" if entry.get("speaker") == "user" else "जार्विस"
-            text = entry.get("text", "")
-            summary_lines.append(f"- {speaker}: {text}")
+        summary_lines = [format_turn_line(entry) for entry in recent]
         
         return "पिछली बातचीत:\n" + "\n".join(summary_lines)
     except Exception as e:
         return f"बातचीत निकालने में त्रुटि: {str(e)}"
 
+@function_tool
+async def get_conversations(before_cursor: str = "", page_size: int = 10) -> str:
+    """
+    बातचीत history को pages में पीछे की ओर पढ़ता है। पहली बार before_cursor खाली छोड़ें (सबसे नई
+    बातचीत); जवाब के आखिर में दिया cursor भेजने पर उससे पुराना page मिलता है।
+    """
+    try:
+        await _flush_pending_turns()
+        turns, next_cursor = await asyncio.to_thread(get_page, get_store(), before_cursor, page_size)
+        
+        if not turns:
+            return "अभी तक कोई बातचीत याद नहीं है।"
+        
+        lines = [format_turn_line(entry, with_date=True) for entry in turns]
+        footer = f"और पुरानी बातचीत के लिए before_cursor: {next_cursor}" if next_cursor else "यह सबसे पुरानी बातचीत है।"
+        return "बातचीत:\n" + "\n".join(lines) + "\n\n" + footer
+    except ValueError as e:
+        return f"Cursor समझ नहीं आया: {str(e)}"
+    except Exception as e:
+        return f"बातचीत निकालने में त्रुटि: {str(e)}"
+
+@function_tool
+async def get_conversations_by_date(period: str = "today", start_date: str = "", end_date: str = "", limit: int = 20) -> str:
+    """
+    किसी समय-सीमा की बातचीत निकालता है। period: "today"/"आज", "yesterday"/"कल",
+    "last_week"/"पिछले हफ्ते", "last_month"; या start_date/end_date (YYYY-MM-DD) दें।
+    """
+    try:
+        start, end = resolve_period(period, start_date, end_date)
+        await _flush_pending_turns()
+        # Storage query thread में - event loop block न हो
+        turns = await asyncio.to_thread(get_store().turns_between, start, end, limit)
+        
+        label = f"{start_date or '...'} से {end_date or 'अब'} तक" if (start_date or end_date) else period
+        if not turns:
+            return f"{label} की कोई बातचीत याद नहीं है।"
+        
+        return f"{label} की बातचीत:\n" + "\n".join(format_turn_line(entry, with_date=True) for entry in turns)
+    except ValueError as e:
+        return f"समय-सीमा समझ नहीं आई: {str(e)}"
+    except Exception as e:
+        return f"बातचीत निकालने में त्रुटि: {str(e)}"
+
+@function_tool
+async def search_conversations(query: str, limit: int = 5) -> str:
+    """पूरी बातचीत history में शब्दों से खोजता है (जैसे "दिल्ली के बारे में मैंने क्या कहा था") और सबसे relevant बातें देता है"""
+    try:
+        await _flush_pending_turns()
+        results = await prefetched("search_turns", (text_key(query), limit), get_store().search_turns, query, limit)
+        
+        if not results:
+            return f"'{query}' के बारे में कोई पुरानी बातचीत नहीं मिली।"
+        
+        lines = [format_turn_line(entry, with_date=True) for _, entry in results]
+        
+        return f"'{query}' से जुड़ी बातचीत:\n" + "\n".join(lines)
+    except Exception as e:
+        return f"बातचीत खोजने में त्रुटि: {str(e)}"
+
 @function_tool
 async def add_memory_entry(speaker: str, text: str) -> str:
     """बातचीत में नई entry जोड़ता है"""
     try:
-        append_conversation_sync(speaker, text)
+        if text and text != "None":
+            await get_writer().submit_async(_make_entry(speaker, text))
+            # इस turn के पहले से शुरू हुए memory reads में यह entry नहीं होगी
+            discard_prefetched("recent_turns", "search_turns")
         return f"✓ '{speaker}' की entry जोड़ी गई"
     except Exception as e:
         return f"❌ Entry जोड़ने में त्रुटि: {str(e)}"
@@ -213,8 +433,7 @@ def process_command(query, memory):
         return True
 
     elif "पिछली बात" in query or "पिछली बातचीत" in query or "क्या बात हुई" in query:
-        current_memory = load_memory_sync()
-        recall_conversation(current_memory)
+        recall_conversation()
         return True
 
     elif "भूल जाओ" in query or "भूल जाना" in query:
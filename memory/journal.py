@@ -0,0 +1,168 @@
+"""
+Conversation Journal - append-only storage for Jarvis memory.
+
+बातचीत को एक line-delimited JSON (JSONL) फाइल में रखा जाता है: हर turn एक line है,
+इसलिए नई entry जोड़ना O(1) है और पूरी history को दोबारा लिखना नहीं पड़ता।
+तथ्य (facts) छोटे होते हैं, इसलिए वे एक अलग snapshot फाइल में atomic तरीके से सेव होते हैं।
+
+पुराने memory.json फॉर्मेट से एक बार का migration भी यहीं होता है।
+"""
+import json
+import os
+
+MEMORY_DIR = os.path.dirname(os.path.abspath(__file__))
+JOURNAL_FILE = os.path.join(MEMORY_DIR, "conversation.jsonl")
+FACTS_FILE = os.path.join(MEMORY_DIR, "facts.json")
+LEGACY_MEMORY_FILE = os.path.join(MEMORY_DIR, "memory.json")
+
+TAIL_BLOCK_SIZE = 64 * 1024  # reverse reader एक बार में इतने bytes पीछे की ओर पढ़ता है
+
+
+def _decode_line(line):
+    """एक JSONL line को dict में बदलता है; खाली/अधूरी line के लिए None"""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        return json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+class ConversationJournal:
+    """Append-only JSONL journal - हर बातचीत का एक record प्रति line"""
+
+    def __init__(self, path: str = JOURNAL_FILE):
+        self.path = path
+        self._handle = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def append(self, entry: dict):
+        """एक entry को फाइल के अंत में जोड़ता है (पूरी फाइल दोबारा नहीं लिखी जाती)"""
+        if self._handle is None:
+            self._handle = open(self.path, "a", encoding="utf-8")
+        self._handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._handle.flush()
+
+    def read_all(self) -> list:
+        """पूरी journal पढ़ता है; अधूरी/खराब lines (जैसे crash के बाद) छोड़ दी जाती हैं"""
+        if not self.exists():
+            return []
+        entries = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = _decode_line(line)
+                if entry is not None:
+                    entries.append(entry)
+        return entries
+
+    def iter_reverse(self, block_size: int = TAIL_BLOCK_SIZE):
+        """
+        फाइल के अंत से पीछे की ओर blocks में पढ़ता है और records नए से पुराने क्रम में देता है।
+        केवल उतना ही हिस्सा पढ़ा/decode होता है जितना caller consume करता है।
+        """
+        if not self.exists():
+            return
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            partial = b""
+            while pos > 0:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + partial).split(b"\n")
+                # पहली line अधूरी हो सकती है - उसे अगले (पिछले) block के साथ जोड़ा जाएगा
+                partial = lines[0]
+                for line in reversed(lines[1:]):
+                    entry = _decode_line(line)
+                    if entry is not None:
+                        yield entry
+            entry = _decode_line(partial)
+            if entry is not None:
+                yield entry
+
+    def read_last(self, limit: int) -> list:
+        """आखिरी limit records (पुराने से नए क्रम में) - पूरी फाइल पढ़े बिना"""
+        if limit <= 0:
+            return []
+        entries = []
+        for entry in self.iter_reverse():
+            entries.append(entry)
+            if len(entries) >= limit:
+                break
+        entries.reverse()
+        return entries
+
+    def write_all(self, entries: list):
+        """पूरी journal को atomic तरीके से लिखता है (केवल migration के लिए)"""
+        self.close()
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def load_facts(path: str = FACTS_FILE) -> dict:
+    """Facts snapshot फाइल से तथ्य लोड करता है"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError:
+            return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_facts(facts: dict, path: str = FACTS_FILE):
+    """तथ्यों को temp फाइल में लिखकर atomic rename करता है, ताकि आधी लिखी फाइल कभी न दिखे"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(facts, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def read_legacy_memory(legacy_path: str = LEGACY_MEMORY_FILE) -> tuple:
+    """पुराना memory.json पढ़ता है (कुछ लिखे बिना); Returns: (बातचीत समय के क्रम में, facts dict)"""
+    if not os.path.exists(legacy_path):
+        return [], {}
+    with open(legacy_path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError:
+            data = {}
+
+    # पुराने वर्ज़न में बातचीत कभी "conversation" और कभी "entries" key में रहती थी
+    conversation = list(data.get("conversation", [])) + list(data.get("entries", []))
+    conversation.sort(key=lambda e: e.get("ts", ""))
+    facts = data.get("facts", {})
+    return conversation, facts if isinstance(facts, dict) else {}
+
+
+def migrate_legacy_memory(journal: ConversationJournal,
+                          legacy_path: str = LEGACY_MEMORY_FILE,
+                          facts_path: str = FACTS_FILE) -> bool:
+    """
+    पुराने memory.json को एक बार journal + facts snapshot में बदलता है।
+    Journal पहले से मौजूद हो तो कुछ नहीं करता। पुरानी फाइल को छुआ नहीं जाता (backup के रूप में रहती है)।
+    Returns: True अगर migration हुआ
+    """
+    if journal.exists() or not os.path.exists(legacy_path):
+        return False
+
+    conversation, facts = read_legacy_memory(legacy_path)
+    # Facts पहले, journal आखिर में - ताकि बीच में crash होने पर migration दोबारा चल सके
+    if not os.path.exists(facts_path):
+        save_facts(facts, facts_path)
+    journal.write_all(conversation)
+    print(f"🧠 Memory migrated: {len(conversation)} conversation entries → {os.path.basename(journal.path)}")
+    return True
@@ -0,0 +1,116 @@
+"""
+Cross-process Locking - advisory file lock + mmap'd generation counter.
+
+Agent (src/agent.py) और CLI voice loop (python memory/jarvis_memory.py) एक ही memory को
+अलग-अलग processes से पढ़/लिख सकते हैं। हर write एक advisory lock (POSIX पर fcntl.flock,
+Windows पर msvcrt.locking) के अंदर होता है, ताकि read-modify-write (जैसे facts) में
+updates खो न जाएँ।
+
+हर write के बाद एक छोटी फाइल में रखा generation counter बढ़ाया जाता है। दूसरे processes
+इसे mmap से पढ़ते हैं - एक memory read, बिना system call के - और counter बदलने पर ही
+अपने caches दोबारा लोड करते हैं।
+"""
+import mmap
+import os
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+_COUNTER = struct.Struct("<Q")
+
+
+class InterProcessLock:
+    """Advisory exclusive file lock; एक process के threads के बीच reentrant"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            self._unlock_file()
+        self._thread_lock.release()
+
+    def _lock_file(self):
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            while True:
+                try:
+                    # LK_LOCK खुद ~10 सेकंड retry करके OSError देता है - तब तक दोबारा कोशिश
+                    msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                    return
+                except OSError:
+                    time.sleep(0.05)
+
+    def _unlock_file(self):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class GenerationCounter:
+    """8-byte फाइल में रखा counter, सभी processes में shared mmap के ज़रिए दिखता है"""
+
+    def __init__(self, path: str):
+        self.path = path
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < _COUNTER.size:
+                # ftruncate केवल फाइल बढ़ाता है - किसी और process का लिखा counter नहीं मिटता
+                os.ftruncate(fd, _COUNTER.size)
+            self._map = mmap.mmap(fd, _COUNTER.size)
+        finally:
+            os.close(fd)
+
+    def value(self) -> int:
+        return _COUNTER.unpack_from(self._map, 0)[0]
+
+    def bump(self) -> int:
+        """Counter बढ़ाता है - write lock के अंदर ही बुलाएँ"""
+        value = self.value() + 1
+        _COUNTER.pack_into(self._map, 0, value)
+        return value
+
+    def close(self):
+        self._map.close()
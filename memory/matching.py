@@ -0,0 +1,194 @@
+"""
+Memory Matching - Unicode-normalized multi-pattern matching for Jarvis memory.
+
+PatternMatcher एक Aho-Corasick automaton है: query को एक ही pass में पढ़कर सभी
+patterns के matches मिल जाते हैं, चाहे patterns हज़ारों हों। FactIndex इसी के ऊपर
+remembered facts की keys का index है, जो remember/forget पर incrementally update होता है।
+trie_regex छोटे, स्थिर keyword sets के लिए है: patterns एक trie-shaped regex में compile
+होते हैं और C regex engine में चलते हैं - केवल "कोई भी match?" वाले hot paths के लिए।
+
+Matching से पहले text को NFC + casefold किया जाता है, ताकि अलग-अलग तरीके से encode
+हुए देवनागरी अक्षर (जैसे nukta वाले) और upper/lower case एक जैसे match हों।
+"""
+import re
+import unicodedata
+from collections import deque
+
+# \w अकेले देवनागरी मात्राओं (combining marks) पर शब्द तोड़ देता है, इसलिए पूरा block जोड़ा गया है
+_TOKEN_RE = re.compile(r"[\w\u0900-\u097F]+")
+
+
+def normalize_text(text: str) -> str:
+    """NFC normalization + casefold + whitespace collapse"""
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+
+def tokenize(text: str) -> list:
+    """Normalized text को शब्दों (tokens) में तोड़ता है - हिंदी और English दोनों के लिए"""
+    return _TOKEN_RE.findall(normalize_text(text))
+
+
+def trie_regex(patterns, token=re.escape):
+    """
+    Patterns का trie बनाकर एक compiled regex - साझा prefixes एक ही बार जाँचे जाते हैं।
+    token(ch) पहले अक्षर के बाद हर अक्षर का regex हिस्सा देता है (जैसे "a+" ताकि दोहराए
+    अक्षर भी match हों)। पहला अक्षर literal रहता है, ताकि regex engine का first-character
+    prefilter काम करे और ज़्यादातर positions तुरंत छूट जाएँ।
+    """
+    trie = {}
+    for pattern in patterns:
+        if not pattern:
+            continue
+        node = trie
+        for ch in pattern:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node, depth: int = 0) -> str:
+        branches = [(token(ch) if depth else re.escape(ch)) + build(child, depth + 1)
+                    for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Pattern यहीं खत्म हो सकता है - आगे का हिस्सा optional
+        return f"(?:{body})?" if "" in node else body
+
+    return re.compile(build(trie) if trie else r"(?!)")
+
+
+class _Node:
+    __slots__ = ("children", "fail", "outputs", "dict_link")
+
+    def __init__(self):
+        self.children = {}
+        self.fail = None
+        self.outputs = set()   # इस node पर खत्म होने वाले patterns
+        self.dict_link = None  # fail-chain में अगला node जिसके outputs हों
+
+
+class PatternMatcher:
+    """
+    Aho-Corasick automaton. Patterns जोड़ना/हटाना incremental है (trie update);
+    failure links अगली search से पहले lazily दोबारा बनते हैं।
+    """
+
+    def __init__(self, patterns=()):
+        self._root = _Node()
+        self._patterns = set()
+        self._dirty = False
+        for pattern in patterns:
+            self.add(pattern)
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def __contains__(self, pattern):
+        return pattern in self._patterns
+
+    def add(self, pattern: str):
+        if not pattern or pattern in self._patterns:
+            return
+        node = self._root
+        for ch in pattern:
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = _Node()
+            node = child
+        node.outputs.add(pattern)
+        self._patterns.add(pattern)
+        self._dirty = True
+
+    def remove(self, pattern: str):
+        if pattern not in self._patterns:
+            return
+        node = self._root
+        for ch in pattern:
+            node = node.children[ch]
+        node.outputs.discard(pattern)
+        self._patterns.discard(pattern)
+        self._dirty = True
+
+    def _build_links(self):
+        """BFS से failure और dictionary-suffix links बनाता है - O(कुल pattern length)"""
+        root = self._root
+        root.fail = None
+        root.dict_link = None
+        queue = deque()
+        for child in root.children.values():
+            child.fail = root
+            child.dict_link = None
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for ch, child in node.children.items():
+                fail = node.fail
+                while fail is not None and ch not in fail.children:
+                    fail = fail.fail
+                child.fail = fail.children[ch] if fail is not None else root
+                child.dict_link = child.fail if child.fail.outputs else child.fail.dict_link
+                queue.append(child)
+        self._dirty = False
+
+    def iter_matches(self, text: str):
+        """(end_index, pattern) हर match के लिए, text के एक ही pass में"""
+        if self._dirty:
+            self._build_links()
+        root = self._root
+        node = root
+        for i, ch in enumerate(text):
+            while node is not root and ch not in node.children:
+                node = node.fail
+            node = node.children.get(ch, root)
+            match = node if node.outputs else node.dict_link
+            while match is not None:
+                for pattern in match.outputs:
+                    yield i, pattern
+                match = match.dict_link
+
+    def find_all(self, text: str) -> list:
+        """Text में मौजूद सभी अलग-अलग patterns, लंबे match पहले"""
+        found = {pattern for _, pattern in self.iter_matches(text)}
+        return sorted(found, key=lambda p: (-len(p), p))
+
+    def search(self, text: str) -> bool:
+        """क्या कोई भी pattern text में है (पहले match पर रुक जाता है)"""
+        for _ in self.iter_matches(text):
+            return True
+        return False
+
+
+class FactIndex:
+    """Remembered facts की keys का normalized Aho-Corasick index"""
+
+    def __init__(self, keys=()):
+        self._matcher = PatternMatcher()
+        self._originals = {}  # normalized key -> {original keys}
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return sum(len(keys) for keys in self._originals.values())
+
+    def add(self, key: str):
+        normalized = normalize_text(key)
+        if not normalized:
+            return
+        self._originals.setdefault(normalized, set()).add(key)
+        self._matcher.add(normalized)
+
+    def remove(self, key: str):
+        normalized = normalize_text(key)
+        originals = self._originals.get(normalized)
+        if not originals:
+            return
+        originals.discard(key)
+        if not originals:
+            del self._originals[normalized]
+            self._matcher.remove(normalized)
+
+    def match(self, query: str) -> list:
+        """Query में आने वाली सभी fact keys (original रूप में), सबसे लंबे match पहले"""
+        keys = []
+        for normalized in self._matcher.find_all(normalize_text(query)):
+            keys.extend(sorted(self._originals[normalized]))
+        return keys
@@ -0,0 +1,48 @@
+"""
+Conversation Pagination - opaque cursors over MemoryStore.turns_before().
+
+Cursor storage की position (SQLite में row id, jsonl में append क्रम) को छुपाता है, ताकि
+model या GUI बिना पूरी history लोड किए पन्ना-दर-पन्ना पीछे की ओर चल सकें।
+"""
+import base64
+import binascii
+
+CURSOR_VERSION = "v1"
+MAX_PAGE_SIZE = 50
+
+
+def encode_cursor(position: int) -> str:
+    raw = f"{CURSOR_VERSION}:{position}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Cursor -> position; खाली cursor = सबसे नई बातचीत (None)। खराब cursor पर ValueError"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        version, position = raw.split(":", 1)
+        if version != CURSOR_VERSION:
+            raise ValueError(version)
+        return int(position)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}") from None
+
+
+def get_page(store, before_cursor: str = "", page_size: int = 10) -> tuple:
+    """(turns पुराने से नए क्रम में, अगले पुराने page का cursor या "" अगर history खत्म)"""
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    turns, next_position = store.turns_before(decode_cursor(before_cursor), page_size)
+    return turns, (encode_cursor(next_position) if next_position is not None else "")
+
+
+def iter_pages(store, page_size: int = 10):
+    """सबसे नए page से शुरू करके पुराने pages lazily देता है"""
+    cursor = ""
+    while True:
+        turns, cursor = get_page(store, cursor, page_size)
+        if turns:
+            yield turns
+        if not cursor:
+            return
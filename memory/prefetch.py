@@ -0,0 +1,164 @@
+"""
+Speculative Prefetch - short-lived per-turn cache of tool data.
+
+जैसे ही transcript से पता चले कि model शायद memory, weather या search tool call करेगा, वही
+data (memory read, IP से city lookup + weather HTTP call, search request) background में
+शुरू कर दिया जाता है - जब तक realtime model अपना turn बना रहा होता है। बाद में असली tool
+call prefetched() से वही task ले लेता है; नया turn शुरू होने पर बिना इस्तेमाल हुए prefetches
+cancel हो जाते हैं।
+
+Cache हर session का अलग है (current_prefetch contextvar, memory shards की तरह), ताकि एक
+worker में चल रहे sessions एक-दूसरे के prefetches न काटें।
+"""
+import asyncio
+import contextvars
+import os
+import time
+
+current_prefetch = contextvars.ContextVar("jarvis_prefetch", default=None)
+
+
+# Settings import के समय नहीं, इस्तेमाल के समय पढ़ी जाती हैं - यह module Jarvis_google_search से
+# उसके load_dotenv() से पहले import होता है, तब .env की values अभी environment में नहीं होतीं
+def prefetch_enabled() -> bool:
+    return os.getenv("JARVIS_PREFETCH", "1") != "0"
+
+
+def prefetch_ttl_s() -> float:
+    return float(os.getenv("JARVIS_PREFETCH_TTL_S", 20))
+
+
+class _Entry:
+    __slots__ = ("task", "started", "finished", "used")
+
+    def __init__(self, task: asyncio.Task, started: float):
+        self.task = task
+        self.started = started
+        self.finished = None
+        self.used = False
+
+
+class PrefetchCache:
+    """(kind, key) -> background task; hits, misses और बचा हुआ समय गिनता है"""
+
+    def __init__(self, ttl: float = None):
+        self.ttl = prefetch_ttl_s() if ttl is None else ttl
+        self._entries = {}
+        self.started = 0
+        self.hits = 0
+        self.misses = 0
+        self.cancelled = 0
+        self.unused = 0
+        self.failed = 0  # fail हुए prefetches - tool ने func दोबारा चलाया
+        self.saved_ms = 0.0
+
+    def start(self, kind: str, key, func, *args) -> asyncio.Task:
+        """func(*args) को thread में शुरू करता है (idempotent - वही key दोबारा शुरू नहीं होती)"""
+        entry = self._fresh(kind, key)
+        if entry is not None:
+            return entry.task
+        task = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        entry = self._entries[(kind, key)] = _Entry(task, time.perf_counter())
+        task.add_done_callback(lambda _: setattr(entry, "finished", time.perf_counter()))
+        self.started += 1
+        return task
+
+    def _fresh(self, kind: str, key):
+        entry = self._entries.get((kind, key))
+        if entry is None:
+            return None
+        if entry.task.cancelled() or time.perf_counter() - entry.started > self.ttl:
+            self._drop(kind, key, entry)
+            return None
+        return entry
+
+    def _drop(self, kind: str, key, entry: _Entry):
+        del self._entries[(kind, key)]
+        if entry.used:
+            return
+        if entry.task.done():
+            self.unused += 1
+        else:
+            # Thread में चल रहा काम रुकता नहीं, लेकिन उसका result अब कोई नहीं लेगा
+            entry.task.cancel()
+            self.cancelled += 1
+
+    async def fetch(self, kind: str, key, func, *args):
+        """
+        Prefetch हुआ हो तो उसका result (hit), वरना func(*args) अभी thread में (miss)।
+        Prefetch fail हुआ हो तो उसका error tool तक नहीं जाता - entry हटती है और func नए सिरे से चलता है
+        """
+        entry = self._fresh(kind, key)
+        if entry is not None:
+            requested = time.perf_counter()
+            entry.used = True  # इंतज़ार के बीच नया turn आए तो भी यह task cancel न हो
+            try:
+                result = await asyncio.shield(entry.task)
+            except asyncio.CancelledError:
+                if not entry.task.cancelled():
+                    raise  # Tool call खुद cancel हुआ
+            except Exception:
+                pass
+            else:
+                self.hits += 1
+                # Tool call से पहले background में जितना काम हो चुका था, उतना समय बचा
+                self.saved_ms += (min(requested, entry.finished or requested) - entry.started) * 1000
+                return result
+            # केवल सफल results cache में रहते हैं - retry पर वही पुराना error नहीं मिलेगा
+            if self._entries.get((kind, key)) is entry:
+                del self._entries[(kind, key)]
+            self.failed += 1
+        self.misses += 1
+        return await asyncio.to_thread(func, *args)
+
+    def discard(self, *kinds: str):
+        """इन kinds के prefetches हटाता है - जैसे memory में नई entry लिखने के बाद पुराने reads"""
+        for (kind, key), entry in list(self._entries.items()):
+            if kind in kinds:
+                self._drop(kind, key, entry)
+
+    def new_turn(self):
+        """नया user turn - पिछले turn के बिना इस्तेमाल हुए prefetches हटते/cancel होते हैं"""
+        for (kind, key), entry in list(self._entries.items()):
+            self._drop(kind, key, entry)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "started": self.started,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "cancelled": self.cancelled,
+            "unused": self.unused,
+            "failed": self.failed,
+            "saved_ms": round(self.saved_ms, 1),
+        }
+
+    async def log_report(self):
+        """Shutdown callback - hit rate और बचा हुआ समय print करता है"""
+        self.new_turn()
+        stats = self.stats()
+        print(f"🔮 Prefetch: {stats['hits']}/{stats['hits'] + stats['misses']} hits "
+              f"(hit rate {stats['hit_rate']:.0%}), saved {stats['saved_ms']} ms, "
+              f"{stats['cancelled']} cancelled, {stats['unused']} unused, {stats['failed']} failed")
+
+
+def text_key(text: str) -> str:
+    """City/query जैसे text args की cache key - case और extra spaces से फर्क नहीं पड़ता"""
+    return " ".join(str(text).lower().split())
+
+
+async def prefetched(kind: str, key, func, *args):
+    """Tools यही बुलाते हैं: इस session का prefetch cache हो तो उससे, वरना सीधे (thread में)"""
+    cache = current_prefetch.get()
+    if cache is None:
+        return await asyncio.to_thread(func, *args)
+    return await cache.fetch(kind, key, func, *args)
+
+
+def discard_prefetched(*kinds: str):
+    """इस session के prefetch cache से इन kinds के (अब पुराने) results हटाता है"""
+    cache = current_prefetch.get()
+    if cache is not None:
+        cache.discard(*kinds)
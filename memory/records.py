@@ -0,0 +1,129 @@
+"""
+Conversation Records - compact in-memory turn type.
+
+Storage (SQLite rows / JSONL) में turn {"speaker", "text", "ts", "epoch"} ही रहता है, लेकिन
+RAM में (cache, search/relevance/time indexes, summarizer) हर turn एक __slots__ वाला Turn है:
+- speaker: Speaker enum - "User"/"user"/"आप" जैसे labels एक ही singleton बन जाते हैं; अनजान
+  labels (जैसे "Purvansh") मूल नाम की interned string ही रहते हैं और storage में वैसे ही लिखे जाते हैं
+- text: str
+- time_us: integer epoch microseconds - ISO string नहीं रखी जाती, ज़रूरत पर बनती है
+
+लाखों turns वाली history में हर dict (4 keys + अलग ts/speaker strings) के मुकाबले इसकी
+memory कई गुना कम है।
+"""
+import sys
+import time
+from datetime import datetime
+from enum import Enum
+
+from memory.time_index import to_epoch
+
+_US = 1_000_000
+
+
+class Speaker(str, Enum):
+    """Canonical speaker; str होने से Speaker.USER == "user" भी सही रहता है"""
+    USER = "user"
+    JARVIS = "jarvis"
+    OTHER = "other"
+
+    def __str__(self):
+        return self.value
+
+    @classmethod
+    def parse(cls, label):
+        """Known alias -> Speaker; बाकी labels का मूल नाम (interned str) - खाली हो तो OTHER"""
+        if isinstance(label, cls):
+            return label
+        raw = str(label or "").strip()
+        speaker = _SPEAKER_ALIASES.get(raw.lower())
+        if speaker is not None:
+            return speaker
+        return sys.intern(raw) if raw else cls.OTHER
+
+
+_SPEAKER_ALIASES = {
+    "user": Speaker.USER, "you": Speaker.USER, "human": Speaker.USER, "आप": Speaker.USER,
+    "jarvis": Speaker.JARVIS, "assistant": Speaker.JARVIS, "agent": Speaker.JARVIS,
+    "जार्विस": Speaker.JARVIS, "other": Speaker.OTHER,
+}
+
+
+def speaker_name(speaker) -> str:
+    """दिखाने के लिए नाम: "आप" / "जार्विस" / मूल label (जैसे "Purvansh")"""
+    if speaker is Speaker.USER:
+        return "आप"
+    if speaker is Speaker.JARVIS:
+        return "जार्विस"
+    if speaker is Speaker.OTHER:
+        return "कोई और"
+    return str(speaker)
+
+
+def _micros(ts: str) -> int:
+    """ISO string का fractional हिस्सा ("...T10:00:00.123456") microseconds में"""
+    if len(ts) > 20 and ts[19] == ".":
+        digits = ts[20:26]
+        if digits.isdigit():
+            return int(digits.ljust(6, "0"))
+    return 0
+
+
+class Turn:
+    """एक बातचीत turn - speaker, text और integer timestamp (epoch microseconds)"""
+
+    __slots__ = ("speaker", "text", "time_us")
+
+    def __init__(self, speaker, text: str, time_us: int):
+        self.speaker = speaker
+        self.text = text
+        self.time_us = time_us
+
+    @classmethod
+    def now(cls, speaker, text: str) -> "Turn":
+        return cls(Speaker.parse(speaker), str(text), time.time_ns() // 1000)
+
+    @classmethod
+    def from_fields(cls, speaker, text, ts, epoch) -> "Turn":
+        """Storage row (speaker, text, ts, epoch) से; epoch न हो तो ts parse होता है"""
+        ts = str(ts or "")
+        epoch = int(epoch or 0) or to_epoch(ts)
+        return cls(Speaker.parse(speaker), str(text or ""), epoch * _US + _micros(ts) if epoch else 0)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Turn":
+        return cls.from_fields(data.get("speaker"), data.get("text"), data.get("ts"), data.get("epoch"))
+
+    @property
+    def epoch(self) -> int:
+        return self.time_us // _US
+
+    @property
+    def ts(self) -> str:
+        """Local-time ISO string (datetime.now().isoformat() जैसी); timestamp न हो तो "" """
+        if not self.time_us:
+            return ""
+        moment = datetime.fromtimestamp(self.epoch).replace(microsecond=self.time_us % _US)
+        return moment.isoformat()
+
+    def to_dict(self) -> dict:
+        """Storage / JSON के लिए पुराना schema"""
+        return {"speaker": str(self.speaker), "text": self.text, "ts": self.ts, "epoch": self.epoch}
+
+    def __eq__(self, other):
+        if not isinstance(other, Turn):
+            return NotImplemented
+        return (self.time_us, self.speaker, self.text) == (other.time_us, other.speaker, other.text)
+
+    def __hash__(self):
+        return hash((self.time_us, self.speaker, self.text))
+
+    def __repr__(self):
+        return f"Turn({str(self.speaker)!r}, {self.text!r}, {self.ts!r})"
+
+
+def normalize_turn(turn) -> Turn:
+    """Turn या पुराना dict -> Turn (हर backend और cache के लिए एक ही in-memory schema)"""
+    if isinstance(turn, Turn):
+        return turn
+    return Turn.from_dict(turn)
@@ -0,0 +1,118 @@
+"""
+Relevance Ranker - local TF-IDF similarity over conversation turns.
+
+हर turn का sparse TF-IDF vector (term id -> weight) एक बार बनकर cache होता है और postings
+arrays में रखा जाता है; नई बातचीत append होने पर केवल उसका vector जुड़ता है।
+Query आने पर cosine similarity से सबसे मिलते-जुलते turns चुने जाते हैं।
+
+NumPy मौजूद हो और query के शब्दों की postings बड़ी हों तो scores vectorized (bincount)
+निकलते हैं; छोटी postings या NumPy न होने पर वही गणना pure Python में होती है। NumPy पहली
+ऐसी query पर ही import होता है - agent startup पर नहीं।
+"""
+import functools
+import heapq
+import math
+from array import array
+
+from memory.matching import tokenize
+
+# इससे कम postings पर NumPy arrays बनाने का खर्च pure Python loop से ज़्यादा पड़ता है
+NUMPY_MIN_POSTINGS = 20_000
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """NumPy module, या न हो तो None"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class RelevanceRanker:
+    """Turns पर incremental TF-IDF index; doc id = turn का append क्रम"""
+
+    def __init__(self, turns=()):
+        self._docs = []
+        self._vocab = {}           # term -> term id
+        self._df = array("I")      # term id -> कितने turns में आया
+        self._postings = {}        # term id -> (array doc ids, array weights)
+        self._norms = array("d")   # doc id -> vector norm (insert के समय के idf से)
+        self.add_many(turns)
+
+    def __len__(self):
+        return len(self._docs)
+
+    def _idf(self, term_id: int) -> float:
+        return math.log((1 + len(self._docs)) / (1 + self._df[term_id])) + 1.0
+
+    def add(self, turn):
+        """Turn का sublinear-tf vector बनाकर postings में जोड़ता है"""
+        doc_id = len(self._docs)
+        self._docs.append(turn)
+
+        counts = {}
+        for token in tokenize(turn.text):
+            counts[token] = counts.get(token, 0) + 1
+
+        norm = 0.0
+        for token, count in counts.items():
+            term_id = self._vocab.get(token)
+            if term_id is None:
+                term_id = self._vocab[token] = len(self._df)
+                self._df.append(0)
+                self._postings[term_id] = (array("I"), array("d"))
+            self._df[term_id] += 1
+            weight = 1.0 + math.log(count)
+            doc_ids, weights = self._postings[term_id]
+            doc_ids.append(doc_id)
+            weights.append(weight)
+            norm += (weight * self._idf(term_id)) ** 2
+        self._norms.append(math.sqrt(norm) or 1.0)
+
+    def add_many(self, turns):
+        for turn in turns:
+            self.add(turn)
+
+    def rank(self, query: str, limit: int = 5) -> list:
+        """Query से सबसे मिलते-जुलते turns, (score, doc_id, turn) के रूप में, सबसे अच्छे पहले"""
+        n_docs = len(self._docs)
+        if not n_docs or limit <= 0:
+            return []
+
+        query_weights = {}
+        for token in tokenize(query):
+            term_id = self._vocab.get(token)
+            if term_id is not None:
+                query_weights[term_id] = query_weights.get(term_id, 0) + 1
+        if not query_weights:
+            return []
+
+        touched = sum(len(self._postings[term_id][0]) for term_id in query_weights)
+        np = _numpy() if touched >= NUMPY_MIN_POSTINGS else None
+        if np is not None:
+            scores = np.zeros(n_docs)
+            for term_id, count in query_weights.items():
+                doc_ids, weights = self._postings[term_id]
+                factor = (1.0 + math.log(count)) * self._idf(term_id) ** 2
+                scores += np.bincount(np.frombuffer(doc_ids, dtype=np.uint32),
+                                      weights=np.frombuffer(weights, dtype=np.float64) * factor,
+                                      minlength=n_docs)
+            scores /= np.frombuffer(self._norms, dtype=np.float64)
+            k = min(limit, int(np.count_nonzero(scores)))
+            if k == 0:
+                return []
+            top = np.argpartition(-scores, k - 1)[:k]
+            best = sorted(((float(scores[i]), int(i)) for i in top), reverse=True)
+        else:
+            scores = {}
+            for term_id, count in query_weights.items():
+                doc_ids, weights = self._postings[term_id]
+                factor = (1.0 + math.log(count)) * self._idf(term_id) ** 2
+                for doc_id, weight in zip(doc_ids, weights):
+                    scores[doc_id] = scores.get(doc_id, 0.0) + weight * factor
+            best = heapq.nlargest(limit, ((score / self._norms[doc_id], doc_id)
+                                          for doc_id, score in scores.items()))
+
+        return [(score, doc_id, self._docs[doc_id]) for score, doc_id in best]
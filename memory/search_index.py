@@ -0,0 +1,99 @@
+"""
+Conversation Search Index - in-memory inverted index with BM25 ranking.
+
+हर stored turn के tokens का postings list (doc ids + term frequency) रखा जाता है।
+नई बातचीत append होते ही index में जुड़ जाती है, पूरा index दोबारा नहीं बनता।
+
+बहुत आम शब्दों (जैसे "है", "the") की postings लाखों में हो सकती हैं; उन्हें पूरा scan करने के
+बजाय केवल दुर्लभ शब्दों से मिले candidates पर score किया जाता है, और अगर सभी शब्द आम हों
+तो केवल सबसे नई MAX_POSTINGS_SCAN postings देखी जाती हैं। इससे हर query का समय सीमित रहता है।
+"""
+import heapq
+import math
+from array import array
+from bisect import bisect_left
+
+from memory.matching import tokenize
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_POSTINGS_SCAN = 5_000
+
+
+class ConversationSearchIndex:
+    """Turns पर BM25 full-text index; doc id = turn का append क्रम (0 से शुरू)"""
+
+    def __init__(self, turns=()):
+        self._docs = []                 # doc id -> turn
+        self._doc_lengths = array("I")  # doc id -> token count
+        self._postings = {}             # term -> (array doc ids, array term freqs)
+        self._total_length = 0
+        self.add_many(turns)
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, turn):
+        """एक turn को index में जोड़ता है - O(turn के tokens)"""
+        doc_id = len(self._docs)
+        tokens = tokenize(turn.text)
+        self._docs.append(turn)
+        self._doc_lengths.append(len(tokens))
+        self._total_length += len(tokens)
+
+        freqs = {}
+        for token in tokens:
+            freqs[token] = freqs.get(token, 0) + 1
+        for token, tf in freqs.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = (array("I"), array("I"))
+            postings[0].append(doc_id)
+            postings[1].append(tf)
+
+    def add_many(self, turns):
+        for turn in turns:
+            self.add(turn)
+
+    def search(self, query: str, limit: int = 5) -> list:
+        """BM25 के हिसाब से सबसे relevant turns, (score, turn) के रूप में, सबसे अच्छे पहले"""
+        n_docs = len(self._docs)
+        if not n_docs or limit <= 0:
+            return []
+
+        terms = [t for t in dict.fromkeys(tokenize(query)) if t in self._postings]
+        if not terms:
+            return []
+        # दुर्लभ शब्द पहले - वही candidates तय करते हैं
+        terms.sort(key=lambda t: len(self._postings[t][0]))
+
+        avg_length = self._total_length / n_docs or 1.0
+        lengths = self._doc_lengths
+        scores = {}
+        for term in terms:
+            doc_ids, tfs = self._postings[term]
+            df = len(doc_ids)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+            if df > MAX_POSTINGS_SCAN and scores:
+                # आम शब्द: केवल पहले से मिले candidates का score बढ़ाएँ
+                for doc_id in scores:
+                    i = bisect_left(doc_ids, doc_id)
+                    if i < df and doc_ids[i] == doc_id:
+                        scores[doc_id] += idf * _bm25_tf(tfs[i], lengths[doc_id], avg_length)
+                continue
+
+            start = max(0, df - MAX_POSTINGS_SCAN)
+            for i in range(start, df):
+                doc_id = doc_ids[i]
+                score = idf * _bm25_tf(tfs[i], lengths[doc_id], avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+        # बराबर score पर नई बातचीत पहले
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+        return [(score, self._docs[doc_id]) for doc_id, score in best]
+
+
+def _bm25_tf(tf: int, doc_length: int, avg_length: float) -> float:
+    return tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * doc_length / avg_length))
+
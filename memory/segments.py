@@ -0,0 +1,212 @@
+"""
+Segmented Journal - per-day conversation segments with compaction and cold compression.
+
+बातचीत अब एक ही फाइल में हमेशा के लिए नहीं बढ़ती। हर दिन (या SEGMENT_MAX_BYTES पार होने पर)
+एक नया segment शुरू होता है:
+- आज का segment "hot" है: साधारण JSONL, append-only (memory/journal.py)
+- पुराने segments "cold" हैं: compaction (खराब lines हटाकर) के बाद gzip में compressed
+
+manifest.json हर cold segment का नाम, फाइल, record count और epoch range रखता है, ताकि
+time-range queries केवल उन्हीं segments को खोलें (और decompress करें) जिनकी range मेल खाती है।
+"""
+import gzip
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime
+
+from memory.journal import ConversationJournal, MEMORY_DIR, _decode_line
+
+SEGMENTS_DIR = os.path.join(MEMORY_DIR, "conversation")
+SEGMENT_MAX_BYTES = int(os.getenv("JARVIS_SEGMENT_MAX_BYTES", 8 * 1024 * 1024))
+COLD_CACHE_SEGMENTS = 4  # कितने decompressed cold segments RAM में रखे जाएँ
+
+
+def _day_of(entry: dict) -> str:
+    epoch = entry.get("epoch")
+    moment = datetime.fromtimestamp(epoch) if epoch else datetime.now()
+    return moment.date().isoformat()
+
+
+class SegmentedJournal:
+    """Hot JSONL segment + gzip cold segments, manifest.json के साथ"""
+
+    def __init__(self, directory: str = SEGMENTS_DIR):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        os.makedirs(directory, exist_ok=True)
+        self._manifest = self._load_manifest()
+        self._hot = None
+        self._hot_count = 0
+        self._cold_cache = OrderedDict()  # segment name -> decoded records
+        hot_name = self._manifest.get("hot")
+        if hot_name:
+            # पिछले दिन का hot segment अगले append पर cold होता है (writes केवल lock के अंदर)
+            self._hot = ConversationJournal(self._path(hot_name + ".jsonl"))
+            self._hot_count = len(self._hot.read_all())
+
+    # --- Manifest ---
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.directory, filename)
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"version": 1, "hot": None, "segments": []}
+
+    def _save_manifest(self):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.manifest_path)
+
+    def hot_path(self) -> str:
+        return self._hot.path if self._hot is not None else ""
+
+    # --- Writing ---
+    def _new_hot_name(self, day: str) -> str:
+        used = {seg["name"] for seg in self._manifest["segments"]}
+        seq = 0
+        while f"{day}-{seq:03d}" in used:
+            seq += 1
+        return f"{day}-{seq:03d}"
+
+    def append(self, entry: dict):
+        """Entry को hot segment में जोड़ता है; दिन बदलने या size सीमा पार होने पर नया segment"""
+        day = _day_of(entry)
+        if self._hot is not None:
+            hot_name = self._manifest["hot"]
+            too_big = os.path.exists(self._hot.path) and os.path.getsize(self._hot.path) >= SEGMENT_MAX_BYTES
+            if day > hot_name[:10] or too_big:
+                self._roll()
+        if self._hot is None:
+            name = self._new_hot_name(day)
+            self._manifest["hot"] = name
+            self._save_manifest()
+            self._hot = ConversationJournal(self._path(name + ".jsonl"))
+        self._hot.append(entry)
+        self._hot_count += 1
+
+    def _roll(self):
+        """Hot segment को compact + gzip करके cold बनाता है और manifest अपडेट करता है"""
+        name = self._manifest["hot"]
+        records = self._hot.read_all()
+        self._hot.close()
+        if records:
+            epochs = [r.get("epoch") or 0 for r in records]
+            filename = name + ".jsonl.gz"
+            tmp_path = self._path(filename + ".tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self._path(filename))
+            self._manifest["segments"].append({
+                "name": name,
+                "file": filename,
+                "count": len(records),
+                "min_epoch": min(epochs),
+                "max_epoch": max(epochs),
+            })
+        self._manifest["hot"] = None
+        self._save_manifest()
+        if os.path.exists(self._hot.path):
+            os.remove(self._hot.path)
+        self._hot = None
+        self._hot_count = 0
+
+    def import_entries(self, entries):
+        """पुरानी single-file journal को segments में बाँटता है (एक बार का migration)"""
+        for entry in entries:
+            self.append(entry)
+        self._save_manifest()
+
+    # --- Reading ---
+    def _read_cold(self, segment: dict) -> list:
+        """Cold segment को lazily decompress करता है; हाल में पढ़े segments RAM में रहते हैं"""
+        records = self._cold_cache.get(segment["name"])
+        if records is not None:
+            self._cold_cache.move_to_end(segment["name"])
+            return records
+        records = []
+        with gzip.open(self._path(segment["file"]), "rt", encoding="utf-8") as f:
+            for line in f:
+                record = _decode_line(line)
+                if record is not None:
+                    records.append(record)
+        self._cold_cache[segment["name"]] = records
+        while len(self._cold_cache) > COLD_CACHE_SEGMENTS:
+            self._cold_cache.popitem(last=False)
+        return records
+
+    def iter_all(self):
+        """सभी records, पुराने से नए क्रम में"""
+        for segment in self._manifest["segments"]:
+            yield from self._read_cold(segment)
+        if self._hot is not None:
+            yield from self._hot.read_all()
+
+    def iter_from(self, offset: int):
+        """offset के बाद के records; पूरी तरह छूटने वाले cold segments decompress नहीं होते"""
+        for segment in self._manifest["segments"]:
+            if offset >= segment["count"]:
+                offset -= segment["count"]
+                continue
+            yield from self._read_cold(segment)[offset:]
+            offset = 0
+        if self._hot is not None:
+            yield from self._hot.read_all()[offset:]
+
+    def slice(self, start: int, stop: int) -> list:
+        """Records [start, stop) - केवल उस range को छूने वाले segments पढ़े/decompress होते हैं"""
+        records, offset = [], 0
+        for segment in self._manifest["segments"]:
+            count = segment["count"]
+            if offset + count > start and offset < stop:
+                records.extend(self._read_cold(segment)[max(0, start - offset):stop - offset])
+            offset += count
+            if offset >= stop:
+                return records
+        if self._hot is not None and stop > offset:
+            records.extend(self._hot.read_all()[max(0, start - offset):stop - offset])
+        return records
+
+    def iter_reverse(self):
+        """Records नए से पुराने क्रम में; पुराने segments तभी खुलते हैं जब caller वहाँ तक पहुँचे"""
+        if self._hot is not None:
+            yield from self._hot.iter_reverse()
+        for segment in reversed(self._manifest["segments"]):
+            yield from reversed(self._read_cold(segment))
+
+    def read_last(self, limit: int) -> list:
+        if limit <= 0:
+            return []
+        records = []
+        for record in self.iter_reverse():
+            records.append(record)
+            if len(records) >= limit:
+                break
+        records.reverse()
+        return records
+
+    def between(self, start: int, end: int) -> list:
+        """Epoch range [start, end) के records - केवल overlap करने वाले segments पढ़े जाते हैं"""
+        records = []
+        for segment in self._manifest["segments"]:
+            if segment["max_epoch"] < start or segment["min_epoch"] >= end:
+                continue
+            records.extend(r for r in self._read_cold(segment) if start <= (r.get("epoch") or 0) < end)
+        if self._hot is not None:
+            records.extend(r for r in self._hot.read_all() if start <= (r.get("epoch") or 0) < end)
+        return records
+
+    def count(self) -> int:
+        return sum(segment["count"] for segment in self._manifest["segments"]) + self._hot_count
+
+    def close(self):
+        if self._hot is not None:
+            self._hot.close()
@@ -0,0 +1,168 @@
+"""
+Memory Shards - per-room / per-participant memory namespaces.
+
+एक LiveKit worker कई rooms (sessions) एक साथ चला सकता है। हर namespace (room या participant)
+का अपना shard है: अलग directory, अलग store + cache, अलग background writer और summary -
+इसलिए एक session के writes दूसरे session को रोकते नहीं।
+
+कौन सा shard इस्तेमाल हो, यह current_shard (contextvars) तय करता है; entrypoint इसे
+session शुरू होने से पहले set करता है, और उस session के सभी tasks/threads को यही value मिलती है।
+लंबे समय तक idle shards RAM से हटा दिए जाते हैं (writer flush करके) और अगली ज़रूरत पर फिर खुलते हैं।
+जो shard इस्तेमाल में है (कोई session या summary compactor उसे hold किए है, या writer में अनलिखी
+entries हैं) वह idle होने पर भी नहीं हटता - उसकी store किसी के हाथ में रहते बंद नहीं होती।
+"""
+import contextlib
+import contextvars
+import hashlib
+import os
+import re
+import threading
+import time
+
+from memory.cache import CachedMemoryStore
+from memory.context_view import RecentContextView, RECENT_CONTEXT_FILE
+from memory.journal import MEMORY_DIR
+from memory.storage import open_store, MEMORY_BACKEND
+from memory.summarizer import RollingSummary
+from memory.writer import MemoryWriter
+
+DEFAULT_SHARD = "default"
+SHARD_BY = os.getenv("JARVIS_MEMORY_SHARD_BY", "none").lower()  # none, room, participant
+SHARD_IDLE_SECONDS = float(os.getenv("JARVIS_SHARD_IDLE_S", 600))
+SHARDS_DIR = "shards"
+
+current_shard = contextvars.ContextVar("jarvis_memory_shard", default=DEFAULT_SHARD)
+
+
+def shard_name_for(room: str = "", participant: str = "", shard_by: str = SHARD_BY) -> str:
+    """SHARD_BY के हिसाब से namespace; जानकारी न हो तो DEFAULT_SHARD"""
+    if shard_by == "participant" and participant:
+        return participant
+    if shard_by == "room" and room:
+        return room
+    return DEFAULT_SHARD
+
+
+def _directory_name(name: str) -> str:
+    """Filesystem-safe नाम; hash से अलग-अलग names कभी एक directory में नहीं मिलते"""
+    safe = re.sub(r"[^\w.-]", "_", name)[:48]
+    return f"{safe}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]}"
+
+
+class Shard:
+    """एक namespace की store, writer, recent-context view और summary"""
+
+    def __init__(self, name: str, directory: str, backend: str):
+        self.name = name
+        self.directory = directory
+        self.store = CachedMemoryStore(open_store(backend, directory))
+        self.recent_view = RecentContextView(os.path.join(directory, RECENT_CONTEXT_FILE))
+        self.store.add_listener(self.recent_view)
+        self.writer = MemoryWriter(self.store.append_turns)
+        self.last_used = time.monotonic()
+        self.users = 0  # ShardManager.acquire()/holding() से - इनके रहते shard evict नहीं होता
+        self._summary = None
+
+    @property
+    def summary(self) -> RollingSummary:
+        if self._summary is None:
+            self._summary = RollingSummary(os.path.join(self.directory, "summary.json"))
+        return self._summary
+
+    def busy(self) -> bool:
+        return self.users > 0 or self.writer.unwritten() > 0
+
+    def close(self):
+        self.writer.close()
+        self.store.close()
+
+
+class ShardManager:
+    """Shards को lazily खोलता है और idle shards को हटाता है"""
+
+    def __init__(self, root: str = MEMORY_DIR, backend: str = MEMORY_BACKEND,
+                 idle_seconds: float = SHARD_IDLE_SECONDS):
+        self.root = root
+        self.backend = backend
+        self.idle_seconds = idle_seconds
+        self._shards = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def directory_for(self, name: str) -> str:
+        # Default shard पुरानी जगह (memory/) पर ही रहता है, ताकि मौजूदा memory वैसी ही मिले
+        if name == DEFAULT_SHARD:
+            return self.root
+        return os.path.join(self.root, SHARDS_DIR, _directory_name(name))
+
+    def get(self, name: str = None, acquire: bool = False) -> Shard:
+        """
+        Shard (current_shard अगर name न दिया हो); पहली बार इस्तेमाल पर खुलता है।
+        acquire=True हो तो release() तक shard evict नहीं होगा
+        """
+        name = name or current_shard.get()
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            shard = self._shards.get(name)
+            if shard is None:
+                shard = self._shards[name] = Shard(name, self.directory_for(name), self.backend)
+            shard.last_used = now
+            if acquire:
+                shard.users += 1
+            if now - self._last_sweep > min(60.0, self.idle_seconds):
+                self._last_sweep = now
+                evicted = self._pop_idle(now)
+        for idle in evicted:
+            idle.close()
+        return shard
+
+    def acquire(self, name: str = None) -> Shard:
+        """Session भर के लिए shard - जब तक release() न हो, idle eviction इसे बंद नहीं करता"""
+        return self.get(name, acquire=True)
+
+    def release(self, shard: Shard):
+        with self._lock:
+            shard.users -= 1
+            shard.last_used = time.monotonic()  # Idle समय आखिरी user के जाने से गिना जाता है
+
+    @contextlib.contextmanager
+    def holding(self, shard: Shard):
+        """
+        पहले से खुले shard पर काम (जैसे summary compactor) के दौरान eviction रोकता है।
+        Shard इस बीच evict हो चुका हो तो None मिलता है - उसकी store बंद है
+        """
+        with self._lock:
+            alive = self._shards.get(shard.name) is shard
+            if alive:
+                shard.users += 1
+        try:
+            yield shard if alive else None
+        finally:
+            if alive:
+                self.release(shard)
+
+    def active(self) -> list:
+        with self._lock:
+            return list(self._shards.values())
+
+    def _pop_idle(self, now: float) -> list:
+        idle = [s for s in self._shards.values() if now - s.last_used > self.idle_seconds and not s.busy()]
+        for shard in idle:
+            del self._shards[shard.name]
+        return idle
+
+    def evict_idle(self) -> list:
+        """Idle shards को flush करके बंद करता है; Returns: हटाए गए shard names"""
+        with self._lock:
+            idle = self._pop_idle(time.monotonic())
+        for shard in idle:
+            shard.close()
+        return [shard.name for shard in idle]
+
+    def close_all(self):
+        with self._lock:
+            shards = list(self._shards.values())
+            self._shards.clear()
+        for shard in shards:
+            shard.close()
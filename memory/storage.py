@@ -0,0 +1,575 @@
+"""
+Memory Storage - pluggable storage backends for Jarvis memory.
+
+MemoryStore एक छोटा interface है जिसे jarvis_memory.py के सभी functions और tools इस्तेमाल करते हैं।
+दो implementations हैं:
+- SQLiteMemoryStore (default): WAL mode, facts और conversation turns के लिए अलग tables,
+  turns पर FTS5 full-text index (bm25 ranking) जो disk पर रहता है
+- JournalMemoryStore: रोज़ाना JSONL segments (पुराने gzip में) + facts snapshot (memory/segments.py)
+
+Backend को JARVIS_MEMORY_BACKEND environment variable ("sqlite" या "jsonl") से चुना जा सकता है।
+
+दोनों backends हर write को memory.lock (cross-process advisory lock) के अंदर करते हैं और
+memory.gen का generation counter बढ़ाते हैं; signature() यही counter है (memory/locking.py)।
+"""
+import contextlib
+import itertools
+import os
+import sqlite3
+import threading
+import time
+
+from memory.facts import FactTable, expiry_for, MAX_FACTS
+from memory.matching import FactIndex, tokenize
+from memory.relevance import RelevanceRanker
+from memory.search_index import ConversationSearchIndex, MAX_POSTINGS_SCAN
+from memory.time_index import TimeIndex, to_epoch
+from memory.journal import (
+    ConversationJournal, load_facts, save_facts, migrate_legacy_memory, read_legacy_memory,
+    MEMORY_DIR, JOURNAL_FILE, FACTS_FILE, LEGACY_MEMORY_FILE,
+)
+from memory.segments import SegmentedJournal, SEGMENTS_DIR
+from memory.locking import InterProcessLock, GenerationCounter
+from memory.records import Turn, normalize_turn
+
+SQLITE_FILE = os.path.join(MEMORY_DIR, "memory.db")
+MEMORY_BACKEND = os.getenv("JARVIS_MEMORY_BACKEND", "sqlite").lower()
+
+
+def _ipc_primitives(directory: str) -> tuple:
+    """Storage directory के लिए (write lock, generation counter)"""
+    return (InterProcessLock(os.path.join(directory, "memory.lock")),
+            GenerationCounter(os.path.join(directory, "memory.gen")))
+
+
+def _row_to_turn(row) -> Turn:
+    return Turn.from_fields(*row)
+
+
+def _fts_tokens(text: str) -> str:
+    """turns_fts में डालने लायक text - tokenize() के tokens, space से जुड़े"""
+    return " ".join(tokenize(text))
+
+
+class MemoryStore:
+    """Storage interface - हर backend इन methods को implement करता है"""
+
+    # True हो तो turns_between storage की अपनी range query है - cache उसके ऊपर RAM index नहीं बनाता
+    INDEXED_RANGE = False
+    # True हो तो search_turns storage का अपना persistent full-text index है - cache RAM में BM25 index नहीं बनाता
+    INDEXED_SEARCH = False
+
+    # --- Facts ---
+    def load_facts(self) -> dict:
+        raise NotImplementedError
+
+    def list_facts(self, limit: int) -> list:
+        """(key, value) pairs, सबसे हाल में इस्तेमाल हुए पहले, अधिकतम limit"""
+        return self.fact_table().most_recent(limit)
+
+    def fact_table(self) -> FactTable:
+        """सभी जीवित तथ्य LRU क्रम और TTL के साथ - caches इसी से बनते हैं"""
+        return FactTable.from_json(self.load_facts())
+
+    def set_fact(self, key: str, value: str, ttl: int = None):
+        """ttl (seconds): None = DEFAULT_FACT_TTL, 0 = कभी expire नहीं"""
+        raise NotImplementedError
+
+    def touch_facts(self, keys: list):
+        """Recall में इस्तेमाल हुए तथ्य - LRU eviction और list_facts के क्रम के लिए"""
+        pass
+
+    def delete_fact(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def replace_facts(self, facts: dict):
+        raise NotImplementedError
+
+    def match_facts(self, query: str) -> list:
+        """Query में आने वाली सभी fact keys, सबसे लंबे match पहले"""
+        return FactIndex(self.load_facts()).match(query)
+
+    # --- Conversation turns ---
+    def append_turn(self, turn: dict):
+        raise NotImplementedError
+
+    def append_turns(self, turns: list):
+        for turn in turns:
+            self.append_turn(turn)
+
+    def iter_turns(self):
+        """सभी turns, पुराने से नए क्रम में"""
+        raise NotImplementedError
+
+    def recent_turns(self, limit: int) -> list:
+        """आखिरी limit turns, पुराने से नए क्रम में"""
+        if limit <= 0:
+            return []
+        return list(self.iter_turns())[-limit:]
+
+    def turns_from(self, offset: int):
+        """offset (0 से शुरू) के बाद के सभी turns - indexes को catch-up कराने के लिए"""
+        return itertools.islice(self.iter_turns(), offset, None)
+
+    def count_turns(self) -> int:
+        return sum(1 for _ in self.iter_turns())
+
+    def turns_before(self, before, limit: int) -> tuple:
+        """
+        Position before (exclusive; None = सबसे नया) से पहले के limit turns, पुराने से नए क्रम में,
+        और अगले (पुराने) page का position - history खत्म हो तो None। Position backend-specific है।
+        """
+        end = self.count_turns() if before is None else before
+        start = max(0, end - limit)
+        return list(itertools.islice(self.iter_turns(), start, end)), (start if start > 0 else None)
+
+    def search_turns(self, query: str, limit: int) -> list:
+        """BM25 full-text search; (score, turn) pairs, सबसे relevant पहले"""
+        return ConversationSearchIndex(self.iter_turns()).search(query, limit)
+
+    def rank_turns(self, query: str, limit: int) -> list:
+        """TF-IDF cosine similarity; (score, position, turn) tuples, सबसे मिलते-जुलते पहले"""
+        return RelevanceRanker(self.iter_turns()).rank(query, limit)
+
+    def turns_between(self, start: int, end: int, limit: int = 0) -> list:
+        """Epoch range [start, end) के turns, समय के क्रम में; limit > 0 हो तो केवल आखिरी limit"""
+        return TimeIndex(self.iter_turns()).between(start, end, limit)
+
+    def signature(self) -> tuple:
+        """Storage का fingerprint (generation counter); बदलने पर caches दोबारा लोड होते हैं"""
+        raise NotImplementedError
+
+    def write_lock(self):
+        """Cross-process write lock; caches इसके अंदर write करके नया signature लेते हैं"""
+        return contextlib.nullcontext()
+
+    def close(self):
+        pass
+
+
+class JournalMemoryStore(MemoryStore):
+    """Segmented JSONL journal backend - आज का segment hot, पुराने gzip (memory/segments.py)"""
+
+    INDEXED_RANGE = True  # manifest की epoch ranges
+
+    def __init__(self, segments_dir: str = SEGMENTS_DIR, facts_path: str = FACTS_FILE):
+        self.segments_dir = segments_dir
+        self.journal = SegmentedJournal(segments_dir)
+        self.facts_path = facts_path
+        self._lock = threading.Lock()
+        self._ipc_lock, self._generation = _ipc_primitives(os.path.dirname(os.path.abspath(facts_path)))
+        self._seen_generation = self._generation.value()
+        self._fact_table = None
+
+    @contextlib.contextmanager
+    def _locked(self, write: bool = False):
+        """
+        Cross-process lock के अंदर चलाता है। किसी और process ने लिखा हो तो manifest और
+        hot segment दोबारा खोले जाते हैं (उसने segment roll किया हो सकता है)।
+        """
+        with self._ipc_lock, self._lock:
+            if self._generation.value() != self._seen_generation:
+                self.journal.close()
+                self.journal = SegmentedJournal(self.segments_dir)
+                self._fact_table = None
+            yield
+            if write:
+                self._generation.bump()
+            self._seen_generation = self._generation.value()
+
+    def _facts(self) -> FactTable:
+        """facts.json की FactTable (lock के अंदर बुलाएँ); किसी और process के write पर दोबारा पढ़ी जाती है"""
+        if self._fact_table is None:
+            self._fact_table = FactTable.from_json(load_facts(self.facts_path))
+        return self._fact_table
+
+    def _save_facts(self):
+        save_facts(self._fact_table.to_json(), self.facts_path)
+
+    def load_facts(self) -> dict:
+        with self._locked():
+            return self._facts().items()
+
+    def list_facts(self, limit: int) -> list:
+        with self._locked():
+            return self._facts().most_recent(limit)
+
+    def fact_table(self) -> FactTable:
+        with self._locked():
+            return FactTable.from_json(self._facts().to_json())
+
+    def set_fact(self, key: str, value: str, ttl: int = None):
+        with self._locked(write=True):
+            self._facts().set(key, value, ttl)
+            self._save_facts()
+
+    def touch_facts(self, keys: list):
+        with self._locked(write=True):
+            self._facts().touch(keys)
+            self._save_facts()
+
+    def delete_fact(self, key: str) -> bool:
+        with self._locked(write=True):
+            if not self._facts().delete(key):
+                return False
+            self._save_facts()
+            return True
+
+    def replace_facts(self, facts: dict):
+        with self._locked(write=True):
+            self._fact_table = FactTable()
+            for key, value in facts.items():
+                self._fact_table.set(str(key), str(value))
+            self._save_facts()
+
+    def append_turn(self, turn: dict):
+        self.append_turns([turn])
+
+    def append_turns(self, turns: list):
+        with self._locked(write=True):
+            for turn in turns:
+                self.journal.append(normalize_turn(turn).to_dict())
+
+    def iter_turns(self):
+        with self._locked():
+            return iter([normalize_turn(t) for t in self.journal.iter_all()])
+
+    def recent_turns(self, limit: int) -> list:
+        # Hot segment के अंत से seek; पुराने segments तभी खुलते हैं जब limit वहाँ तक पहुँचे
+        with self._locked():
+            return [normalize_turn(t) for t in self.journal.read_last(limit)]
+
+    def turns_from(self, offset: int):
+        with self._locked():
+            return [normalize_turn(t) for t in self.journal.iter_from(offset)]
+
+    def count_turns(self) -> int:
+        with self._locked():
+            return self.journal.count()
+
+    def turns_before(self, before, limit: int) -> tuple:
+        # Position = append क्रम; manifest counts से केवल ज़रूरी segments पढ़े जाते हैं
+        with self._locked():
+            end = self.journal.count() if before is None else min(before, self.journal.count())
+            start = max(0, end - limit)
+            turns = [normalize_turn(t) for t in self.journal.slice(start, end)]
+        return turns, (start if start > 0 else None)
+
+    def turns_between(self, start: int, end: int, limit: int = 0) -> list:
+        # Manifest की epoch ranges से केवल overlap करने वाले segments decompress होते हैं
+        with self._locked():
+            turns = [normalize_turn(t) for t in self.journal.between(start, end)]
+        turns.sort(key=lambda t: t.time_us)
+        return turns[-limit:] if limit > 0 else turns
+
+    def signature(self) -> tuple:
+        return (self._generation.value(),)
+
+    def write_lock(self):
+        return self._ipc_lock
+
+    def close(self):
+        self.journal.close()
+        self._ipc_lock.close()
+        self._generation.close()
+
+
+class SQLiteMemoryStore(MemoryStore):
+    """SQLite backend - WAL mode, indexed turns table, prepared (cached) statements"""
+
+    SCHEMA_VERSION = 4
+    INDEXED_RANGE = True  # idx_turns_epoch
+    INDEXED_SEARCH = True  # turns_fts (FTS5 न हो तो instance पर False)
+
+    _SQL_LIVE_FACT = "(expires_at = 0 OR expires_at > ?)"
+    _SQL_LOAD_FACTS = f"SELECT key, value FROM facts WHERE {_SQL_LIVE_FACT} ORDER BY last_used, rowid"
+    _SQL_LIST_FACTS = (f"SELECT key, value FROM facts WHERE {_SQL_LIVE_FACT} "
+                       "ORDER BY last_used DESC, rowid DESC LIMIT ?")
+    _SQL_FACT_RECORDS = (f"SELECT key, value, expires_at, last_used, hits FROM facts WHERE {_SQL_LIVE_FACT} "
+                         "ORDER BY last_used, rowid")
+    # last_used (epoch ms) हमेशा सबसे बड़े मौजूदा मान से आगे रहता है, ताकि एक ही ms के
+    # writes में भी LRU क्रम ठीक रहे (idx_facts_last_used से MAX O(log n) है)
+    _SQL_NEXT_USE = "max(?, (SELECT COALESCE(MAX(last_used), 0) + 1 FROM facts))"
+    _SQL_SET_FACT = ("INSERT INTO facts (key, value, updated_at, last_used, expires_at) "
+                     f"VALUES (?, ?, datetime('now'), {_SQL_NEXT_USE}, ?) "
+                     "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at, "
+                     "last_used = excluded.last_used, expires_at = excluded.expires_at")
+    _SQL_TOUCH_FACT = f"UPDATE facts SET last_used = {_SQL_NEXT_USE}, hits = hits + 1 WHERE key = ?"
+    _SQL_DELETE_FACT = "DELETE FROM facts WHERE key = ?"
+    _SQL_CLEAR_FACTS = "DELETE FROM facts"
+    _SQL_PURGE_EXPIRED = "DELETE FROM facts WHERE expires_at > 0 AND expires_at <= ?"
+    _SQL_EVICT_LRU = ("DELETE FROM facts WHERE rowid IN (SELECT rowid FROM facts ORDER BY last_used, rowid "
+                      "LIMIT max(0, (SELECT COUNT(*) FROM facts) - ?))")
+    _SQL_APPEND_TURN = "INSERT INTO turns (speaker, text, ts, epoch) VALUES (?, ?, ?, ?)"
+    _SQL_ITER_TURNS = "SELECT speaker, text, ts, epoch FROM turns ORDER BY id"
+    _SQL_RECENT_TURNS = "SELECT speaker, text, ts, epoch FROM turns ORDER BY id DESC LIMIT ?"
+    _SQL_TURNS_FROM = "SELECT speaker, text, ts, epoch FROM turns ORDER BY id LIMIT -1 OFFSET ?"
+    _SQL_TURNS_BETWEEN = ("SELECT speaker, text, ts, epoch FROM turns WHERE epoch >= ? AND epoch < ? "
+                          "ORDER BY epoch DESC, id DESC LIMIT ?")
+    _SQL_COUNT_TURNS = "SELECT COUNT(*) FROM turns"
+    _SQL_TURNS_BEFORE = "SELECT id, speaker, text, ts, epoch FROM turns WHERE id < ? ORDER BY id DESC LIMIT ?"
+    _SQL_HAS_TURNS_BEFORE = "SELECT EXISTS (SELECT 1 FROM turns WHERE id < ?)"
+    # turns_fts contentless है (text दोबारा store नहीं होता): उसमें memory.matching.tokenize के
+    # tokens space से जोड़कर डाले जाते हैं, ताकि हिंदी matras और casefolding RAM index जैसे ही रहें
+    _SQL_CREATE_FTS = ("CREATE VIRTUAL TABLE IF NOT EXISTS turns_fts USING fts5(tokens, content='', "
+                       "tokenize=\"unicode61 remove_diacritics 0 categories 'L* M* N* P* S* Co'\")")
+    _SQL_INDEX_TURN = "INSERT INTO turns_fts (rowid, tokens) VALUES (?, ?)"
+    _SQL_FTS_LAST_ID = "SELECT COALESCE(MAX(rowid), 0) FROM turns_fts"
+    _SQL_UNINDEXED_TURNS = "SELECT id, text FROM turns WHERE id > ? ORDER BY id"
+    # bm25() छोटा = ज़्यादा relevant; बराबर score पर नई बातचीत पहले
+    _SQL_SEARCH_TURNS = ("SELECT bm25(turns_fts), t.speaker, t.text, t.ts, t.epoch FROM turns_fts "
+                         "JOIN turns t ON t.id = turns_fts.rowid WHERE turns_fts MATCH ? AND turns_fts.rowid > ? "
+                         "ORDER BY bm25(turns_fts), turns_fts.rowid DESC LIMIT ?")
+    # शब्द की सबसे नई MAX_POSTINGS_SCAN postings में सबसे पुरानी का rowid; कम postings हों तो कुछ नहीं
+    _SQL_TERM_CUTOFF = "SELECT rowid FROM turns_fts WHERE turns_fts MATCH ? ORDER BY rowid DESC LIMIT 1 OFFSET ?"
+
+    def __init__(self, path: str = SQLITE_FILE):
+        self.path = path
+        self._lock = threading.RLock()
+        # एक ही connection कई threads (tools, background writer) से lock के साथ इस्तेमाल होता है;
+        # sqlite3 हर connection पर compiled statements को cache करता है
+        self._conn = sqlite3.connect(path, check_same_thread=False, cached_statements=64)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._ipc_lock, self._generation = _ipc_primitives(os.path.dirname(os.path.abspath(path)))
+        self.is_new = self._create_schema()
+
+    @contextlib.contextmanager
+    def _writing(self):
+        """Cross-process lock के अंदर transaction; commit के बाद generation counter बढ़ता है"""
+        with self._ipc_lock, self._lock:
+            with self._conn:
+                yield self._conn
+            self._generation.bump()
+
+    def _create_schema(self) -> bool:
+        """Tables और indexes बनाता है; Returns: True अगर database बिल्कुल नया था"""
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS facts (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    last_used INTEGER NOT NULL DEFAULT 0,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    expires_at INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS turns (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    speaker TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    ts TEXT NOT NULL,
+                    epoch INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_turns_ts ON turns (ts);
+                CREATE INDEX IF NOT EXISTS idx_turns_speaker ON turns (speaker, id);
+            """)
+            if 0 < version < 2:
+                self._migrate_v2()
+            if 0 < version < 3:
+                self._migrate_v3()
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_turns_epoch ON turns (epoch)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_facts_last_used ON facts (last_used)")
+            self._create_search_index()
+            if version < self.SCHEMA_VERSION:
+                self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        return version == 0
+
+    def _create_search_index(self):
+        """
+        turns_fts बनाता है और जो turns उसमें नहीं हैं (v3 -> v4 upgrade, या पुराने version के किसी
+        process ने लिखे हों) उन्हें index करता है - सामान्य open पर यह एक MAX(rowid) lookup भर है
+        """
+        try:
+            self._conn.execute(self._SQL_CREATE_FTS)
+        except sqlite3.OperationalError as e:
+            # FTS5 के बिना compile हुआ SQLite - search cache के RAM BM25 index से चलेगी
+            print(f"⚠️ SQLite FTS5 उपलब्ध नहीं ({e}) - conversation search RAM index से होगी")
+            self.INDEXED_SEARCH = False
+            return
+        last_id = self._conn.execute(self._SQL_FTS_LAST_ID).fetchone()[0]
+        rows = self._conn.execute(self._SQL_UNINDEXED_TURNS, (last_id,))
+        self._conn.executemany(self._SQL_INDEX_TURN, ((row_id, _fts_tokens(text)) for row_id, text in rows))
+
+    def _migrate_v2(self):
+        """v1 -> v2: turns में integer epoch column जोड़ता है और पुराने rows के लिए एक बार भरता है"""
+        self._conn.execute("ALTER TABLE turns ADD COLUMN epoch INTEGER NOT NULL DEFAULT 0")
+        rows = self._conn.execute("SELECT id, ts FROM turns").fetchall()
+        self._conn.executemany("UPDATE turns SET epoch = ? WHERE id = ?",
+                               [(to_epoch(ts), row_id) for row_id, ts in rows])
+
+    def _migrate_v3(self):
+        """v2 -> v3: facts में LRU (last_used, hits) और TTL (expires_at) columns"""
+        for column in ("last_used", "hits", "expires_at"):
+            self._conn.execute(f"ALTER TABLE facts ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0")
+
+    def load_facts(self) -> dict:
+        with self._lock:
+            return dict(self._conn.execute(self._SQL_LOAD_FACTS, (int(time.time()),)).fetchall())
+
+    def list_facts(self, limit: int) -> list:
+        # idx_facts_last_used से केवल limit rows पढ़ी जाती हैं
+        with self._lock:
+            return self._conn.execute(self._SQL_LIST_FACTS, (int(time.time()), limit)).fetchall()
+
+    def fact_table(self) -> FactTable:
+        with self._lock:
+            return FactTable.from_records(self._conn.execute(self._SQL_FACT_RECORDS, (int(time.time()),)))
+
+    def _enforce_fact_limits(self, conn, now: int):
+        conn.execute(self._SQL_PURGE_EXPIRED, (now,))
+        conn.execute(self._SQL_EVICT_LRU, (MAX_FACTS,))
+
+    def set_fact(self, key: str, value: str, ttl: int = None):
+        now = time.time()
+        with self._writing() as conn:
+            conn.execute(self._SQL_SET_FACT, (key, value, int(now * 1000), expiry_for(ttl, now)))
+            self._enforce_fact_limits(conn, int(now))
+
+    def touch_facts(self, keys: list):
+        now_ms = int(time.time() * 1000)
+        with self._writing() as conn:
+            conn.executemany(self._SQL_TOUCH_FACT, [(now_ms, key) for key in keys])
+
+    def delete_fact(self, key: str) -> bool:
+        with self._writing() as conn:
+            return conn.execute(self._SQL_DELETE_FACT, (key,)).rowcount > 0
+
+    def replace_facts(self, facts: dict):
+        now = time.time()
+        with self._writing() as conn:
+            conn.execute(self._SQL_CLEAR_FACTS)
+            conn.executemany(self._SQL_SET_FACT, [(str(k), str(v), int(now * 1000), expiry_for(None, now))
+                                                  for k, v in facts.items()])
+            self._enforce_fact_limits(conn, int(now))
+
+    def append_turn(self, turn: dict):
+        self.append_turns([turn])
+
+    def append_turns(self, turns: list):
+        rows = [(str(t.speaker), t.text, t.ts, t.epoch) for t in map(normalize_turn, turns)]
+        with self._writing() as conn:
+            if not self.INDEXED_SEARCH:
+                conn.executemany(self._SQL_APPEND_TURN, rows)
+                return
+            for row in rows:
+                row_id = conn.execute(self._SQL_APPEND_TURN, row).lastrowid
+                conn.execute(self._SQL_INDEX_TURN, (row_id, _fts_tokens(row[1])))
+
+    def iter_turns(self):
+        with self._lock:
+            rows = self._conn.execute(self._SQL_ITER_TURNS).fetchall()
+        return map(_row_to_turn, rows)
+
+    def recent_turns(self, limit: int) -> list:
+        if limit <= 0:
+            return []
+        with self._lock:
+            rows = self._conn.execute(self._SQL_RECENT_TURNS, (limit,)).fetchall()
+        return [_row_to_turn(row) for row in reversed(rows)]
+
+    def turns_between(self, start: int, end: int, limit: int = 0) -> list:
+        # idx_turns_epoch पर B-tree range scan - हर row का ts parse नहीं होता
+        with self._lock:
+            rows = self._conn.execute(self._SQL_TURNS_BETWEEN, (start, end, limit if limit > 0 else -1)).fetchall()
+        return [_row_to_turn(row) for row in reversed(rows)]
+
+    def search_turns(self, query: str, limit: int) -> list:
+        if not self.INDEXED_SEARCH:
+            return super().search_turns(query, limit)
+        # हर शब्द quoted phrase - query के शब्द FTS5 syntax (AND, NOT, *) न बनें
+        phrases = ['"' + term.replace('"', '""') + '"' for term in dict.fromkeys(tokenize(query))]
+        if not phrases or limit <= 0:
+            return []
+        with self._lock:
+            # RAM index जैसा ही: बहुत आम शब्दों (लाखों postings) को पूरा scan नहीं करते। दुर्लभ शब्द
+            # हों तो केवल उन्हीं से match; सभी आम हों तो केवल उनकी सबसे नई postings वाले turns
+            cutoffs = {phrase: self._conn.execute(self._SQL_TERM_CUTOFF, (phrase, MAX_POSTINGS_SCAN - 1)).fetchone()
+                       for phrase in phrases}
+            rare = [phrase for phrase, cutoff in cutoffs.items() if cutoff is None]
+            after = 0 if rare else max(cutoff[0] for cutoff in cutoffs.values()) - 1
+            match = " OR ".join(rare or phrases)
+            rows = self._conn.execute(self._SQL_SEARCH_TURNS, (match, after, limit)).fetchall()
+        return [(-row[0], _row_to_turn(row[1:])) for row in rows]
+
+    def turns_from(self, offset: int):
+        with self._lock:
+            rows = self._conn.execute(self._SQL_TURNS_FROM, (offset,)).fetchall()
+        return map(_row_to_turn, rows)
+
+    def count_turns(self) -> int:
+        with self._lock:
+            return self._conn.execute(self._SQL_COUNT_TURNS).fetchone()[0]
+
+    def turns_before(self, before, limit: int) -> tuple:
+        # Position = row id; keyset pagination - primary key पर केवल limit rows पढ़ी जाती हैं
+        with self._lock:
+            rows = self._conn.execute(self._SQL_TURNS_BEFORE,
+                                      (before if before is not None else 2 ** 63 - 1, limit)).fetchall()
+            if not rows:
+                return [], None
+            oldest = rows[-1][0]
+            more = self._conn.execute(self._SQL_HAS_TURNS_BEFORE, (oldest,)).fetchone()[0]
+        return [_row_to_turn(row[1:]) for row in reversed(rows)], (oldest if more else None)
+
+    def signature(self) -> tuple:
+        return (self._generation.value(),)
+
+    def write_lock(self):
+        return self._ipc_lock
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+        self._ipc_lock.close()
+        self._generation.close()
+
+
+def _import_existing_memory(store: MemoryStore, directory: str = MEMORY_DIR):
+    """
+    नए SQLite database में उसी directory का पुराना data (journal या memory.json) एक बार import करता है।
+    memory.json सीधे पढ़ा जाता है - journal-format वाली conversation.jsonl/facts.json फाइलें नहीं बनतीं
+    """
+    facts_path = os.path.join(directory, os.path.basename(FACTS_FILE))
+    journal = ConversationJournal(os.path.join(directory, os.path.basename(JOURNAL_FILE)))
+    if journal.exists():
+        turns, legacy_facts = journal.read_all(), {}
+    else:
+        turns, legacy_facts = read_legacy_memory(os.path.join(directory, os.path.basename(LEGACY_MEMORY_FILE)))
+    facts = FactTable.from_json(load_facts(facts_path) if os.path.exists(facts_path) else legacy_facts).items()
+    if turns or facts:
+        store.replace_facts(facts)
+        store.append_turns(turns)
+        print(f"🧠 Memory imported into SQLite: {len(turns)} turns, {len(facts)} facts")
+
+
+def _import_single_journal(store: JournalMemoryStore, directory: str = MEMORY_DIR):
+    """पुरानी single-file journal (या memory.json) को एक बार daily segments में बाँटता है"""
+    journal = ConversationJournal(os.path.join(directory, os.path.basename(JOURNAL_FILE)))
+    migrate_legacy_memory(journal, os.path.join(directory, os.path.basename(LEGACY_MEMORY_FILE)),
+                          store.facts_path)
+    turns = journal.read_all()
+    journal.close()
+    with store._locked(write=True):
+        store.journal.import_entries(normalize_turn(t).to_dict() for t in turns)
+    if turns:
+        print(f"🧠 Conversation split into daily segments: {len(turns)} turns")
+
+
+def open_store(backend: str = MEMORY_BACKEND, directory: str = MEMORY_DIR) -> MemoryStore:
+    """Configured backend को directory में खोलता है (default: SQLite, memory/)"""
+    os.makedirs(directory, exist_ok=True)
+    if backend == "jsonl":
+        store = JournalMemoryStore(os.path.join(directory, os.path.basename(SEGMENTS_DIR)),
+                                   os.path.join(directory, os.path.basename(FACTS_FILE)))
+        if not store.journal.exists():
+            _import_single_journal(store, directory)
+        return store
+    if backend != "sqlite":
+        raise ValueError(f"Unknown memory backend: {backend}")
+
+    store = SQLiteMemoryStore(os.path.join(directory, os.path.basename(SQLITE_FILE)))
+    if store.is_new:
+        _import_existing_memory(store, directory)
+    return store
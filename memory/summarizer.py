@@ -0,0 +1,169 @@
+"""
+Rolling Summary - local extractive summary of older conversation turns.
+
+पुरानी बातचीत को हर session में raw inject करने के बजाय उनसे कुछ चुने हुए वाक्य (extractive,
+बिना LLM call के) एक छोटे summary में रखे जाते हैं, जिसकी लंबाई SUMMARY_CHAR_BUDGET से
+ज़्यादा नहीं होती। Summary incremental है: checkpoint (कितने turns process हो चुके) के बाद के
+turns ही पढ़े जाते हैं, और state memory/summary.json में save होती है।
+
+वाक्य का score = उसमें कितने अलग "content" शब्द हैं (stopwords छोड़कर), user की बातों को
+थोड़ा ज़्यादा महत्व, और समय के साथ घटता weight (half-life) - ताकि summary "rolling" रहे।
+Summary में पहले से मौजूद बातों से बहुत मिलता-जुलता वाक्य दोबारा नहीं जुड़ता।
+"""
+import json
+import math
+import os
+import re
+import threading
+import time
+
+from memory.journal import MEMORY_DIR
+from memory.matching import tokenize
+from memory.records import Speaker, Turn
+
+SUMMARY_FILE = os.path.join(MEMORY_DIR, "summary.json")
+SUMMARY_CHAR_BUDGET = int(os.getenv("JARVIS_SUMMARY_CHARS", 800))
+SUMMARY_INTERVAL_S = float(os.getenv("JARVIS_SUMMARY_INTERVAL_S", 60))
+SUMMARY_HALF_LIFE_DAYS = 14
+MIN_SENTENCE_TOKENS = 3
+USER_WEIGHT = 1.5       # user की कही बातें (पसंद, योजनाएँ) ज़्यादा काम की होती हैं
+MAX_OVERLAP = 0.7       # इससे ज़्यादा शब्द मिलें तो वाक्य duplicate माना जाता है
+
+_SENTENCE_RE = re.compile(r"[^।.!?\n]+[।.!?]?")
+
+STOPWORDS = frozenset("""
+है हैं था थी थे हो का की के को में से पर और भी तो ने यह वह ये वो कि क्या एक कर
+मैं मुझे मेरा मेरी आप आपका तुम हम जी ना नहीं हाँ हां ठीक
+the a an is are was were be to of in on at for and or but it this that i you me my
+your we he she they do did does what please ok okay yes no
+""".split())
+
+
+def split_sentences(text: str) -> list:
+    return [s.strip() for s in _SENTENCE_RE.findall(text) if s.strip()]
+
+
+def content_terms(text: str) -> set:
+    return {t for t in tokenize(text) if t not in STOPWORDS and not t.isdigit()}
+
+
+class RollingSummary:
+    """Checkpoint-आधारित incremental extractive summary, char budget के अंदर"""
+
+    def __init__(self, path: str = SUMMARY_FILE, char_budget: int = SUMMARY_CHAR_BUDGET):
+        self.path = path
+        self.char_budget = char_budget
+        self.checkpoint = 0
+        self.sentences = []  # {"text", "speaker", "ts", "epoch", "score"}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.checkpoint = int(state.get("checkpoint", 0))
+        self.sentences = list(state.get("sentences", []))
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"checkpoint": self.checkpoint, "sentences": self.sentences},
+                      f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def reset(self):
+        self.checkpoint = 0
+        self.sentences = []
+
+    def _weight(self, sentence: dict, now: float) -> float:
+        age_days = max(0.0, now - sentence["epoch"]) / 86400
+        return sentence["score"] * 0.5 ** (age_days / SUMMARY_HALF_LIFE_DAYS)
+
+    def update(self, turns) -> int:
+        """Checkpoint के बाद के नए turns process करता है; Returns: कितने turns पढ़े गए"""
+        processed = 0
+        known = [content_terms(s["text"]) for s in self.sentences]
+        used = sum(len(s["text"]) + 1 for s in self.sentences)
+        for turn in turns:
+            processed += 1
+            for text in split_sentences(turn.text):
+                terms = content_terms(text)
+                if len(terms) < MIN_SENTENCE_TOKENS:
+                    continue
+                if any(len(terms & seen) / len(terms) > MAX_OVERLAP for seen in known):
+                    continue
+                score = len(terms) / math.sqrt(len(text))
+                if turn.speaker is Speaker.USER:
+                    score *= USER_WEIGHT
+                self.sentences.append({"text": text, "speaker": str(turn.speaker),
+                                       "ts": turn.ts, "epoch": turn.epoch,
+                                       "score": round(score, 4)})
+                known.append(terms)
+                used += len(text) + 1
+                if used > 2 * self.char_budget:
+                    # बड़ी backlog पर भी candidates (और overlap checks) सीमित रहें
+                    self._trim()
+                    known = [content_terms(s["text"]) for s in self.sentences]
+                    used = sum(len(s["text"]) + 1 for s in self.sentences)
+        self.checkpoint += processed
+        self._trim()
+        return processed
+
+    def _trim(self):
+        """सबसे ज़्यादा weight वाले वाक्य budget में रखता है, बाकी हटाता है"""
+        now = time.time()
+        ranked = sorted(range(len(self.sentences)),
+                        key=lambda i: self._weight(self.sentences[i], now), reverse=True)
+        keep, used = set(), 0
+        for i in ranked:
+            cost = len(self.sentences[i]["text"]) + 1
+            if used + cost <= self.char_budget:
+                keep.add(i)
+                used += cost
+        self.sentences = [s for i, s in enumerate(self.sentences) if i in keep]
+
+    def entries(self) -> list:
+        """Summary के वाक्य Turn के रूप में, समय के क्रम में"""
+        return [Turn.from_dict(s) for s in sorted(self.sentences, key=lambda s: s["epoch"])]
+
+
+class SummaryCompactor:
+    """Background thread जो हर interval पर (या trigger() पर) refresh() चलाता है"""
+
+    def __init__(self, refresh, interval: float = SUMMARY_INTERVAL_S):
+        self._refresh = refresh
+        self._interval = interval
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self.runs = 0
+        self.errors = 0
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="jarvis-memory-summary", daemon=True)
+        self._thread.start()
+
+    def trigger(self):
+        self._wake.set()
+
+    def stop(self, timeout: float = 5.0):
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self._refresh()
+                self.runs += 1
+            except Exception as e:
+                self.errors += 1
+                print(f"⚠️ Memory summary error: {e}")
+            self._wake.wait(self._interval)
+            self._wake.clear()
@@ -0,0 +1,90 @@
+"""
+Time Index - sorted epoch index over conversation turns.
+
+हर turn का timestamp एक बार integer epoch (seconds) में बदलकर रखा जाता है, ताकि
+"आज", "कल", "पिछले हफ्ते" या किसी तारीख की सीमा वाली queries हर entry की ISO string
+दोबारा parse किए बिना binary search (bisect) से हल हो सकें।
+"""
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+# Hindi/English period names -> canonical name
+PERIOD_ALIASES = {
+    "today": "today", "आज": "today",
+    "yesterday": "yesterday", "कल": "yesterday",
+    "last_week": "last_week", "last week": "last_week", "week": "last_week",
+    "पिछले हफ्ते": "last_week", "पिछला हफ्ता": "last_week", "इस हफ्ते": "last_week",
+    "last_month": "last_month", "last month": "last_month", "पिछले महीने": "last_month",
+}
+
+
+def to_epoch(ts: str) -> int:
+    """ISO timestamp string -> epoch seconds (local time); खराब string के लिए 0"""
+    try:
+        return int(datetime.fromisoformat(ts).timestamp())
+    except (TypeError, ValueError):
+        return 0
+
+
+def resolve_period(period: str = "today", start_date: str = "", end_date: str = "",
+                   now: datetime = None) -> tuple:
+    """
+    Period या YYYY-MM-DD तारीखों को [start, end) epoch range में बदलता है।
+    end_date शामिल होती है (उस दिन का अंत तक)।
+    """
+    now = now or datetime.now()
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if start_date or end_date:
+        start = int(datetime.fromisoformat(start_date).timestamp()) if start_date else 0
+        end = datetime.fromisoformat(end_date) + timedelta(days=1) if end_date else now
+        return start, int(end.timestamp())
+
+    canonical = PERIOD_ALIASES.get(period.strip().lower(), None)
+    if canonical == "today":
+        start, end = midnight, midnight + timedelta(days=1)
+    elif canonical == "yesterday":
+        start, end = midnight - timedelta(days=1), midnight
+    elif canonical == "last_week":
+        start, end = midnight - timedelta(days=7), now
+    elif canonical == "last_month":
+        start, end = midnight - timedelta(days=30), now
+    else:
+        raise ValueError(f"Unknown period: {period}")
+    return int(start.timestamp()), int(end.timestamp())
+
+
+class TimeIndex:
+    """Turns का sorted epoch index; between() दोनों सीमाएँ bisect से ढूंढता है"""
+
+    def __init__(self, turns=()):
+        self._epochs = array("q")
+        self._docs = []
+        self.add_many(turns)
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, turn):
+        epoch = turn.epoch
+        if not self._epochs or epoch >= self._epochs[-1]:
+            # आम case: turns समय के क्रम में आते हैं - O(1) append
+            self._epochs.append(epoch)
+            self._docs.append(turn)
+        else:
+            position = bisect_left(self._epochs, epoch)
+            self._epochs.insert(position, epoch)
+            self._docs.insert(position, turn)
+
+    def add_many(self, turns):
+        for turn in turns:
+            self.add(turn)
+
+    def between(self, start: int, end: int, limit: int = 0) -> list:
+        """[start, end) के बीच के turns, समय के क्रम में; limit > 0 हो तो केवल आखिरी limit"""
+        lo = bisect_left(self._epochs, start)
+        hi = bisect_left(self._epochs, end)
+        if limit > 0:
+            lo = max(lo, hi - limit)
+        return self._docs[lo:hi]
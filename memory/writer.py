@@ -0,0 +1,156 @@
+"""
+Memory Writer - background write-behind queue for conversation turns.
+
+speak(), take_command() और add_memory_entry tool हर turn को सीधे disk पर लिखने के बजाय
+एक bounded queue में डालते हैं और तुरंत लौट आते हैं। एक background thread entries को
+batches में इकट्ठा करता है और हर FLUSH_INTERVAL_MS या MAX_BATCH entries पर एक ही
+transaction में लिखता है। Queue भर जाए तो submit रुक जाता है (backpressure)।
+
+Shutdown पर flush() ज़रूर बुलाएँ ताकि pending entries खो न जाएँ (atexit भी यही करता है)।
+Memory पढ़ने वाले tools भी पहले flush करते हैं (read-your-writes); कुछ भी अनलिखा न हो तो
+flush() तुरंत लौट आता है।
+"""
+import asyncio
+import os
+import queue
+import threading
+import time
+
+FLUSH_INTERVAL_MS = int(os.getenv("JARVIS_MEMORY_FLUSH_MS", 100))
+MAX_BATCH = int(os.getenv("JARVIS_MEMORY_BATCH_SIZE", 64))
+MAX_QUEUE = int(os.getenv("JARVIS_MEMORY_QUEUE_SIZE", 1024))
+
+_STOP = object()
+
+
+class MemoryWriter:
+    """Bounded queue + background thread जो writes को batches में coalesce करता है"""
+
+    def __init__(self, write_batch, flush_interval_ms: int = FLUSH_INTERVAL_MS,
+                 max_batch: int = MAX_BATCH, max_queue: int = MAX_QUEUE):
+        self._write_batch = write_batch
+        self._interval = flush_interval_ms / 1000.0
+        self._max_batch = max_batch
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self._unwritten = 0  # submit हुई लेकिन अभी लिखी नहीं गई entries (queue + थ्रेड का batch)
+        self.batches_written = 0
+        self.entries_written = 0
+        self.errors = 0
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="jarvis-memory-writer", daemon=True)
+                self._thread.start()
+
+    # --- Producers ---
+    def submit(self, item, timeout: float = None):
+        """Entry को queue में डालता है; queue भरी हो तो जगह मिलने तक रुकता है (backpressure)"""
+        self._ensure_started()
+        self._add_unwritten(1)
+        try:
+            self._queue.put(item, timeout=timeout)
+        except BaseException:
+            self._add_unwritten(-1)
+            raise
+
+    async def submit_async(self, item):
+        """Event loop को block किए बिना entry डालता है; queue भरी हो तो thread में इंतज़ार करता है"""
+        self._ensure_started()
+        self._add_unwritten(1)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            try:
+                await asyncio.to_thread(self._queue.put, item)
+            except BaseException:
+                self._add_unwritten(-1)
+                raise
+
+    def _add_unwritten(self, n: int):
+        with self._count_lock:
+            self._unwritten += n
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def unwritten(self) -> int:
+        """Submit हुई लेकिन अभी disk पर न लिखी गई entries (thread के हाथ में batch भी)"""
+        return self._unwritten
+
+    # --- Flush / shutdown ---
+    def flush(self, timeout: float = 5.0) -> bool:
+        """अब तक डाली गई सभी entries के लिखे जाने तक रुकता है; Returns: False अगर timeout हुआ"""
+        if self._unwritten <= 0 or self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    async def flush_async(self, timeout: float = 5.0) -> bool:
+        if self._unwritten <= 0:
+            return True  # कुछ अनलिखा नहीं - thread hop भी नहीं
+        return await asyncio.to_thread(self.flush, timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Pending entries लिखकर background thread बंद करता है"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._queue.put(_STOP, timeout=timeout)
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending(),
+            "batches_written": self.batches_written,
+            "entries_written": self.entries_written,
+            "errors": self.errors,
+        }
+
+    # --- Background thread ---
+    def _write(self, batch: list):
+        if not batch:
+            return
+        try:
+            self._write_batch(list(batch))
+            self.batches_written += 1
+            self.entries_written += len(batch)
+        except Exception as e:
+            self.errors += 1
+            print(f"⚠️ Memory write error ({len(batch)} entries dropped): {e}")
+        finally:
+            self._add_unwritten(-len(batch))
+            batch.clear()
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if not batch else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write(batch)
+                continue
+
+            if item is _STOP:
+                self._write(batch)
+                return
+            if isinstance(item, threading.Event):
+                self._write(batch)
+                item.set()
+                continue
+
+            batch.append(item)
+            if len(batch) == 1:
+                deadline = time.monotonic() + self._interval
+            if len(batch) >= self._max_batch:
+                self._write(batch)
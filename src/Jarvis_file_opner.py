@@ -12,13 +12,10 @@ import os
 import subprocess
 import sys
 import logging
-from fuzzywuzzy import process
 from livekit.agents import function_tool
 import asyncio
-try:
-    import pygetwindow as gw
-except ImportError:
-    gw = None
+
+from lazy_imports import optional_import
 
 sys.stdout.reconfigure(encoding='utf-8')
 
@@ -27,6 +24,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 async def focus_window(title_keyword: str) -> bool:
+    gw = optional_import("pygetwindow")
     if not gw:
         logger.warning("⚠ pygetwindow")
         return False
@@ -63,6 +61,7 @@ async def search_file(query, index):
         logger.warning("⚠ Match करने के लिए कोई files नहीं हैं।")
         return None
 
+    from fuzzywuzzy import process
     best_match, score = process.extractOne(query, choices)
     logger.info(f"🔍 Matched '{query}' to '{best_match}' (Score: {score})")
     if score > 70:
@@ -14,11 +14,11 @@ Date: 2025
 """
 
 import os
-import requests
 import logging
 from dotenv import load_dotenv
 from livekit.agents import function_tool  # ✅ Correct decorator
 from datetime import datetime
+from memory.prefetch import prefetched, text_key
 
 # Load environment variables
 load_dotenv()
@@ -29,6 +29,11 @@ logger = logging.getLogger(__name__)
 
 @function_tool
 async def google_search(query: str) -> str:
+    # HTTP call thread में; intent router ने यही query पहले से शुरू की हो तो उसका result
+    return await prefetched("search", text_key(query), search_google, query)
+
+def search_google(query: str) -> str:
+    """Google Custom Search से top 3 results (blocking HTTP call)"""
     logger.info(f"Query प्राप्त हुई।: {query}")
 
     api_key = os.getenv("GOOGLE_SEARCH_API_KEY")
@@ -46,6 +51,8 @@ async def google_search(query: str) -> str:
         "num": 3
     }
 
+    import requests  # पहली search पर ही load होता है - agent startup पर नहीं
+
     logger.info("Google Custom Search API को request भेजी जा रही है...")
     response = requests.get(url, params=params)
 
@@ -64,6 +64,9 @@ User के input का उत्तर प्राकृतिक और ब
 Memory Tools Available:
 1. **get_recent_conversations()** - पिछली बातचीत निकालें
 2. **add_memory_entry(speaker, text)** - Important बातचीत save करें
+3. **get_conversations_by_date(period)** - किसी दिन/समय की बातचीत निकालें ("कल क्या हुआ था?" → period="yesterday")
+4. **search_conversations(query, limit)** - किसी खास विषय की पुरानी बातचीत खोजें (जैसे "दिल्ली के बारे में मैंने क्या कहा था?")
+5. **get_conversations(before_cursor, page_size)** - पुरानी history पन्ना-दर-पन्ना पढ़ें; अगले (पुराने) page के लिए जवाब में मिला cursor भेजें
 
 Example Response Pattern:
 - User: "Jarvis, याद है? मैंने पहले क्या बोला था?"
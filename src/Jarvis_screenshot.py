@@ -1,24 +1,27 @@
 import os
 from datetime import datetime
 
-try:
-    import pyautogui
-except Exception:
-    pyautogui = None
-
 from livekit.agents import function_tool
 
+from lazy_imports import optional_import
+from turn_guard import routed_result
+
 
 @function_tool
 async def screenshot_tool(save_dir: str = None) -> dict:
     """LiveKit function tool to take a screenshot and save it to a screenshots folder.
     Returns a dict: {'success': True, 'path': path} or {'success': False, 'error': msg}
     """
+    # Intent router इस turn में screenshot ले चुका हो तो वही result - दूसरा screenshot नहीं
+    routed = await routed_result("screenshot_tool", save_dir=save_dir)
+    if routed is not None:
+        return routed
     save_dir = save_dir or os.path.join(os.path.dirname(__file__), "screenshots")
     try:
         os.makedirs(save_dir, exist_ok=True)
         filename = f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
         path = os.path.join(save_dir, filename)
+        pyautogui = optional_import("pyautogui")  # पहले screenshot पर ही load होता है
         if pyautogui is None:
             return {"success": False, "error": "pyautogui not installed"}
         img = pyautogui.screenshot()
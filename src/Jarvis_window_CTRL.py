@@ -3,7 +3,8 @@ import subprocess
 import logging
 import sys
 import asyncio
-from fuzzywuzzy import process
+
+from lazy_imports import optional_import
 
 try:
     from livekit.agents import function_tool
@@ -11,22 +12,7 @@ except ImportError:
     def function_tool(func): 
         return func
 
-try:
-    import win32gui
-    import win32con
-except ImportError:
-    win32gui = None
-    win32con = None
-
-try:
-    import pygetwindow as gw
-except ImportError:
-    gw = None
-
-try:
-    import pyautogui
-except Exception:
-    pyautogui = None
+# win32gui/win32con, pygetwindow, pyautogui और fuzzywuzzy tool के पहली बार चलने पर import होते हैं
 
 # Setup encoding and logger
 sys.stdout.reconfigure(encoding='utf-8')
@@ -53,6 +39,7 @@ APP_MAPPINGS = {
 # Global focus utility
 # -------------------------
 async def focus_window(title_keyword: str) -> bool:
+    gw = optional_import("pygetwindow")
     if not gw:
         logger.warning("⚠ pygetwindow")
         return False
@@ -85,6 +72,7 @@ async def search_item(query, index, item_type):
     choices = [item["name"] for item in filtered]
     if not choices:
         return None
+    from fuzzywuzzy import process
     best_match, score = process.extractOne(query, choices)
     logger.info(f"🔍 Matched '{query}' to '{best_match}' with score {score}")
     if score > 70:
@@ -139,6 +127,7 @@ async def open(app_title: str) -> str:
     app_command = APP_MAPPINGS.get(app_title, app_title)
     try:
         # Try Start Menu search first (more reliable for UWP / Store apps and pinned items)
+        pyautogui = optional_import("pyautogui")
         if pyautogui:
             try:
                 # Run the start/search sequence in a thread to avoid blocking the event loop
@@ -174,6 +163,8 @@ async def open(app_title: str) -> str:
 
 @function_tool
 async def close(window_title: str) -> str:
+    win32gui = optional_import("win32gui")
+    win32con = optional_import("win32con")
     if not win32gui:
         return "❌ win32gui"
 
@@ -3,9 +3,10 @@ from dotenv import load_dotenv
 import subprocess, os, sys, asyncio
 import logging
 import re
+import time
 
 from livekit import agents
-from livekit.agents import AgentSession, Agent, RoomInputOptions
+from livekit.agents import AgentSession, Agent, JobProcess, RoomInputOptions
 from livekit.plugins import (
     google,
     noise_cancellation,
@@ -13,8 +14,15 @@ from livekit.plugins import (
 from Jarvis_prompts import behavior_prompts, Reply_prompts
 from Jarvis_screenshot import screenshot_tool
 from Jarvis_google_search import google_search, get_current_datetime
-from memory.jarvis_memory import load_memory, save_memory, get_recent_conversations, add_memory_entry
+from memory.jarvis_memory import load_memory, save_memory, get_recent_conversations, get_conversations, get_conversations_by_date, search_conversations, add_memory_entry, flush_memory_writes_async, start_summary_compactor, get_session_context, set_memory_shard, hold_memory_shard, warm_memory
+from memory.shards import shard_name_for, SHARD_BY
+from memory.prefetch import PrefetchCache, prefetch_enabled, current_prefetch
 from memory_interceptor import MEMORY_KEYWORDS
+from intent_router import IntentRouter, ROUTER_ENABLED, default_intents
+from turn_guard import current_turn_guard
+from lazy_imports import prewarm_lazy_modules
+from boot_timeline import BootTimeline
+from reconnect import ReconnectManager
 from jarvis_get_whether import get_weather
 from Jarvis_window_CTRL import open, close, folder_file
 from Jarvis_file_opner import Play_file
@@ -26,131 +34,245 @@ logger = logging.getLogger(__name__)
 
 # Memory interceptor flag - set to True to enable client-side memory injection
 ENABLE_MEMORY_INTERCEPTOR = True
+# Worker process में model, plugins, tools, memory और prompts job आने से पहले तैयार (0 = हर job पर)
+PREWARM_ENABLED = os.getenv("JARVIS_PREWARM", "1") != "0"
+NO_MEMORY_TEXT = "अभी तक कोई बातचीत याद नहीं है"
+
+
+def build_tools() -> list:
+    """Assistant के सभी tools की list"""
+    return [
+        google_search,
+        get_current_datetime,
+        get_weather,
+        open, #ये apps ओपन करने के लिए हैं
+        close, 
+        load_memory, save_memory,
+        get_recent_conversations, # पिछली बातचीत निकालने के लिए
+        get_conversations, # पूरी history को pages में पीछे की ओर पढ़ने के लिए
+        get_conversations_by_date, # आज/कल/पिछले हफ्ते की बातचीत निकालने के लिए
+        search_conversations, # पूरी history में किसी विषय की बातचीत खोजने के लिए
+        add_memory_entry, # मेमोरी में entry जोड़ने के लिए
+        folder_file, #ये folder ओपन करने के लिए है
+        Play_file,  #ये file रन करने के लिए है जैसे कि MP4, MP3, PDF, PPT, img, png etc.
+        screenshot_tool, # स्क्रीनशॉट लेने के लिए टूल
+        move_cursor_tool, #ये cursor move करने के लिए है
+        mouse_click_tool, #ये mouse click करने के लिए है
+        scroll_cursor_tool, #ये cursor scroll करने के लिए है
+        type_text_tool, #ये text type करने के लिए है
+        press_key_tool, #ये key press करने के लिए है
+        press_hotkey_tool, #ये hotkey press करने के लिए है
+        control_volume_tool, #ये volume control करने के लिए है
+        swipe_gesture_tool #ये gesture wipe करने के लिए है 
+    ]
+
+
+def build_reply_prompts() -> dict:
+    """पहले reply के prompt variants: बिना memory के, और memory context के आगे/पीछे जुड़ने वाले हिस्से"""
+    return {
+        "plain": Reply_prompts,
+        "context_prefix": f"{Reply_prompts}\n\n[RECENT CONTEXT]\n",
+        "context_suffix": "\n[/CONTEXT]",
+    }
+
+
+def reply_instructions(prompts: dict, memory_context: str) -> str:
+    if not memory_context or NO_MEMORY_TEXT in memory_context:
+        return prompts["plain"]
+    return prompts["context_prefix"] + memory_context + prompts["context_suffix"]
+
+
+def prepare_worker(userdata: dict) -> dict:
+    """
+    Process-wide चीज़ें (realtime model, noise cancellation, tools, router intents, prompt
+    variants, memory cache) एक बार बनाकर userdata में रखता है। हर step का समय prewarm_ms में।
+    """
+    timings = {}
+
+    def step(name, func):
+        started = time.perf_counter()
+        userdata[name] = func()
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+    step("llm", lambda: google.beta.realtime.RealtimeModel(voice="Charon"))
+    step("noise_cancellation", noise_cancellation.BVC)
+    step("tools", build_tools)
+    step("intents", default_intents)
+    step("reply_prompts", build_reply_prompts)
+    # Tool backends (pyautogui, pynput, requests ...) startup पर lazy हैं - job से पहले यहीं load,
+    # वरना पहला volume/screenshot/search call session के event loop को import में रोक देता
+    step("tool_backends", prewarm_lazy_modules)
+    if ENABLE_MEMORY_INTERCEPTOR and SHARD_BY == "none":
+        # Room/participant shards job आने पर ही पता चलते हैं - तब केवल default shard warm हो सकता है
+        step("memory", warm_memory)
+    userdata["prewarm_ms"] = timings
+    return userdata
+
+
+def prewarm(proc: JobProcess):
+    """LiveKit prewarm_fnc - हर worker process में job से पहले एक बार चलता है"""
+    if not PREWARM_ENABLED:
+        return
+    try:
+        prepare_worker(proc.userdata)
+        timings = proc.userdata["prewarm_ms"]
+        print(f"🔥 Worker prewarmed in {sum(timings.values()):.1f} ms: {timings}")
+    except Exception as e:
+        # Job फिर भी चलेगा - entrypoint बाकी चीज़ें खुद बना लेगा
+        print(f"⚠️ Worker prewarm error: {e}")
 
 
 class Assistant(Agent):
-    def __init__(self) -> None:
+    def __init__(self, tools: list = None) -> None:
         super().__init__(instructions=behavior_prompts,
-                         tools=[
-                            google_search,
-                            get_current_datetime,
-                            get_weather,
-                            open, #ये apps ओपन करने के लिए हैं
-                            close, 
-                            load_memory, save_memory,
-                            get_recent_conversations, # पिछली बातचीत निकालने के लिए
-                            add_memory_entry, # मेमोरी में entry जोड़ने के लिए
-                            folder_file, #ये folder ओपन करने के लिए है
-                            Play_file,  #ये file रन करने के लिए है जैसे कि MP4, MP3, PDF, PPT, img, png etc.
-                            screenshot_tool, # स्क्रीनशॉट लेने के लिए टूल
-                            move_cursor_tool, #ये cursor move करने के लिए है
-                            mouse_click_tool, #ये mouse click करने के लिए है
-                            scroll_cursor_tool, #ये cursor scroll करने के लिए है
-                            type_text_tool, #ये text type करने के लिए है
-                            press_key_tool, #ये key press करने के लिए है
-                            press_hotkey_tool, #ये hotkey press करने के लिए है
-                            control_volume_tool, #ये volume control करने के लिए है
-                            swipe_gesture_tool #ये gesture wipe करने के लिए है 
-                            
-                         ]
+                         tools=list(tools) if tools is not None else build_tools()
                          )
 
 
+async def build_first_reply_instructions(prompts: dict, timeline: BootTimeline) -> str:
+    """Memory context + पहले reply के instructions - session और room connection बनने के साथ-साथ तैयार होते हैं"""
+    with timeline.span("memory_context"):
+        if not ENABLE_MEMORY_INTERCEPTOR:
+            return prompts["plain"]
+        try:
+            print("🧠 Fetching memory context...")
+            # Rolling summary + few recent turns - size stays constant as history grows
+            memory_context = await get_session_context()
+            # Only inject if there's actual memory, keep it brief
+            instructions = reply_instructions(prompts, memory_context)
+            if instructions is not prompts["plain"]:
+                print("✅ Memory context injected")
+            else:
+                print("ℹ️ No previous conversations to inject")
+            return instructions
+        except Exception as e:
+            print(f"⚠️ Memory injection skipped: {e}")
+            return prompts["plain"]
+
+
+async def resolve_memory_shard(ctx: agents.JobContext, timeline: BootTimeline) -> tuple:
+    """
+    इस job की memory shard का नाम; Returns: (shard, connected)। Room dispatch वाले jobs में
+    job.participant खाली होता है - participant sharding के लिए room से जुड़कर पहले participant
+    का इंतज़ार करना पड़ता है (तब memory context connect के साथ overlap नहीं होता)।
+    """
+    participant = getattr(getattr(ctx.job, "participant", None), "identity", "") or ""
+    if SHARD_BY != "participant" or participant:
+        return shard_name_for(room=ctx.job.room.name, participant=participant), False
+    with timeline.span("connect"):
+        await ctx.connect()
+    with timeline.span("wait_participant"):
+        participant = (await ctx.wait_for_participant()).identity
+    print(f"👤 Memory shard participant: {participant}")
+    return shard_name_for(room=ctx.job.room.name, participant=participant), True
+
+
 async def entrypoint(ctx: agents.JobContext):
     """Entry point for LiveKit agent session with improved error handling"""
-    max_retries = 5  # Increased from 3
-    retry_count = 0
-    base_wait_time = 3  # Increased from 2
+    timeline = BootTimeline()
+    warm = ctx.proc.userdata
+    prewarmed = "prewarm_ms" in warm
+    if not prewarmed:
+        # Prewarm बंद था या fail हुआ - वही काम अब job के रास्ते पर (इसका समय नीचे report होता है)
+        with timeline.span("prepare"):
+            prepare_worker(warm)
+
+    # इस job (room / participant) की memory shard - इस task से बने सभी tasks/threads को यही मिलती है।
+    # किसी भी memory access (compactor, prefetch, memory context) से पहले set होती है।
+    shard, connected = await resolve_memory_shard(ctx, timeline)
+    set_memory_shard(shard)
+    # Session चलने तक shard idle eviction से बचा रहे; पहली बार खुलना (DB open) thread में
+    release_shard = await asyncio.to_thread(hold_memory_shard, shard)
+    # Job बंद होने पर background memory writer की pending entries disk पर लिख दें, फिर shard छोड़ें
+    ctx.add_shutdown_callback(flush_memory_writes_async)
+    ctx.add_shutdown_callback(release_shard)
+    # पुरानी बातचीत का rolling summary background में update होता रहता है
+    start_summary_compactor()
+    # Memory/weather/search का data model के tool call से पहले ही background में शुरू हो जाता है
+    prefetch = PrefetchCache() if prefetch_enabled() else None
+    if prefetch:
+        current_prefetch.set(prefetch)
+        ctx.add_shutdown_callback(prefetch.log_report)
+    # साफ़ tool वाली बातें (screenshot, volume, weather, समय, "याद है?") model से पहले local चलती हैं
+    router = IntentRouter(warm["intents"], prefetch=prefetch, dispatch=ROUTER_ENABLED) if (ROUTER_ENABLED or prefetch) else None
+    if router and ROUTER_ENABLED:
+        ctx.add_shutdown_callback(router.log_report)
+        # Router ने जो tool इस turn में चला दिया, model का वही tool call उसका result ले लेता है
+        current_turn_guard.set(router.guard)
+    # Error type के हिसाब से retry: jitter वाला backoff, session resume और worker-wide circuit breaker
+    reconnect = ReconnectManager()
+    ctx.add_shutdown_callback(reconnect.log_report)
+    # Memory context पढ़ना session.start / ctx.connect पर निर्भर नहीं - उनके साथ-साथ चलता है।
+    # Shard set होने के बाद बनता है, इसलिए task को यही shard मिलती है; retries इसी result को reuse करते हैं।
+    instructions_task = asyncio.create_task(build_first_reply_instructions(warm["reply_prompts"], timeline))
     
-    while retry_count < max_retries:
+    session = None  # start हो चुकी session - reply fail हो तो इसी पर resume
+    while True:
+        new_session = None
         try:
-            print(f"\n🚀 Starting agent session (attempt {retry_count + 1}/{max_retries})...")
-            
-            session = AgentSession(
-                llm=google.beta.realtime.RealtimeModel(
-                    voice="Charon"
-                )
-            )
-            
-            await session.start(
-                room=ctx.room,
-                agent=Assistant(),
-                room_input_options=RoomInputOptions(
-                    noise_cancellation=noise_cancellation.BVC(),
-                    video_enabled=True 
-                ),
-            )
-
-            await ctx.connect()
-            print("✅ Connected to room, waiting for audio input...")
-
-            # Generate reply with timeout handling
-            try:
-                # Try to inject memory context into the reply instructions
-                instructions = Reply_prompts
+            await reconnect.wait_for_breaker()
+            if session is None:
+                print(f"\n🚀 Starting agent session (attempt {reconnect.attempt}/{reconnect.max_attempts})...")
                 
-                if ENABLE_MEMORY_INTERCEPTOR:
-                    try:
-                        print("🧠 Fetching memory context...")
-                        # Fetch recent conversations to inject context
-                        memory_context = await get_recent_conversations(limit=5)  # Reduced from 10
-                        
-                        # Only inject if there's actual memory, keep it brief
-                        if "अभी तक कोई बातचीत याद नहीं है" not in memory_context:
-                            instructions = f"""{Reply_prompts}
-
-[RECENT CONTEXT]
-{memory_context}
-[/CONTEXT]"""
-                            print("✅ Memory context injected")
-                        else:
-                            instructions = Reply_prompts
-                            print("ℹ️ No previous conversations to inject")
-                    except Exception as e:
-                        print(f"⚠️ Memory injection skipped: {e}")
-                        instructions = Reply_prompts
+                new_session = AgentSession(llm=warm["llm"])
+                timeline.watch_first_audio(new_session)
+                if router:
+                    router.attach(new_session)
                 
-                print("📡 Sending instructions to LLM (this may take a moment)...")
+                with timeline.span("session_start"):
+                    await new_session.start(
+                        room=ctx.room,
+                        agent=Assistant(warm["tools"]),
+                        room_input_options=RoomInputOptions(
+                            noise_cancellation=warm["noise_cancellation"],
+                            video_enabled=True 
+                        ),
+                    )
+                session = new_session
+            else:
+                print(f"\n♻️ Resuming agent session (attempt {reconnect.attempt}/{reconnect.max_attempts})...")
+
+            if not connected:
+                with timeline.span("connect"):
+                    await ctx.connect()
+                connected = True
+                print("✅ Connected to room, waiting for audio input...")
+
+            # Memory context वाले instructions ऊपर से ही बन रहे थे - यहाँ केवल बचा हुआ इंतज़ार
+            with timeline.span("await_context"):
+                instructions = await instructions_task
+            
+            print("📡 Sending instructions to LLM (this may take a moment)...")
+            timeline.mark("reply_requested")
+            with timeline.span("generate_reply"):
                 await session.generate_reply(
                     instructions=instructions
                 )
-                print("✅ Session completed successfully")
-                break  # Success - exit retry loop
-                
-            except Exception as e:
-                error_msg = str(e).lower()
-                print(f"⚠️ Reply generation error (attempt {retry_count + 1}/{max_retries}): {e}")
-                
-                # Check if it's a timeout/connection error worth retrying
-                if any(keyword in error_msg for keyword in ["timed out", "timeout", "connection", "websocket", "closed"]):
-                    if retry_count < max_retries - 1:
-                        retry_count += 1
-                        wait_time = base_wait_time * retry_count  # Exponential backoff
-                        print(f"🔄 Connection issue detected. Retrying in {wait_time}s... ({retry_count}/{max_retries})")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        print("❌ Max retries exceeded after multiple timeouts")
-                        raise
-                else:
-                    # Not a timeout - propagate error immediately
-                    raise
+            reconnect.record_success()
+            print("✅ Session completed successfully")
+            timeline.log_report()
+            if prewarmed:
+                print(f"⚡ Prewarm saved ~{sum(warm['prewarm_ms'].values()):.1f} ms of job setup")
+            break  # Success - exit retry loop
             
         except KeyboardInterrupt:
             print("\n⛔ Agent stopped by user")
             break
         except Exception as e:
-            print(f"❌ Session error (attempt {retry_count + 1}/{max_retries}): {e}")
-            retry_count += 1
-            
-            if retry_count < max_retries:
-                wait_time = base_wait_time * retry_count  # Exponential backoff
-                print(f"⏳ Waiting {wait_time}s before retry...")
-                await asyncio.sleep(wait_time)
-            else:
-                print("❌ Max retries exceeded. Shutting down.")
-                raise
-
+            print(f"⚠️ Session error (attempt {reconnect.attempt}/{reconnect.max_attempts}): {type(e).__name__}: {e}")
+            # Fatal error या attempts खत्म हों तो यहीं से error आगे जाता है
+            wait_time, resume = reconnect.on_failure(e, session_alive=session is not None)
+            if not resume:
+                # पुरानी (या आधी start हुई) session बंद करके अगली बार नए सिरे से बनेगी
+                stale, session = session or new_session, None
+                if stale is not None:
+                    try:
+                        await stale.aclose()
+                    except Exception as close_error:
+                        print(f"⚠️ Session close error: {close_error}")
+            action = "Resuming" if resume else "Rebuilding session"
+            print(f"🔄 {action} in {wait_time:.1f}s...")
+            await asyncio.sleep(wait_time)
 
 if __name__ == "__main__":
     # Try to start the GUI alongside the agent (runs in a separate process)
@@ -164,4 +286,4 @@ if __name__ == "__main__":
     except Exception as e:
         print("Failed to start GUI subprocess:", e)
 
-    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint))
\ No newline at end of file
+    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
\ No newline at end of file
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Keyword matcher micro-benchmark — memory_interceptor.should_retrieve_memory का हर utterance
+पर लगने वाला समय, पुराने "हर keyword पर kw.lower() in text" तरीके के मुकाबले।
+
+Usage:
+    python src/bench_keywords.py
+    python src/bench_keywords.py --number 20000 --repeat 7
+"""
+import argparse
+import os
+import sys
+import timeit
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from memory_interceptor import MEMORY_KEYWORDS, should_retrieve_memory
+
+UTTERANCES = [
+    "आज दिल्ली का मौसम कैसा है",
+    "youtube पर गाना बजाओ",
+    "याद है कल हमने क्या बात की थी?",
+    "yaad hai pichli baat kya thi",
+    "मुझे वो पढ कर सुनाओ",  # nukta के बिना
+    "open chrome and search for cricket score",
+    "what did I say about the python project deadline",
+    "कृपया screenshot ले लो और downloads folder खोलो",
+]
+
+
+def legacy_should_retrieve(user_text: str) -> bool:
+    """पुराना तरीका - हर call पर हर keyword lower() + substring scan"""
+    text_lower = user_text.lower().strip()
+    return any(kw.lower() in text_lower for kw in MEMORY_KEYWORDS)
+
+
+def bench(fn, number: int, repeat: int) -> float:
+    """प्रति utterance सबसे अच्छा समय (microseconds)"""
+    run = lambda: [fn(text) for text in UTTERANCES]
+    best = min(timeit.repeat(run, number=number, repeat=repeat))
+    return best / (number * len(UTTERANCES)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory keyword matcher micro-benchmark")
+    parser.add_argument("--number", type=int, default=5000, help="हर repeat में corpus कितनी बार")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("Utterance matches (legacy -> compiled):")
+    for text in UTTERANCES:
+        print(f"  {legacy_should_retrieve(text)!s:>5} -> {should_retrieve_memory(text)!s:<5}  {text}")
+
+    legacy = bench(legacy_should_retrieve, args.number, args.repeat)
+    compiled = bench(should_retrieve_memory, args.number, args.repeat)
+    print(f"\n⏱️ legacy:   {legacy:8.3f} µs/utterance")
+    print(f"⏱️ compiled: {compiled:8.3f} µs/utterance  (x{legacy / compiled:.2f})")
+
+
+if __name__ == "__main__":
+    main()
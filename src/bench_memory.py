@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+"""
+Memory benchmark — synthetic histories (1k / 100k / 1M turns, mixed Devanagari + Latin)
+पर memory/jarvis_memory.py के मुख्य रास्तों का समय मापता है और JSON report लिखता है।
+
+हर size के लिए एक अलग temp directory में store बनता है - असली memory को छुआ नहीं जाता।
+
+Usage:
+    python src/bench_memory.py                              # 1k, 100k, 1M - sqlite
+    python src/bench_memory.py --sizes 1000,100000 --backend jsonl --output bench.json
+    python src/bench_memory.py --sizes 1000 --compare old_bench.json
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+import memory.jarvis_memory as jarvis_memory
+from memory.shards import ShardManager
+from memory_interceptor import inject_memory_context
+
+DEFAULT_SIZES = "1000,100000,1000000"
+POPULATE_BATCH = 10_000
+
+HINDI_WORDS = ("मैं आज बाज़ार गया था दिल्ली मुंबई मौसम कैसा है कल मीटिंग याद रखना दवाई समय "
+               "गाना बजाओ फाइल खोलो पढ़ाई परीक्षा दोस्त जन्मदिन खाना पानी नींद सुबह शाम").split()
+LATIN_WORDS = ("python project meeting cricket match weather report email deadline laptop "
+               "chrome youtube music playlist download folder screenshot volume battery").split()
+QUERIES = ["दिल्ली का मौसम कैसा था", "python project deadline", "याद है कल मीटिंग", "cricket match score"]
+
+
+def make_text(rng: random.Random) -> str:
+    words = [rng.choice(HINDI_WORDS if rng.random() < 0.6 else LATIN_WORDS)
+             for _ in range(rng.randint(4, 16))]
+    return " ".join(words)
+
+
+def synthetic_turns(count: int, seed: int):
+    """count turns, पिछले ~1 साल में फैले हुए, user/jarvis बारी-बारी"""
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=365)
+    step = timedelta(days=365) / max(count, 1)
+    for i in range(count):
+        ts = start + step * i
+        yield {"speaker": "user" if i % 2 == 0 else "jarvis", "text": make_text(rng),
+               "ts": ts.isoformat(), "epoch": int(ts.timestamp())}
+
+
+def summarize(samples: list) -> dict:
+    """Seconds samples -> milliseconds stats"""
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "n": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "p50_ms": round(ms[len(ms) // 2], 4),
+        "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 4),
+        "max_ms": round(ms[-1], 4),
+    }
+
+
+def timed(fn, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def use_store(backend: str = None, directory: str = None):
+    """jarvis_memory के shards को benchmark directory पर बदलता है; Returns: default shard का store"""
+    if jarvis_memory._shards is not None:
+        jarvis_memory._shards.close_all()
+    jarvis_memory._shards = ShardManager(directory, backend) if directory else None
+    return jarvis_memory.get_store() if directory else None
+
+
+def bench_size(size: int, backend: str, seed: int, repeat: int) -> dict:
+    directory = tempfile.mkdtemp(prefix="jarvis_bench_")
+    result = {"turns": size}
+    try:
+        store = use_store(backend, directory)
+
+        # --- Synthetic history ---
+        start = time.perf_counter()
+        batch = []
+        for turn in synthetic_turns(size, seed):
+            batch.append(turn)
+            if len(batch) >= POPULATE_BATCH:
+                store.append_turns(batch)
+                batch = []
+        store.append_turns(batch)
+        fact_keys = [f"{random.Random(seed + i).choice(HINDI_WORDS)} {i}" for i in range(200)]
+        for i, key in enumerate(fact_keys):
+            store.set_fact(key, f"तथ्य नंबर {i}")
+        result["populate_s"] = round(time.perf_counter() - start, 3)
+
+        # --- Append latency ---
+        rng = random.Random(seed + 1)
+        result["append_enqueue"] = summarize(timed(
+            lambda: jarvis_memory.append_conversation_sync("user", make_text(rng)), repeat * 4))
+        start = time.perf_counter()
+        jarvis_memory.flush_memory_writes(timeout=60)
+        result["append_flush_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        result["append_durable"] = summarize(timed(
+            lambda: store.append_turn({"speaker": "user", "text": make_text(rng),
+                                       "ts": datetime.now().isoformat()}), repeat))
+
+        # --- Cold load: नया store खोलकर पहला recent read ---
+        use_store()
+        start = time.perf_counter()
+        store = use_store(backend, directory)
+        store.recent_turns(10)
+        result["cold_load_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+        # --- Tools ---
+        result["get_recent_conversations"] = summarize(timed(
+            lambda: asyncio.run(jarvis_memory.get_recent_conversations(limit=10)), repeat))
+
+        jarvis_memory._engine, jarvis_memory._engine_loaded = None, True  # TTS के बिना - केवल lookup + print का समय
+        memory = {"facts": {}}
+        keys = iter(fact_keys * repeat)
+
+        def recall():
+            with contextlib.redirect_stdout(io.StringIO()):
+                jarvis_memory.recall_something(memory, f"{next(keys)} क्या है")
+        result["recall_something"] = summarize(timed(recall, repeat))
+
+        # पहली injection relevance index बनाती है - उसे अलग रिपोर्ट किया जाता है
+        queries = iter(QUERIES * (repeat + 1))
+        inject = lambda: asyncio.run(inject_memory_context(f"याद है {next(queries)}", "base prompt"))
+        result["interceptor_first_ms"] = round(timed(inject, 1)[0] * 1000, 3)
+        result["interceptor_injection"] = summarize(timed(inject, repeat))
+    finally:
+        use_store()
+        shutil.rmtree(directory, ignore_errors=True)
+    return result
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(report: dict, baseline_path: str):
+    """दो reports के p50/ms metrics की तुलना - ratio > 1 मतलब धीमा हुआ"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\n📊 Compare: {baseline['meta']['commit']} -> {report['meta']['commit']}")
+    for size, metrics in report["results"].items():
+        old_metrics = baseline["results"].get(size)
+        if not old_metrics:
+            continue
+        for name, value in metrics.items():
+            if name == "turns":
+                continue
+            new = value["p50_ms"] if isinstance(value, dict) else value
+            old = old_metrics.get(name)
+            old = old["p50_ms"] if isinstance(old, dict) else old
+            if isinstance(new, (int, float)) and isinstance(old, (int, float)) and old:
+                print(f"  {size:>8} {name:<26} {old:>12.3f} -> {new:>12.3f}  x{new / old:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Jarvis memory benchmark")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated turn counts")
+    parser.add_argument("--backend", default="sqlite", choices=["sqlite", "jsonl"])
+    parser.add_argument("--repeat", type=int, default=50, help="samples per latency metric")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="memory_bench.json")
+    parser.add_argument("--compare", help="पिछली report जिससे तुलना करनी है")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        print(f"⏱️ Benchmarking {size:,} turns ({args.backend})...")
+        report["results"][str(size)] = bench_size(size, args.backend, args.seed, args.repeat)
+        print(json.dumps(report["results"][str(size)], indent=2, ensure_ascii=False))
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"✅ Report saved: {args.output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
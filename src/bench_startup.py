@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Startup import-time report — `import agent` में हर module का cumulative समय (python -X importtime),
+और एक budget check: कुल समय budget से ज़्यादा हो, या कोई भारी tool backend (pyautogui, pynput,
+requests ...) startup पर ही import हो जाए, तो exit code 1।
+
+Usage:
+    python src/bench_startup.py
+    python src/bench_startup.py --top 25 --repeat 5
+    python src/bench_startup.py --budget-ms 1500        # CI / pre-commit regression check
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, "src")
+sys.path.insert(0, SRC_DIR)
+
+from lazy_imports import LAZY_MODULES  # ये केवल tool के पहली बार चलने (या worker prewarm) पर import हों
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+
+def measure(module: str) -> dict:
+    """नए interpreter में module import करके {name: (self_ms, cumulative_ms, depth)} लौटाता है"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, SRC_DIR, env.get("PYTHONPATH")]))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=SRC_DIR, env=env, capture_output=True, text=True, encoding="utf-8")
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} fail हुआ:\n{proc.stderr[-2000:]}")
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.setdefault(name, (int(self_us) / 1000, int(cumulative_us) / 1000, len(indent) // 2))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Agent startup import-time report")
+    parser.add_argument("--module", default="agent", help="किस module का import मापना है")
+    parser.add_argument("--top", type=int, default=15, help="कितने सबसे धीमे modules दिखाने हैं")
+    parser.add_argument("--repeat", type=int, default=3, help="सबसे तेज़ run लिया जाता है (disk cache का असर कम)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="कुल import समय की सीमा")
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(max(1, args.repeat))]
+    best = min(runs, key=lambda modules: modules.get(args.module, (0, 0, 0))[1])
+    total_ms = best.get(args.module, (0, 0, 0))[1]
+
+    print(f"import {args.module}: {total_ms:.1f} ms cumulative (best of {len(runs)})\n")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    ranked = sorted(best.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_ms, cumulative_ms, depth) in ranked[:args.top]:
+        print(f"{cumulative_ms:14.1f} {self_ms:9.1f}  {'  ' * depth}{name}")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in best]
+    if eager:
+        print(f"\n❌ Startup पर ही import हुए (lazy होने चाहिए): {', '.join(eager)}")
+        failed = True
+    if args.budget_ms is not None:
+        if total_ms > args.budget_ms:
+            print(f"\n❌ Startup budget exceeded: {total_ms:.1f} ms > {args.budget_ms:.1f} ms")
+            failed = True
+        else:
+            print(f"\n✅ Within startup budget: {total_ms:.1f} ms <= {args.budget_ms:.1f} ms")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
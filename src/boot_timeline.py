@@ -0,0 +1,56 @@
+"""
+Boot Timeline - session bootstrap के phases के timing spans.
+
+Entrypoint के हर phase (prepare, session.start, ctx.connect, memory context, generate_reply)
+का start/end job शुरू होने से relative ms में रिकॉर्ड होता है। Phases एक साथ (overlap में) चल
+सकते हैं, इसलिए report में हर span का offset भी दिखता है। "first_audio" mark - agent पहली
+बार "speaking" state में कब आया - time-to-first-audio है।
+"""
+import contextlib
+import time
+
+
+class BootTimeline:
+    """Job start से relative timing spans और marks"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans = []   # (name, start_ms, end_ms)
+        self.marks = {}   # name -> ms (पहली बार का)
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000
+
+    @contextlib.contextmanager
+    def span(self, name: str):
+        """with timeline.span("connect"): ... - await वाले code के चारों ओर भी काम करता है"""
+        start = self._now_ms()
+        try:
+            yield
+        finally:
+            self.spans.append((name, start, self._now_ms()))
+
+    def mark(self, name: str):
+        self.marks.setdefault(name, self._now_ms())
+
+    def watch_first_audio(self, session):
+        """AgentSession पहली बार "speaking" state में आए तो first_audio mark"""
+        @session.on("agent_state_changed")
+        def _on_state(ev):
+            if getattr(ev, "new_state", None) == "speaking":
+                self.mark("first_audio")
+
+    def report(self) -> dict:
+        return {
+            "spans": [{"name": name, "start_ms": round(start, 1), "duration_ms": round(end - start, 1)}
+                      for name, start, end in sorted(self.spans, key=lambda span: span[1])],
+            "marks": {name: round(at, 1) for name, at in self.marks.items()},
+        }
+
+    def log_report(self):
+        report = self.report()
+        print("⏱️ Session bootstrap timeline:")
+        for span in report["spans"]:
+            print(f"   {span['name']:<16} +{span['start_ms']:8.1f} ms  {span['duration_ms']:8.1f} ms")
+        for name, at in report["marks"].items():
+            print(f"   {name:<16} @{at:8.1f} ms")
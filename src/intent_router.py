@@ -0,0 +1,368 @@
+"""
+Intent Router - local fast path for utterances that clearly map to one tool.
+
+"screenshot lo", "volume up", "weather batao", "yaad hai?" जैसी बातों के लिए Gemini realtime
+model के tool call करने का इंतज़ार करने के बजाय, final transcript आते ही rules/patterns से
+intent पहचानकर tool सीधे चलाया जाता है। Model को केवल result देकर छोटा जवाब बनवाया जाता है।
+
+हर intent के लिए दो latencies रखी जाती हैं (transcript से result तक):
+- local: router से चलाए गए tool की
+- model: जब model ने वही tool खुद call किया (router ने match नहीं किया या बंद था)
+इनका फर्क ही "latency saved" है - log_report() shutdown पर इसे print करता है।
+
+Router जो tool चला देता है, उसी turn में model का वही tool call router का result ले लेता है
+(turn_guard.py) - screenshot/volume जैसे actions दो बार नहीं चलते। "mat"/"nahi"/"don't" वाली
+बातें कभी route नहीं होतीं।
+
+जो बातें router पूरी तरह नहीं संभालता (लंबी utterance, या search जैसा intent जिसका कोई
+deterministic जवाब नहीं), उनके लिए speculate() tool का data पहले से fetch करना शुरू कर देता है
+(memory/prefetch.py) - model जब वही tool call करे तो result तैयार मिलता है।
+"""
+import asyncio
+import os
+import re
+import statistics
+import time
+from collections import deque
+
+from memory.jarvis_memory import get_store
+from memory.prefetch import text_key
+from memory_interceptor import fold_keyword_text, should_retrieve_memory, build_memory_context
+from Jarvis_screenshot import screenshot_tool
+from Jarvis_google_search import get_current_datetime, search_google
+from jarvis_get_whether import get_weather, detect_city_by_ip, fetch_weather
+from keyboard_mouse_CTRL import control_volume_tool
+from turn_guard import TurnGuard
+
+ROUTER_ENABLED = os.getenv("JARVIS_INTENT_ROUTER", "1") != "0"
+ROUTER_MAX_WORDS = int(os.getenv("JARVIS_ROUTER_MAX_WORDS", 8))  # लंबी/जटिल बातें model ही संभाले
+ROUTER_TOOL_TIMEOUT_S = float(os.getenv("JARVIS_ROUTER_TIMEOUT_S", 10))
+LATENCY_WINDOW = 200
+
+ROUTED_REPLY_PROMPT = """User ने कहा: "{text}"
+यह काम ({intent}) पहले ही हो चुका है - {tool_name} tool दोबारा call मत करो। User ने इसके
+साथ कोई और काम भी माँगा हो तो उसके लिए ज़रूरी tool call करो।
+Result:
+{result}
+
+इसी result के आधार पर user को छोटा और natural जवाब दो।"""
+
+# Patterns fold किए गए input (NFC, casefold, nukta हटाकर) पर चलते हैं - इसलिए यहाँ nukta के
+# बिना और lowercase लिखें: "बढा" से "बढ़ाओ"/"बढाओ" दोनों match होते हैं
+_SCREENSHOT = r"screen\s*shot|स्क्रीन\s*शॉट|स्क्रीनशॉट"
+_VOLUME = r"volume|वॉल्यूम|वॉल्युम|वोल्यूम|आवाज|a+wa+z"
+_WEATHER = r"weather|मौसम|ma+u+sa+m|mo+sa+m"
+_SEARCH = r"google|गूगल|search|सर्च"
+_CITY_STOPWORDS = {"aaj", "abhi", "yaha", "yahan", "today", "the", "ghar", "bahar",
+                   "आज", "अभी", "यहाँ", "यहां", "घर", "बाहर"}
+# "screenshot mat lo", "don't take a screenshot", "weather nahi chahiye" - ऐसी बातें model संभाले
+_NEGATION_RE = re.compile(
+    r"\b(?:mat|mt|nahi|nahin|nai|don'?t|dont|do\s+not|never|not|no\s+need)\b"
+    r"|(?<![ऀ-ॿ])(?:मत|नहीं|नही)(?![ऀ-ॿ])")
+# Search query निकालते समय हटाए जाने वाले शब्द
+_SEARCH_FILLER_RE = re.compile(
+    rf"\b(?:{_SEARCH}|karo|kar|do|pe|par|for|about|please|ke\s+ba+re\s+me(?:in)?)\b"
+    r"|गूगल|सर्च|करो|कर|पर|पे|के\s+बारे\s+में")
+PREFETCH_RECENT_TURNS = 10  # get_recent_conversations का default limit
+
+
+class Intent:
+    """
+    एक intent: patterns (fold किए text पर), tool का नाम, उसे चलाने वाला coroutine (run=None हो
+    तो केवल prefetch होता है) और model के tool call से पहले data शुरू करने वाला prefetch।
+    tool_args वे arguments हैं जिनसे run tool को call करता है - turn guard इन्हीं से model के
+    दोहराए call पहचानता है
+    """
+
+    def __init__(self, name: str, tool_name: str, run, patterns, max_words: int = ROUTER_MAX_WORDS,
+                 prefetch=None, tool_args: dict = None):
+        self.name = name
+        self.tool_name = tool_name  # model इसी नाम से tool call करता है - baseline latency के लिए
+        self.tool_args = tool_args or {}
+        self.run = run              # async run(args: dict, text: str) -> result
+        self.patterns = [re.compile(p) for p in patterns]
+        self.max_words = max_words
+        self.prefetch = prefetch    # async prefetch(cache, args: dict, text: str)
+
+    def match(self, folded: str):
+        """Match हो तो named groups (जैसे city) का dict, वरना None"""
+        for pattern in self.patterns:
+            m = pattern.search(folded)
+            if m:
+                return {key: value for key, value in m.groupdict().items() if value}
+        return None
+
+    def speculative_match(self, folded: str):
+        """speculate() के लिए match - prefetch read-only है, इसलिए intent इसे match से ढीला रख सकता है"""
+        return self.match(folded)
+
+
+async def _screenshot(args: dict, text: str):
+    return await screenshot_tool()
+
+
+def _volume(action: str):
+    async def run(args: dict, text: str):
+        return await control_volume_tool(action)
+    return run
+
+
+def _city(args: dict) -> str:
+    city = args.get("city", "")
+    return "" if city in _CITY_STOPWORDS else city
+
+
+async def _weather(args: dict, text: str):
+    return await get_weather(_city(args))
+
+
+async def _datetime(args: dict, text: str):
+    return await get_current_datetime()
+
+
+async def _memory(args: dict, text: str):
+    return await build_memory_context(text)
+
+
+# --- Prefetch: वही keys जो tools (get_weather, google_search, memory tools) prefetched() में देते हैं ---
+async def _prefetch_weather(cache, args: dict, text: str):
+    city = _city(args)
+    if not city:
+        city = await cache.start("city_by_ip", "", detect_city_by_ip)
+    cache.start("weather", text_key(city), fetch_weather, city)
+
+
+async def _prefetch_memory(cache, args: dict, text: str):
+    store = get_store()
+    cache.start("recent_turns", PREFETCH_RECENT_TURNS, store.recent_turns, PREFETCH_RECENT_TURNS)
+    # Utterance से ही search - model वही query भेजे तो hit, वरना कम से कम search index गरम हो जाता है
+    cache.start("search_turns", (text_key(text), 5), store.search_turns, text, 5)
+
+
+async def _prefetch_search(cache, args: dict, text: str):
+    query = " ".join(_SEARCH_FILLER_RE.sub(" ", fold_keyword_text(text)).split())
+    if query:
+        cache.start("search", text_key(query), search_google, query)
+
+
+class _MemoryRecall(Intent):
+    """
+    केवल पिछली बातचीत के बारे में सवाल ("pichli baar kya kaha tha", "what did I say") route होते
+    हैं। "chrome ki history kholo", "pichli video chalao" जैसे commands में भी memory keywords
+    आते हैं - action verb हो तो model ही संभाले। "याद रखना" (save) वाली बातें भी नहीं।
+    """
+
+    _SAVE_RE = re.compile(r"याद\s*रख|ya+d\s*ra+kh|remember\s+(that|this|to)|note\s*kar")
+    _ACTION_RE = re.compile(
+        r"\b(?:khol\w*|chala\w*|open|play|clear|dikha\w*|delete|remove|hata\w*|mita\w*|band|start|launch|settings?)\b"
+        r"|खोल|चला|दिखा|हटा|मिटा|बंद|ओपन|प्ले|क्लियर")
+
+    def match(self, folded: str):
+        if self._SAVE_RE.search(folded) or self._ACTION_RE.search(folded):
+            return None
+        return super().match(folded)
+
+    def speculative_match(self, folded: str):
+        # Prefetch के लिए memory_interceptor के पूरे keyword matcher से - model शायद memory tool call करे
+        if should_retrieve_memory(folded) and not self._SAVE_RE.search(folded):
+            return {}
+        return None
+
+
+# पिछली बातचीत के बारे में सवाल (fold किए text पर)
+_RECALL_PATTERNS = [
+    r"\bwhat\s+(?:did|do)\s+(?:i|we|you)\s+(?:say|said|tell|told|ask|talk|discuss)",
+    r"\bwhat\s+(?:were|was)\s+we\s+(?:talking|discussing)",
+    r"\b(?:do|did)\s+you\s+remember\b|\bremember\s+(?:what|when)\b|\brecall\s+(?:what|our|the\s+last)\b",
+    r"\b(?:past|previous|last)\s+(?:conversation|talk|chat)s?\b",
+    r"\bya+d\s+(?:hai|he|hain)\b|याद\s+है",
+    r"\b(?:pi+chh?a?li|pe+he?le|pa+hle|kal)\b.*\b(?:ka+ha|bo+la|ba+a?t|ba+a?te+i?n|ba+a?tc?he*e*i*t|bata+ya|pu+chh?a)\b",
+    r"(?:पिछली|पहले|कल)\s.*(?:कहा|बोला|बात|बताया|पूछा)|पुरानी\s+बातें|मेरी\s+बातें",
+    r"\b(?:pura+ni|meri)\s+ba+a?te+i?n\b",
+]
+
+
+def default_intents() -> list:
+    """Deterministic tools - side effect वाले (screenshot/volume) सख्त, read-only वाले थोड़े ढीले"""
+    return [
+        Intent("screenshot", "screenshot_tool", _screenshot, [
+            rf"^(?!.*(folder|फोल्डर|khol|खोल))(?=.*({_SCREENSHOT}))"
+            r".*(\b(lo|le|lelo|lena|take|capture|khicho|khincho)\b|ले|लो|लेना|खींचो)",
+        ]),
+        Intent("volume_mute", "control_volume_tool", _volume("mute"), [
+            r"\b(un)?mute\b|म्यूट",
+        ], tool_args={"action": "mute"}),
+        Intent("volume_up", "control_volume_tool", _volume("up"), [
+            rf"(?=.*({_VOLUME})).*(\b(up|increase|high|tez|te+j|badha\w*|ba+dh?a+o|jyada|zyada)\b|बढा|तेज|ज्यादा)",
+        ], tool_args={"action": "up"}),
+        Intent("volume_down", "control_volume_tool", _volume("down"), [
+            rf"(?=.*({_VOLUME})).*(\b(down|decrease|low|kam|ghata\w*|dhi+mi|dhe+re)\b|कम|घटा|धीमी|धीरे)",
+        ], tool_args={"action": "down"}),
+        Intent("weather", "get_weather", _weather, [
+            # "kal"/forecast वाले सवाल model संभाले - tool केवल अभी का मौसम देता है
+            rf"^(?!.*(\bkal\b|कल|tomorrow|forecast)).*(?:{_WEATHER})\s+(?:in|of|for)\s+(?P<city>[a-z]+)",
+            # "kya mausam hai mumbai me" - शहर weather शब्द के बाद
+            rf"^(?!.*(\bkal\b|कल|tomorrow|forecast)).*(?:{_WEATHER}).*?(?<![a-zऀ-ॿ])(?P<city>[a-zऀ-ॿ]+)\s+(?:me|mein|में)(?![a-zऀ-ॿ])",
+            rf"^(?!.*(\bkal\b|कल|tomorrow|forecast))(?:.*?(?P<city>[a-zऀ-ॿ]+)\s+(?:ka|ki|के|का|की|में|me|mein)\s+)?.*?(?:{_WEATHER})",
+        ], max_words=10, prefetch=_prefetch_weather),
+        Intent("datetime", "get_current_datetime", _datetime, [
+            r"(time|टाइम|समय|sa+ma+y|wa+qt|वक्त)\s*(kya|क्या|kitna|कितना|kitne|कितने)",
+            r"what\s+time\s+is\s+it|today'?s\s+date|a+j\s+ki\s+date|आज\s+की\s+(तारीख|डेट)|a+j\s+kya\s+date",
+        ]),
+        _MemoryRecall("memory_recall", "get_recent_conversations", _memory, _RECALL_PATTERNS, max_words=16,
+                      prefetch=_prefetch_memory),
+        # Search का कोई local जवाब नहीं - केवल prefetch
+        Intent("search", "google_search", None, [
+            rf"({_SEARCH})\s*(kar|करो|कर)|(search|सर्च)\s+(for\s+)?\S|गूगल\s+(पर|पे)|google\s+(pe|par|पर)",
+        ], prefetch=_prefetch_search),
+    ]
+
+
+class IntentRouter:
+    """Transcript -> (intent, args); tools चलाकर latencies रखता है"""
+
+    def __init__(self, intents: list = None, timeout: float = ROUTER_TOOL_TIMEOUT_S,
+                 prefetch=None, dispatch: bool = True):
+        self.intents = intents if intents is not None else default_intents()
+        self.timeout = timeout
+        self.prefetch = prefetch  # PrefetchCache या None
+        self.dispatch_enabled = dispatch
+        self.guard = TurnGuard()  # entrypoint इसे current_turn_guard में set करता है
+        self._by_tool = {}
+        for intent in self.intents:
+            self._by_tool.setdefault(intent.tool_name, []).append(intent)
+        self._local_ms = {intent.name: deque(maxlen=LATENCY_WINDOW) for intent in self.intents}
+        self._model_ms = {name: deque(maxlen=LATENCY_WINDOW) for name in self._by_tool}
+        self._errors = {intent.name: 0 for intent in self.intents}
+        self._transcript_at = None
+        self._routed_turn = False
+        self._tasks = set()
+
+    def route(self, text: str):
+        """पहला match करने वाला (intent, args), या None"""
+        if not text or not isinstance(text, str):
+            return None
+        folded = fold_keyword_text(text)
+        if _NEGATION_RE.search(folded):
+            return None
+        words = len(folded.split())
+        for intent in self.intents:
+            if intent.run is None or words > intent.max_words:
+                continue
+            args = intent.match(folded)
+            if args is not None:
+                return intent, args
+        return None
+
+    def speculate(self, text: str) -> list:
+        """Match करने वाले intents (लंबाई की सीमा के बिना) का data background में शुरू करता है"""
+        if self.prefetch is None or not text or not isinstance(text, str):
+            return []
+        folded = fold_keyword_text(text)
+        if _NEGATION_RE.search(folded):
+            return []
+        started = []
+        for intent in self.intents:
+            if intent.prefetch is None:
+                continue
+            args = intent.speculative_match(folded)
+            if args is not None:
+                self._spawn(self._run_prefetch(intent, args, text))
+                started.append(intent.name)
+        return started
+
+    async def _run_prefetch(self, intent: Intent, args: dict, text: str):
+        try:
+            await intent.prefetch(self.prefetch, args, text)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Prefetch error ({intent.name}): {e}")
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def dispatch(self, intent: Intent, args: dict, text: str, started: float = None):
+        """Tool चलाता है; latency transcript (started) से result तक मापी जाती है"""
+        started = started or time.perf_counter()
+        try:
+            # Guard से - इसी turn में model वही tool call करे तो यही result पाएगा, action दोबारा नहीं
+            result = await asyncio.wait_for(
+                self.guard.run(intent.tool_name, intent.tool_args, lambda: intent.run(args, text)), self.timeout)
+        except Exception:
+            self._errors[intent.name] += 1
+            raise
+        self._local_ms[intent.name].append((time.perf_counter() - started) * 1000)
+        return result
+
+    # --- LiveKit session hooks ---
+    def attach(self, session):
+        """AgentSession के final transcripts पर router चलाता है और model के tool calls से baseline लेता है"""
+
+        @session.on("user_input_transcribed")
+        def _on_transcript(ev):
+            if not ev.is_final:
+                return
+            self._transcript_at = time.perf_counter()
+            self.guard.new_turn()
+            if self.prefetch is not None:
+                self.prefetch.new_turn()
+            routed = self.route(ev.transcript) if self.dispatch_enabled else None
+            self._routed_turn = routed is not None
+            if routed:
+                self._spawn(self._fast_path(session, *routed, ev.transcript, self._transcript_at))
+            else:
+                self.speculate(ev.transcript)
+
+        @session.on("function_tools_executed")
+        def _on_tools(ev):
+            if self._transcript_at is None or self._routed_turn:
+                return
+            elapsed_ms = (time.perf_counter() - self._transcript_at) * 1000
+            for call in ev.function_calls:
+                if call.name in self._model_ms:
+                    self._model_ms[call.name].append(elapsed_ms)
+
+    async def _fast_path(self, session, intent: Intent, args: dict, text: str, started: float):
+        try:
+            # Model ने अपना जवाब शुरू कर दिया हो तो रोकें - जवाब result के साथ दोबारा बनेगा
+            session.interrupt()
+        except Exception:
+            pass
+        try:
+            result = await self.dispatch(intent, args, text, started)
+            print(f"⚡ Intent '{intent.name}' handled locally in {self._local_ms[intent.name][-1]:.0f} ms")
+            await session.generate_reply(instructions=ROUTED_REPLY_PROMPT.format(
+                text=text, intent=intent.name, tool_name=intent.tool_name, result=result))
+        except Exception as e:
+            print(f"⚠️ Intent router error ({intent.name}): {e}")
+
+    # --- Report ---
+    def report(self) -> dict:
+        """Intent -> {dispatched, errors, local_ms, model_ms, saved_ms} (mean ms)"""
+        report = {}
+        for intent in self.intents:
+            local = self._local_ms[intent.name]
+            model = self._model_ms[intent.tool_name]
+            local_ms = round(statistics.fmean(local), 1) if local else None
+            model_ms = round(statistics.fmean(model), 1) if model else None
+            report[intent.name] = {
+                "dispatched": len(local),
+                "errors": self._errors[intent.name],
+                "local_ms": local_ms,
+                "model_ms": model_ms,
+                "saved_ms": round(model_ms - local_ms, 1) if local_ms is not None and model_ms is not None else None,
+            }
+        return report
+
+    async def log_report(self):
+        """Shutdown callback - हर intent की latency saved print करता है"""
+        if self.guard.suppressed:
+            print(f"🛡️ Router: model के {self.guard.suppressed} दोहराए tool calls skip हुए")
+        for name, stats in self.report().items():
+            if stats["dispatched"] or stats["model_ms"] is not None:
+                print(f"⚡ {name:<16} local={stats['local_ms']} ms  model={stats['model_ms']} ms  "
+                      f"saved={stats['saved_ms']} ms  (n={stats['dispatched']}, errors={stats['errors']})")
@@ -1,8 +1,8 @@
 import os
-import requests
 import logging
 from dotenv import load_dotenv
 from livekit.agents import function_tool  # ✅ Correct decorator
+from memory.prefetch import prefetched, text_key
 
 load_dotenv()
 
@@ -11,6 +11,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def detect_city_by_ip() -> str:
+    import requests  # पहली weather request पर ही load होता है - agent startup पर नहीं
     try:
         logger.info("IP के ज़रिए शहर detect करने की कोशिश की जा रही है")
         ip_info = requests.get("https://ipapi.co/json/").json()
@@ -34,9 +35,15 @@ async def get_weather(city: str = "") -> str:
         logger.error("OpenWeather API key missing है।")
         return "Environment variables में OpenWeather API key नहीं मिली।"
 
+    # City lookup और HTTP call दोनों thread में - intent router ने पहले से शुरू किए हों तो वही result
     if not city:
-        city = detect_city_by_ip()
+        city = await prefetched("city_by_ip", "", detect_city_by_ip)
 
+    return await prefetched("weather", text_key(city), fetch_weather, city)
+
+def fetch_weather(city: str) -> str:
+    """OpenWeather से city का मौजूदा मौसम (blocking HTTP call)"""
+    api_key = os.getenv("OPENWEATHER_API_KEY")
     logger.info(f"City के लिए weather fetch किया जा रहा है।: {city}")
     url = "https://api.openweathermap.org/data/2.5/weather"
     params = {
@@ -45,6 +52,7 @@ async def get_weather(city: str = "") -> str:
         "units": "metric"
     }
 
+    import requests
     try:
         response = requests.get(url, params=params)
         if response.status_code != 200:
@@ -1,12 +1,19 @@
-import pyautogui
 import asyncio
 import time
 from datetime import datetime
-from pynput.keyboard import Key, Controller as KeyboardController
-from pynput.mouse import Button, Controller as MouseController
 from typing import List
 from livekit.agents import function_tool
 
+from turn_guard import routed_result
+
+# pyautogui और pynput भारी हैं (display/input backends) - agent start होते समय नहीं,
+# किसी tool के पहली बार चलने पर ही import होते हैं
+
+
+def _pyautogui():
+    import pyautogui
+    return pyautogui
+
 # ---------------------
 # SafeController Class
 # ---------------------
@@ -14,18 +21,39 @@ class SafeController:
     def __init__(self):
         self.active = False
         self.activation_time = None
-        self.keyboard = KeyboardController()
-        self.mouse = MouseController()
+        self._keyboard = None
+        self._mouse = None
+        self._special_keys = None
         self.valid_keys = set("abcdefghijklmnopqrstuvwxyz1234567890")
-        self.special_keys = {
-            "enter": Key.enter, "space": Key.space, "tab": Key.tab,
-            "shift": Key.shift, "ctrl": Key.ctrl, "alt": Key.alt,
-            "esc": Key.esc, "backspace": Key.backspace, "delete": Key.delete,
-            "up": Key.up, "down": Key.down, "left": Key.left, "right": Key.right,
-            "caps_lock": Key.caps_lock, "cmd": Key.cmd, "win": Key.cmd,
-            "home": Key.home, "end": Key.end,
-            "page_up": Key.page_up, "page_down": Key.page_down
-        }
+
+    @property
+    def keyboard(self):
+        if self._keyboard is None:
+            from pynput.keyboard import Controller as KeyboardController
+            self._keyboard = KeyboardController()
+        return self._keyboard
+
+    @property
+    def mouse(self):
+        if self._mouse is None:
+            from pynput.mouse import Controller as MouseController
+            self._mouse = MouseController()
+        return self._mouse
+
+    @property
+    def special_keys(self):
+        if self._special_keys is None:
+            from pynput.keyboard import Key
+            self._special_keys = {
+                "enter": Key.enter, "space": Key.space, "tab": Key.tab,
+                "shift": Key.shift, "ctrl": Key.ctrl, "alt": Key.alt,
+                "esc": Key.esc, "backspace": Key.backspace, "delete": Key.delete,
+                "up": Key.up, "down": Key.down, "left": Key.left, "right": Key.right,
+                "caps_lock": Key.caps_lock, "cmd": Key.cmd, "win": Key.cmd,
+                "home": Key.home, "end": Key.end,
+                "page_up": Key.page_up, "page_down": Key.page_down
+            }
+        return self._special_keys
 
     def resolve_key(self, key):
         return self.special_keys.get(key.lower(), key)
@@ -62,6 +90,7 @@ class SafeController:
 
     async def mouse_click(self, button: str = "left"):
         if not self.is_active(): return "🛑 Controller is inactive."
+        from pynput.mouse import Button
         if button == "left": self.mouse.click(Button.left, 1)
         elif button == "right": self.mouse.click(Button.right, 1)
         elif button == "double": self.mouse.click(Button.left, 2)
@@ -75,7 +104,7 @@ class SafeController:
             if direction == "up": self.mouse.scroll(0, amount)
             elif direction == "down": self.mouse.scroll(0, -amount)
         except:
-            pyautogui.scroll(amount * 100)
+            _pyautogui().scroll(amount * 100)
         await asyncio.sleep(0.2)
         self.log(f"Mouse scrolled {direction}")
         return f"🖱️ Scrolled {direction}"
@@ -124,6 +153,7 @@ class SafeController:
 
     async def control_volume(self, action: str):
         if not self.is_active(): return "🛑 Controller is inactive."
+        pyautogui = _pyautogui()
         if action == "up": pyautogui.press("volumeup")
         elif action == "down": pyautogui.press("volumedown")
         elif action == "mute": pyautogui.press("volumemute")
@@ -133,6 +163,7 @@ class SafeController:
 
     async def swipe_gesture(self, direction: str):
         if not self.is_active(): return "🛑 Controller is inactive."
+        pyautogui = _pyautogui()
         screen_width, screen_height = pyautogui.size()
         x, y = screen_width // 2, screen_height // 2
         try:
@@ -186,6 +217,10 @@ async def press_hotkey_tool(keys: List[str]):
 
 @function_tool
 async def control_volume_tool(action: str):
+    # Intent router इस turn में volume बदल चुका हो तो दोबारा नहीं
+    routed = await routed_result("control_volume_tool", action=action)
+    if routed is not None:
+        return routed
     return await with_temporary_activation(controller.control_volume, action)
 
 @function_tool
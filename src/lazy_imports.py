@@ -0,0 +1,32 @@
+"""
+Lazy Imports - tools के भारी backends (pyautogui, pygetwindow, win32gui, fuzzywuzzy, requests ...)
+agent start होते समय नहीं, tool के पहली बार चलने पर import होते हैं।
+
+python src/bench_startup.py से देख सकते हैं कि `import agent` में किस module को कितना समय लगता है।
+"""
+import functools
+import importlib
+
+# Agent के tools के backends - worker prewarm इन्हें job से पहले load कर लेता है ताकि session के
+# अंदर पहला tool call event loop न रोके
+TOOL_BACKEND_MODULES = ("pyautogui", "pynput", "pynput.keyboard", "pynput.mouse", "fuzzywuzzy",
+                        "fuzzywuzzy.process", "requests", "win32gui", "win32con", "pygetwindow")
+
+# Agent startup पर import नहीं होने चाहिए (bench_startup.py यही जाँचता है): tool backends, और
+# CLI voice loop के speech_recognition/pyttsx3 - वे worker में कभी काम नहीं आते, prewarm भी नहीं होते।
+# numpy यहाँ नहीं है - livekit-agents उसे खुद import करता है
+LAZY_MODULES = TOOL_BACKEND_MODULES + ("speech_recognition", "pyttsx3")
+
+
+@functools.lru_cache(maxsize=None)
+def optional_import(name: str):
+    """Module पहली बार माँगने पर import करता है; न मिले (या load fail हो) तो None - नतीजा cache रहता है"""
+    try:
+        return importlib.import_module(name)
+    except Exception:  # pyautogui बिना display के ImportError के अलावा भी fail हो सकता है
+        return None
+
+
+def prewarm_lazy_modules() -> list:
+    """Worker prewarm: TOOL_BACKEND_MODULES पहले से import करता है; Returns: जो load हो पाए"""
+    return [name for name in TOOL_BACKEND_MODULES if optional_import(name) is not None]
@@ -4,7 +4,10 @@ before sending to LLM. This ensures Jarvis always has context about past convers
 when asked, bypassing unreliable LLM tool-calling behavior.
 """
 import asyncio
-from memory.jarvis_memory import get_recent_conversations
+import re
+import unicodedata
+from memory.jarvis_memory import get_store, format_turn_line
+from memory.matching import trie_regex
 
 # Memory retrieval keywords in Hindi and English
 MEMORY_KEYWORDS = [
@@ -14,17 +17,98 @@ MEMORY_KEYWORDS = [
     "पढ़ कर सुनाओ", "बताओ क्या", "मेरी बातें", "previous talk"
 ]
 
+# Transliteration table - romanized Hindi (Hinglish) में लिखे वही keywords।
+# Vowel लंबाई (yaad/yad/yaaad) और "chh/ch" जैसे फर्क compiled pattern खुद संभाल लेता है।
+ROMANIZED_KEYWORDS = {
+    "याद है": ["yaad hai", "yaad he", "yaad hain"],
+    "पहले क्या": ["pehle kya", "pahle kya", "pehele kya"],
+    "बात हुई": ["baat hui", "baat huyi", "baat hue"],
+    "पिछली": ["pichli", "pichhli", "pichali"],
+    "पुरानी बातें": ["purani baatein", "purani baaten", "purani batein"],
+    "याद रखते": ["yaad rakhte", "yaad rakhate"],
+    "पहले की": ["pehle ki", "pahle ki"],
+    "पिछली बातचीत": ["pichli baatchit", "pichli baatcheet"],
+    "कल क्या": ["kal kya"],
+    "पढ़ कर सुनाओ": ["padh kar sunao", "padhkar sunao", "parh kar sunao"],
+    "बताओ क्या": ["batao kya", "bataao kya"],
+    "मेरी बातें": ["meri baatein", "meri baaten"],
+}
+
+_REPEATED_LATIN_RE = re.compile(r"([a-z])\1+")
+
+def fold_keyword_text(text: str) -> str:
+    """
+    NFC + casefold, और देवनागरी spelling variants fold: nukta व ZWJ/ZWNJ हटते हैं,
+    चंद्रबिंदु -> अनुस्वार - ताकि "पढ़"/"पढ" और "बातेँ"/"बातें" एक जैसे match हों
+    """
+    text = unicodedata.normalize("NFC", text).casefold()
+    if text.isascii():
+        return text
+    return (text.replace("\u093c", "").replace("\u200c", "").replace("\u200d", "")
+                .replace("\u0901", "\u0902"))
+
+def _keyword_token(ch: str) -> str:
+    # Latin अक्षर कितनी भी बार दोहराया जा सकता है ("ya+d+" = yad, yaad, yaaad); space = कोई भी whitespace
+    if ch == " ":
+        return r"\s+"
+    return f"{re.escape(ch)}+" if "a" <= ch <= "z" else re.escape(ch)
+
+def _compile_keywords():
+    keywords = MEMORY_KEYWORDS + [roman for variants in ROMANIZED_KEYWORDS.values() for roman in variants]
+    folded = {_REPEATED_LATIN_RE.sub(r"\1", " ".join(fold_keyword_text(kw).split())) for kw in keywords}
+    return trie_regex(folded, token=_keyword_token)
+
+# Import पर एक बार compile होता है - हर utterance पर केवल एक regex search
+_KEYWORD_RE = _compile_keywords()
+
+# Relevance-ranked context की सीमाएँ - model को कम लेकिन बेहतर context tokens भेजने के लिए
+CONTEXT_TOP_K = 5            # TF-IDF similarity से सबसे relevant turns
+CONTEXT_RECENT_TURNS = 3     # सबसे नए turns, जो relevance से अलग हमेशा चाहिए
+CONTEXT_CHAR_BUDGET = 1500   # injected context की अधिकतम लंबाई (characters)
+
 def should_retrieve_memory(user_text: str) -> bool:
-    """Check if user input contains memory-related keywords"""
+    """Check if user input contains memory-related keywords (Devanagari, English या romanized Hindi)"""
     if not user_text or not isinstance(user_text, str):
         return False
     
-    text_lower = user_text.lower().strip()
-    return any(kw.lower() in text_lower for kw in MEMORY_KEYWORDS)
+    return _KEYWORD_RE.search(fold_keyword_text(user_text)) is not None
+
+def select_context_turns(user_text: str, top_k: int = CONTEXT_TOP_K,
+                         recent: int = CONTEXT_RECENT_TURNS,
+                         char_budget: int = CONTEXT_CHAR_BUDGET) -> list:
+    """
+    Query से सबसे मिलते-जुलते top_k turns और सबसे नए recent turns चुनता है,
+    char_budget के अंदर, समय के क्रम में। Relevant turns को budget में पहले जगह मिलती है।
+    """
+    store = get_store()
+    ranked = [turn for _, _, turn in store.rank_turns(user_text, top_k)]
+    newest_first = list(reversed(store.recent_turns(recent)))
+
+    selected, seen, used = [], set(), 0
+    for turn in ranked + newest_first:
+        key = (turn.time_us, turn.speaker, turn.text)
+        if key in seen:
+            continue
+        cost = len(format_turn_line(turn, with_date=True)) + 1
+        if used + cost > char_budget:
+            continue
+        seen.add(key)
+        selected.append(turn)
+        used += cost
+
+    selected.sort(key=lambda turn: turn.time_us)
+    return selected
+
+async def build_memory_context(user_text: str) -> str:
+    """Relevance-ranked memory context (index पहली बार बनते समय event loop block न हो, इसलिए thread में)"""
+    turns = await asyncio.to_thread(select_context_turns, user_text)
+    if not turns:
+        return "अभी तक कोई बातचीत याद नहीं है।"
+    return "प्रासंगिक पिछली बातचीत:\n" + "\n".join(format_turn_line(turn, with_date=True) for turn in turns)
 
 async def inject_memory_context(user_text: str, system_prompt: str = "") -> tuple[str, str]:
     """
-    If user asked about memory, fetch recent conversations and inject into system prompt.
+    If user asked about memory, fetch relevant + recent conversations and inject into system prompt.
     Returns: (modified_system_prompt, user_text) tuple
     
     This ensures the LLM always has context about past conversations,
@@ -34,8 +118,8 @@ async def inject_memory_context(user_text: str, system_prompt: str = "") -> tupl
         return system_prompt, user_text
     
     try:
-        # Fetch recent conversations
-        memory_context = await get_recent_conversations(limit=10)
+        # Fetch relevance-ranked conversations
+        memory_context = await build_memory_context(user_text)
         
         # Inject into system prompt
         enhanced_prompt = f"""{system_prompt}
@@ -71,7 +155,7 @@ async def process_with_memory(user_input: str, base_instructions: str = "") -> d
         }
     
     try:
-        context = await get_recent_conversations(limit=10)
+        context = await build_memory_context(user_input)
         enhanced = f"{base_instructions}\n\n[MEMORY]\n{context}\n[/MEMORY]"
         
         return {
@@ -93,6 +177,8 @@ if __name__ == "__main__":
     test_inputs = [
         "पहले हमने क्या बात की थी?",
         "याद है न?",
+        "yaad hai pichli baat?",
+        "मुझे वो पढ कर सुनाओ",
         "खोल दे एक फाइल",
         "मेरी पिछली बातें सुनाओ",
     ]
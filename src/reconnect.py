@@ -0,0 +1,222 @@
+"""
+Reconnect Manager - session errors का type के हिसाब से classification, jitter वाला capped
+exponential backoff और circuit breaker.
+
+- classify_error(): exception का type (और उसकी __cause__/__context__ chain) देखकर तय करता है
+  कि error transient है (timeout, connection, RealtimeError, 429/5xx) या fatal (बाकी सब) -
+  message के शब्दों से नहीं।
+- Session start हो चुकी हो तो पहले उसी session पर reply दोबारा माँगा जाता है (resume); लगातार
+  resume fail हों या start ही fail हुआ हो, तभी AgentSession नए सिरे से बनती है।
+- CircuitBreaker पूरे worker process का साझा है: कई jobs के लगातार failures के बाद वह cooldown
+  तक "open" रहता है और सभी jobs उतनी देर रुकते हैं - server पर retries का तूफ़ान नहीं आता।
+- retries / resumes / rebuilds / breaker opens और degraded state में बिताया समय stats() में।
+"""
+import asyncio
+import os
+import random
+import time
+from enum import Enum
+
+RETRY_MAX_ATTEMPTS = int(os.getenv("JARVIS_RETRY_MAX_ATTEMPTS", 5))
+RETRY_BASE_S = float(os.getenv("JARVIS_RETRY_BASE_S", 1))
+RETRY_MAX_S = float(os.getenv("JARVIS_RETRY_MAX_S", 30))
+MAX_RESUMES = int(os.getenv("JARVIS_MAX_RESUMES", 2))  # इतने resume fail होने पर session दोबारा बनती है
+BREAKER_THRESHOLD = int(os.getenv("JARVIS_BREAKER_THRESHOLD", 5))
+BREAKER_COOLDOWN_S = float(os.getenv("JARVIS_BREAKER_COOLDOWN_S", 60))
+
+# Optional: livekit / aiohttp / websockets के exception types - न हों तो केवल builtins से काम चलता है
+try:
+    from livekit.agents import APIConnectionError, APIStatusError, APITimeoutError
+except ImportError:
+    APIConnectionError = APIStatusError = APITimeoutError = None
+
+try:
+    # "generate_reply timed out waiting for generation_created event" (TROUBLESHOOTING.md) यही है -
+    # सादा Exception subclass, कोई cause chain नहीं; resume path इसी के लिए है
+    from livekit.agents.llm import RealtimeError
+except ImportError:
+    RealtimeError = None
+
+try:
+    from aiohttp import ClientConnectionError, ServerTimeoutError
+except ImportError:
+    ClientConnectionError = ServerTimeoutError = None
+
+try:
+    from websockets.exceptions import ConnectionClosed
+except ImportError:
+    ConnectionClosed = None
+
+_TRANSIENT_TYPES = tuple(t for t in (
+    asyncio.TimeoutError, TimeoutError, ConnectionError,
+    APIConnectionError, APITimeoutError, RealtimeError,
+    ClientConnectionError, ServerTimeoutError, ConnectionClosed,
+) if t is not None)
+
+
+class ErrorKind(str, Enum):
+    TRANSIENT = "transient"  # retry करने लायक
+    FATAL = "fatal"          # retry बेकार - error आगे जाता है
+    STOP = "stop"            # cancel / Ctrl+C - चुपचाप बंद
+
+
+def classify_error(exc: BaseException) -> ErrorKind:
+    """Exception type (और cause chain) से error की श्रेणी"""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, (asyncio.CancelledError, KeyboardInterrupt)):
+            return ErrorKind.STOP
+        if APIStatusError is not None and isinstance(exc, APIStatusError):
+            # 429 और 5xx दोबारा कोशिश से ठीक हो सकते हैं; बाकी 4xx (गलत key, bad request) नहीं
+            status = getattr(exc, "status_code", -1)
+            return ErrorKind.TRANSIENT if status == 429 or status >= 500 else ErrorKind.FATAL
+        if isinstance(exc, _TRANSIENT_TYPES):
+            return ErrorKind.TRANSIENT
+        exc = exc.__cause__ or exc.__context__
+    return ErrorKind.FATAL
+
+
+def backoff_delay(attempt: int, base: float = RETRY_BASE_S, cap: float = RETRY_MAX_S, rng=random) -> float:
+    """attempt (1 से) के लिए capped exponential backoff; jitter [आधा, पूरा] ताकि jobs एक साथ retry न करें"""
+    ceiling = min(cap, base * (2 ** (attempt - 1)))
+    return rng.uniform(ceiling / 2, ceiling)
+
+
+class CircuitBreaker:
+    """लगातार threshold failures पर cooldown तक open; उसके बाद एक trial (half-open)"""
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN_S):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.opens = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "open" if self.remaining() > 0 else "half_open"
+
+    def remaining(self) -> float:
+        """Open हो तो cooldown खत्म होने में बचे seconds, वरना 0"""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        # Half-open trial भी fail हुआ, या threshold पार - फिर से पूरा cooldown
+        if self.opened_at is not None or self.failures >= self.threshold:
+            if self.state != "open":
+                self.opens += 1
+            self.opened_at = time.monotonic()
+
+
+_breaker = None
+
+
+def get_breaker() -> CircuitBreaker:
+    """इस worker process का साझा circuit breaker"""
+    global _breaker
+    if _breaker is None:
+        _breaker = CircuitBreaker()
+    return _breaker
+
+
+class ReconnectManager:
+    """एक job के retries: क्या retry करना है, कितनी देर रुकना है, resume या rebuild"""
+
+    def __init__(self, max_attempts: int = RETRY_MAX_ATTEMPTS, base: float = RETRY_BASE_S,
+                 cap: float = RETRY_MAX_S, max_resumes: int = MAX_RESUMES,
+                 breaker: CircuitBreaker = None, rng=random):
+        self.max_attempts = max_attempts
+        self.base = base
+        self.cap = cap
+        self.max_resumes = max_resumes
+        self.breaker = breaker or get_breaker()
+        self.rng = rng
+        self.attempt = 1
+        self.retries = 0
+        self.resumes = 0
+        self.rebuilds = 0
+        self.breaker_waits = 0
+        self.errors = {kind.value: 0 for kind in ErrorKind}
+        self._resume_streak = 0
+        self._degraded_since = None
+        self.degraded_s = 0.0
+
+    async def wait_for_breaker(self):
+        """Breaker open हो तो cooldown खत्म होने तक रुकता है"""
+        remaining = self.breaker.remaining()
+        if remaining > 0:
+            self.breaker_waits += 1
+            print(f"🧯 Circuit breaker open - {remaining:.1f}s तक नए attempts रोके गए हैं")
+            await asyncio.sleep(remaining)
+
+    def record_success(self):
+        self.breaker.record_success()
+        self._resume_streak = 0
+        if self._degraded_since is not None:
+            self.degraded_s += time.monotonic() - self._degraded_since
+            self._degraded_since = None
+
+    def on_failure(self, exc: BaseException, session_alive: bool):
+        """
+        Failure दर्ज करता है। Retry करना हो तो (delay_s, resume) लौटाता है - resume=True यानी
+        वही session इस्तेमाल करें। Fatal error या attempts खत्म हों तो exc दोबारा raise होता है।
+        """
+        kind = classify_error(exc)
+        self.errors[kind.value] += 1
+        if kind is ErrorKind.STOP:
+            raise exc
+        if self._degraded_since is None:
+            self._degraded_since = time.monotonic()
+        self.breaker.record_failure()
+        if kind is ErrorKind.FATAL:
+            print(f"❌ Fatal session error ({type(exc).__name__}) - retry नहीं होगा")
+            raise exc
+        if self.attempt >= self.max_attempts:
+            print(f"❌ Max retries exceeded ({self.max_attempts} attempts)")
+            raise exc
+
+        delay = backoff_delay(self.attempt, self.base, self.cap, self.rng)
+        self.attempt += 1
+        self.retries += 1
+        resume = session_alive and self._resume_streak < self.max_resumes
+        if resume:
+            self._resume_streak += 1
+            self.resumes += 1
+        else:
+            self._resume_streak = 0
+            self.rebuilds += 1
+        return delay, resume
+
+    def stats(self) -> dict:
+        degraded = self.degraded_s
+        if self._degraded_since is not None:
+            degraded += time.monotonic() - self._degraded_since
+        return {
+            "attempts": self.attempt,
+            "retries": self.retries,
+            "resumes": self.resumes,
+            "rebuilds": self.rebuilds,
+            "errors": dict(self.errors),
+            "breaker_state": self.breaker.state,
+            "breaker_opens": self.breaker.opens,
+            "breaker_waits": self.breaker_waits,
+            "degraded_s": round(degraded, 2),
+        }
+
+    async def log_report(self):
+        """Shutdown callback - retry counters print करता है"""
+        stats = self.stats()
+        print(f"🔁 Reconnect: {stats['retries']} retries ({stats['resumes']} resumed, "
+              f"{stats['rebuilds']} rebuilt), errors {stats['errors']}, "
+              f"breaker {stats['breaker_state']} (opened {stats['breaker_opens']}x), "
+              f"degraded {stats['degraded_s']}s")
@@ -1,13 +1,13 @@
 #!/usr/bin/env python
 import asyncio
-from memory.jarvis_memory import _get_recent_entries_sync, get_recent_conversations
+from memory.jarvis_memory import get_store, get_recent_conversations
 
 # Test sync retrieval
 print('=== Testing sync retrieval ===')
-entries = _get_recent_entries_sync(10)
+entries = get_store().recent_turns(10)
 print(f'Entries found: {len(entries)}')
 for e in entries:
-    print(f'  - {e.get("speaker")}: {e.get("text")}')
+    print(f'  - {e.speaker}: {e.text}')
 
 # Test async tool
 print('\n=== Testing async tool ===')
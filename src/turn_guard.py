@@ -0,0 +1,80 @@
+"""
+Turn Guard - intent router ने इस turn में जो tool चला दिया, model उसे दोबारा न चलाए।
+
+Router transcript आते ही screenshot/volume जैसे tools खुद चला देता है, लेकिन realtime model उसी
+audio का जवाब बनाते हुए वही tool फिर call कर सकता है - screenshot दो बार, volume दो step।
+Router का हर call guard.run() से होता है; उसी turn में model का वही tool call (वही tool और
+वही arguments) routed_result() से router का result ले लेता है और action दोबारा नहीं चलता।
+अलग arguments वाला call ("volume up" के बाद "mute") सामान्य रूप से चलता है। नया final
+transcript आने पर (new_turn) सब साफ़ हो जाता है।
+
+Guard हर session का अलग है (current_turn_guard contextvar, prefetch cache की तरह)।
+"""
+import asyncio
+import contextvars
+
+current_turn_guard = contextvars.ContextVar("jarvis_turn_guard", default=None)
+# Router के अपने tool call में True - वह call guard से नहीं रुकता
+_router_call = contextvars.ContextVar("jarvis_router_call", default=False)
+
+
+def call_key(tool_name: str, args: dict) -> tuple:
+    """(tool name, normalized arguments) - None arguments हटते हैं, strings trim + casefold"""
+    normalized = {key: " ".join(value.split()).casefold() if isinstance(value, str) else value
+                  for key, value in args.items() if value is not None}
+    return tool_name, tuple(sorted(normalized.items()))
+
+
+class TurnGuard:
+    """इस turn में router द्वारा चलाए गए tool calls: call_key -> result का future"""
+
+    def __init__(self):
+        self._handled = {}
+        self.suppressed = 0
+
+    def new_turn(self):
+        self._handled = {}
+
+    async def run(self, tool_name: str, args: dict, func):
+        """
+        Router का tool call - args वही जो tool को मिलते हैं, func() coroutine लौटाता है;
+        fail हो तो model का call सामान्य चलेगा
+        """
+        key = call_key(tool_name, args)
+        future = asyncio.get_running_loop().create_future()
+        handled = self._handled
+        handled[key] = future
+        token = _router_call.set(True)
+        try:
+            result = await func()
+        except BaseException:
+            if handled.get(key) is future:
+                del handled[key]
+            future.cancel()
+            raise
+        finally:
+            _router_call.reset(token)
+        future.set_result(result)
+        return result
+
+
+async def routed_result(tool_name: str, **args):
+    """
+    Side-effect वाले tools की शुरुआत में (अपने arguments के साथ): router इस turn में यही call
+    चला चुका (या चला रहा) हो तो उसका result, वरना None - तब tool सामान्य रूप से चलता है
+    """
+    guard = current_turn_guard.get()
+    if guard is None or _router_call.get():
+        return None
+    future = guard._handled.get(call_key(tool_name, args))
+    if future is None:
+        return None
+    try:
+        result = await asyncio.shield(future)
+    except asyncio.CancelledError:
+        if future.cancelled():
+            return None  # Router का call fail हुआ - model का call चलने दें
+        raise
+    guard.suppressed += 1
+    print(f"🛡️ '{tool_name}' इस turn में router पहले ही चला चुका - model का दोहराया call skip")
+    return result